@@ -6,10 +6,18 @@ Refactored Structure:
 - api/main.py: App initialization and middleware (this file)
 - api/models.py: Pydantic request/response models
 - api/routes.py: All endpoint handlers
+- api/uploads.py: Upload processing in worker processes
+- api/middleware.py: ETag / conditional GET middleware
+- api/responses.py: orjson response class
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pathlib import Path
 import sys
 
@@ -17,18 +25,50 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from api.routes import router
+from api import uploads
+from api.middleware import ETagMiddleware
+from api.routes import router, DATABASES, warm_database_info, warm_engines
+from src.core import db_pool
+from src.utils.config import Config
 from src.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open connection pools and warm caches/query engines on startup, close pools on shutdown"""
+    # Blocking LLM and SQLite calls run in threads; size both the asyncio
+    # default executor (asyncio.to_thread) and anyio's limiter (sync
+    # dependencies, UploadFile I/O) beyond their defaults of ~cpu+4 / 40
+    asyncio.get_running_loop().set_default_executor(
+        ThreadPoolExecutor(max_workers=Config.API_THREAD_POOL_SIZE, thread_name_prefix="api-worker")
+    )
+    anyio.to_thread.current_default_thread_limiter().total_tokens = Config.API_THREAD_POOL_SIZE
+    
+    db_pool.prefill(db_config['path'] for db_config in DATABASES.values())
+    await warm_database_info()
+    await warm_engines()
+    yield
+    db_pool.close_all()
+    uploads.shutdown()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Multi-Database Query API",
     description="AI-powered natural language database queries",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Answer repeat GETs of unchanged JSON with 304 Not Modified
+# (registered first so it hashes the uncompressed body)
+app.add_middleware(ETagMiddleware)
+
+# Compress JSON payloads (query result rows compress very well)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Configure CORS for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -42,3 +82,20 @@ app.add_middleware(
 app.include_router(router)
 
 logger.info("FastAPI app initialized successfully")
+
+
+if __name__ == "__main__":
+    import uvicorn
+    
+    # The app is passed as an import string so UVICORN_WORKERS can be raised.
+    # Keep it at 1 (the default) while uploads are registered in per-process
+    # state: other workers would not know about an upload.
+    uvicorn.run(
+        "api.main:app",
+        host=Config.API_HOST,
+        port=Config.API_PORT,
+        workers=Config.UVICORN_WORKERS,
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
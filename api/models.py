@@ -3,7 +3,7 @@ Pydantic Models for API Request/Response
 All data validation schemas for FastAPI endpoints
 """
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import List, Optional, Any, Dict, Literal
 
 
@@ -11,6 +11,7 @@ from typing import List, Optional, Any, Dict, Literal
 ChartType = Literal["line", "bar", "horizontal_bar", "pie", "doughnut", "histogram", "area", "stacked_area", "stacked_bar", "grouped_bar", "combo", "scatter", "bubble", "none"]
 TrendType = Literal["growth", "decline", "flat", "outlier", "distribution", "seasonality"]
 QueryStatusType = Literal["pending", "executing", "completed", "failed"]
+UploadStatusType = Literal["processing", "completed", "failed"]
 SeriesType = Literal["line", "bar", "area"]  # For combo charts
 
 
@@ -154,6 +155,8 @@ class SchemaInfo(BaseModel):
 
 class ExampleQuery(BaseModel):
     """Example query for database"""
+    model_config = ConfigDict(frozen=True)  # Static catalogue, built once at import
+    
     id: int = 0
     title: str = ""  # Added title field
     question: str
@@ -175,6 +178,14 @@ class UploadResponse(BaseModel):
     message: str
 
 
+class UploadJobStatus(BaseModel):
+    """Response model for background uploads (/upload?background=true, /upload/{id}/status)"""
+    upload_id: str
+    status: UploadStatusType
+    result: Optional[UploadResponse] = None  # Set once completed
+    error: Optional[str] = None  # Set if failed
+
+
 class UploadedDatabase(BaseModel):
     """Information about an uploaded database"""
     id: str
@@ -0,0 +1,50 @@
+"""
+Custom Response Classes
+Fast JSON responses for handlers that build their payload by hand
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize values orjson doesn't handle natively (e.g. SQLite BLOBs)"""
+    if isinstance(obj, (bytes, bytearray, memoryview)):
+        return bytes(obj).decode('utf-8', errors='replace')
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson"""
+    return orjson.dumps(
+        content,
+        default=orjson_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response serialized with orjson
+
+    Use for routes without a response_model (plain dicts, pre-built
+    payloads). Routes with a response_model should keep the default
+    response class so FastAPI serializes them directly via Pydantic.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize an already-built response model straight to JSON
+
+    The model was validated when it was constructed, so this skips
+    FastAPI's second validation pass of the return value and encodes
+    once in pydantic-core. Keep response_model on the route for docs.
+    """
+    return Response(content=model.model_dump_json(), media_type="application/json")
@@ -3,33 +3,51 @@ API Route Handlers
 All FastAPI endpoint implementations
 """
 
-from fastapi import HTTPException, APIRouter, UploadFile, File
-from typing import List, Dict, Any
+from fastapi import HTTPException, APIRouter, BackgroundTasks, UploadFile, File, Header, Response
+from fastapi.responses import StreamingResponse
+from typing import TYPE_CHECKING, AsyncIterator, BinaryIO, List, Dict, Any, Optional, Tuple
 from pathlib import Path
+import asyncio
+import io
+import os
+import re
 import time
+from functools import lru_cache
+from operator import itemgetter
 import shutil
+import sqlite3
 import uuid
 from datetime import datetime
 
+import orjson
+
+from api import responses
+from api import uploads
+from api.middleware import body_etag, etag_matches
+from api.responses import ORJSONResponse, model_response
 from api.models import (
     AskRequest, AskResponse,
     QueryRequest, QueryResponse,
     DatabaseInfo, SchemaInfo, ExampleQuery,
-    UploadResponse, UploadedDatabase,
+    UploadResponse, UploadJobStatus, UploadedDatabase,
     ChartConfig, TrendInsight, BusinessAnalysis,
     QueryStepModel, QueryPlanModel
 )
-from src.core.query_engine import QueryEngine
-from src.core.summarizer import summarize_result
 from src.core.database import DatabaseManager
-from src.core.schema_detector import SchemaDetector
-from src.core.chart_detector import detect_charts_from_results
-from src.core.trend_detector import detect_trends_from_results
-from src.data.converters import excel_to_sql
+from src.core.chart_detector import detect_charts_batch, detect_charts_from_results
+from src.core import ai_chart_selector, db_pool
+from src.utils.cache import TTLCache
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.utils.exceptions import QueryError
 
+# QueryEngine and summarize_result (LLM SDKs), detect_trends_from_results,
+# SchemaDetector and excel_to_sql (pandas) take over a second to import,
+# so they are imported where first used to keep cold starts and
+# lightweight endpoints like /health fast.
+if TYPE_CHECKING:
+    from src.core.query_engine import QueryEngine
+
 logger = setup_logger(__name__)
 
 # Database configuration
@@ -71,6 +89,13 @@ DATABASES = {
     }
 }
 
+# Shared per-database objects, keyed by database file path.
+# Building a QueryEngine loads the schema and initializes LLM clients, so
+# instances are created once and reused across requests.
+_DB_MANAGERS: Dict[str, DatabaseManager] = {}
+_ENGINES: Dict[str, 'QueryEngine'] = {}
+_ENGINE_LOCKS: Dict[str, asyncio.Lock] = {}
+
 # Example queries for each database
 EXAMPLE_QUERIES = {
     'electronics': [
@@ -113,6 +138,206 @@ EXAMPLE_QUERIES = {
     ]
 }
 
+# EXAMPLE_QUERIES never changes at runtime, so serialize each list once
+_EXAMPLES_JSON: Dict[str, bytes] = {
+    db_id: orjson.dumps([example.model_dump() for example in examples])
+    for db_id, examples in EXAMPLE_QUERIES.items()
+}
+_EXAMPLES_ETAGS: Dict[str, str] = {db_id: body_etag(body) for db_id, body in _EXAMPLES_JSON.items()}
+
+
+def _not_modified(etag: str, if_none_match: Optional[str]) -> Optional[Response]:
+    """Return a 304 response if the client's If-None-Match already matches etag"""
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={'etag': etag})
+    return None
+
+
+def _get_db_manager(db_path: str) -> DatabaseManager:
+    """Return the shared DatabaseManager for a database file"""
+    key = str(db_path)
+    db_manager = _DB_MANAGERS.get(key)
+    if db_manager is None:
+        db_manager = _DB_MANAGERS[key] = DatabaseManager(db_path=Path(key), pool=db_pool.get_pool(key))
+    return db_manager
+
+
+# Database files are added/removed rarely, so stat() results are reused
+# for a few seconds instead of hitting the filesystem on every request
+_STAT_TTL_SECONDS = 5
+
+
+@lru_cache(maxsize=64)
+def _cached_stat(db_path: str, bucket: int) -> Optional[os.stat_result]:
+    """stat() a database file; bucket is the TTL window the result belongs to"""
+    try:
+        return os.stat(db_path)
+    except FileNotFoundError:
+        return None
+
+
+def _db_stat(db_path: str) -> Optional[os.stat_result]:
+    """Return the (briefly cached) stat result for a database file, or None if missing"""
+    return _cached_stat(str(db_path), int(time.monotonic() // _STAT_TTL_SECONDS))
+
+
+@lru_cache(maxsize=32)
+def _cached_schema(db_path: str, mtime_ns: int) -> List[Dict[str, Any]]:
+    """
+    Read the schema of a database file, memoized per file version
+    
+    mtime_ns is part of the cache key, so rebuilding the database
+    invalidates the cached schema automatically.
+    """
+    with db_pool.get_pool(db_path).connection() as conn:
+        return DatabaseManager.read_schema(conn)
+
+
+@lru_cache(maxsize=32)
+def _cached_table_count(db_path: str, mtime_ns: int) -> int:
+    """Count the tables of a database file, memoized per file version"""
+    with db_pool.get_pool(db_path).connection() as conn:
+        return DatabaseManager.count_tables(conn)
+
+
+async def _get_schema(db_path: str) -> List[Dict[str, Any]]:
+    """Return the (cached) schema for a database file"""
+    key = str(db_path)
+    stat = _db_stat(key)
+    if stat is None:
+        raise FileNotFoundError(f"Database not found: {key}")
+    return await asyncio.to_thread(_cached_schema, key, stat.st_mtime_ns)
+
+
+async def _get_engine(db_path: str) -> 'QueryEngine':
+    """
+    Return the shared QueryEngine for a database file
+    
+    The per-path lock ensures concurrent first requests build a single engine.
+    """
+    key = str(db_path)
+    engine = _ENGINES.get(key)
+    if engine is not None:
+        return engine
+    
+    lock = _ENGINE_LOCKS.setdefault(key, asyncio.Lock())
+    async with lock:
+        engine = _ENGINES.get(key)
+        if engine is None:
+            from src.core.query_engine import QueryEngine
+            engine = await asyncio.to_thread(QueryEngine, db_manager=_get_db_manager(key))
+            _ENGINES[key] = engine
+    return engine
+
+
+async def warm_database_info() -> None:
+    """Precompute the /databases entries ahead of the first request"""
+    await asyncio.gather(*(
+        _database_info(db_id, db_config)
+        for db_id, db_config in list(DATABASES.items())
+    ))
+
+
+async def warm_engines() -> None:
+    """Build the QueryEngine for every existing database ahead of the first request"""
+    for db_id, db_config in list(DATABASES.items()):
+        if _db_stat(db_config['path']) is None:
+            continue
+        try:
+            await _get_engine(db_config['path'])
+        except Exception as e:
+            # Leave it to the first request to build (and report) the engine
+            logger.warning(f"Could not pre-warm query engine for {db_id}: {e}")
+
+
+def _evict_database(db_path: str) -> None:
+    """Drop cached objects for a database file (e.g. after deleting an upload)"""
+    key = str(db_path)
+    _DB_MANAGERS.pop(key, None)
+    _ENGINES.pop(key, None)
+    _ENGINE_LOCKS.pop(key, None)
+    db_pool.close_pool(key)
+    _cached_stat.cache_clear()
+    _cached_upload_counts.cache_clear()
+
+
+def _to_rows(results: List[Dict[str, Any]], columns: List[str]) -> List[List[Any]]:
+    """
+    Transpose dict results into list rows ordered by columns
+    
+    itemgetter fetches every column of a row in a single C call instead
+    of one dict.get() per cell.
+    """
+    if not results or not columns:
+        return []
+    if len(columns) == 1:
+        column = columns[0]
+        return [[row[column]] for row in results]
+    getter = itemgetter(*columns)
+    return [list(getter(row)) for row in results]
+
+
+def _combine_rows(
+    result_blocks: List[List[Dict[str, Any]]],
+    columns: List[str],
+    limit: int
+) -> List[List[Any]]:
+    """
+    Concatenate several queries' dict results into list rows ordered by columns
+    
+    Rows within a block come from one query and share keys, so blocks that
+    have every column use the itemgetter transpose; others fall back to
+    dict.get() with None for missing columns.
+    """
+    rows: List[List[Any]] = []
+    for results in result_blocks:
+        results = results[:limit - len(rows)]
+        if not results:
+            break
+        if all(column in results[0] for column in columns):
+            rows.extend(_to_rows(results, columns))
+        else:
+            rows.extend([row.get(column) for column in columns] for row in results)
+    return rows
+
+
+# Aggregate keywords recognised in a single-value result column, scanned
+# in one regex pass; _AGG_PRIORITY keeps the original precedence so that
+# e.g. "total_count" is still reported as a count
+_AGG_KEYWORD_RE = re.compile(r'COUNT|SUM|TOTAL|AVERAGE|AVG|MAX|MIN', re.IGNORECASE)
+_AGG_PRIORITY = ('COUNT', 'SUM', 'TOTAL', 'AVG', 'AVERAGE', 'MAX', 'MIN')
+_MONEY_RE = re.compile(r'PRICE|COST|SALARY', re.IGNORECASE)
+
+
+def _format_count(value: Any, col_name: str) -> str:
+    return f"There are {value:,} records matching your query."
+
+
+def _format_total(value: Any, col_name: str) -> str:
+    if isinstance(value, (int, float)):
+        return f"The total is ${value:,.2f}." if _MONEY_RE.search(col_name) else f"The total is {value:,}."
+    return f"The total is {value}."
+
+
+def _format_average(value: Any, col_name: str) -> str:
+    if isinstance(value, (int, float)):
+        return f"The average is {value:,.2f}."
+    return f"The average is {value}."
+
+
+def _format_extreme(value: Any, col_name: str) -> str:
+    return f"The value is {value}."
+
+
+_AGG_FORMATTERS = {
+    'COUNT': _format_count,
+    'SUM': _format_total,
+    'TOTAL': _format_total,
+    'AVG': _format_average,
+    'AVERAGE': _format_average,
+    'MAX': _format_extreme,
+    'MIN': _format_extreme,
+}
 
 
 # Helper function (legacy - kept for backward compatibility)
@@ -134,20 +359,11 @@ def _generate_answer_text(
         value = rows[0][0]
         col_name = columns[0]
         
-        if 'COUNT' in col_name.upper():
-            return f"There are {value:,} records matching your query."
-        elif 'SUM' in col_name.upper() or 'TOTAL' in col_name.upper():
-            if isinstance(value, (int, float)):
-                return f"The total is ${value:,.2f}." if any(x in col_name.lower() for x in ['price', 'cost', 'salary']) else f"The total is {value:,}."
-            return f"The total is {value}."
-        elif 'AVG' in col_name.upper() or 'AVERAGE' in col_name.upper():
-            if isinstance(value, (int, float)):
-                return f"The average is {value:,.2f}."
-            return f"The average is {value}."
-        elif 'MAX' in col_name.upper() or 'MIN' in col_name.upper():
-            return f"The value is {value}."
-        else:
+        found = {keyword.upper() for keyword in _AGG_KEYWORD_RE.findall(col_name)}
+        keyword = next((k for k in _AGG_PRIORITY if k in found), None)
+        if keyword is None:
             return f"The result is: {value}"
+        return _AGG_FORMATTERS[keyword](value, col_name)
     
     if row_count <= 5:
         return f"Found {row_count} result{'s' if row_count != 1 else ''} with {len(columns)} column{'s' if len(columns) != 1 else ''}."
@@ -161,95 +377,191 @@ def _generate_answer_text(
 router = APIRouter()
 
 
-@router.get("/")
-async def root():
-    """API root endpoint"""
-    return {
+@lru_cache(maxsize=1)
+def _root_json(database_ids: tuple) -> bytes:
+    """Serialized / payload; only the database list varies (on upload/delete)"""
+    return orjson.dumps({
         "name": "Multi-Database Query API",
         "version": "1.0.0",
         "status": "online",
-        "databases": list(DATABASES.keys())
-    }
+        "databases": list(database_ids)
+    })
 
 
-@router.get("/health")
+@router.get("/")
+async def root():
+    """API root endpoint"""
+    return Response(content=_root_json(tuple(DATABASES)), media_type="application/json")
+
+
+@lru_cache(maxsize=1)
+def _iso_timestamp(second: int) -> str:
+    """ISO timestamp of a wall-clock second, memoized so frequent probes reuse it"""
+    return datetime.fromtimestamp(second).isoformat()
+
+
+@router.get("/health", response_class=ORJSONResponse)
 async def health_check():
     """Health check endpoint"""
-    from datetime import datetime
     return {
         "status": "healthy",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": _iso_timestamp(int(time.time()))
+    }
+
+
+# /databases entries change only on upload/delete; size_mb/table_count are
+# refreshed at most once a minute to pick up databases rebuilt on disk
+_DATABASE_INFO = TTLCache(maxsize=256, ttl=60)
+
+
+async def _database_info(db_id: str, db_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return the (cached) DatabaseInfo payload for one database"""
+    info = _DATABASE_INFO.get(db_id)
+    if info is None:
+        info = await _build_database_info(db_id, db_config)
+        _DATABASE_INFO.set(db_id, info)
+    return info
+
+
+async def _build_database_info(db_id: str, db_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the DatabaseInfo payload for one database"""
+    stat = _db_stat(db_config['path'])
+    exists = stat is not None
+    size_mb = None
+    table_count = None
+    
+    if exists:
+        size_mb = round(stat.st_size / (1024 * 1024), 2)
+        try:
+            # Only the count is needed here, not the full schema with row counts
+            table_count = await asyncio.to_thread(
+                _cached_table_count, str(db_config['path']), stat.st_mtime_ns
+            )
+        except Exception as e:
+            logger.error(f"Error getting schema for {db_id}: {e}")
+    
+    return {
+        'id': db_id,
+        'name': db_config['name'],
+        'path': db_config['path'],
+        'exists': exists,
+        'size_mb': size_mb,
+        'table_count': table_count
     }
 
 
 @router.get("/databases", response_model=List[DatabaseInfo])
 async def get_databases():
     """Get list of available databases"""
-    databases = []
-    
-    for db_id, db_config in DATABASES.items():
-        db_path = Path(db_config['path'])
-        exists = db_path.exists()
-        size_mb = None
-        table_count = None
-        
-        if exists:
-            size_mb = round(db_path.stat().st_size / (1024 * 1024), 2)
-            try:
-                db_manager = DatabaseManager(db_path=db_path)
-                schema = db_manager.get_schema()
-                table_count = len(schema)
-            except Exception as e:
-                logger.error(f"Error getting schema for {db_id}: {e}")
-        
-        databases.append(DatabaseInfo(
-            id=db_id,
-            name=db_config['name'],
-            path=db_config['path'],
-            exists=exists,
-            size_mb=size_mb,
-            table_count=table_count
-        ))
-    
-    return databases
+    # Schema reads run in worker threads, so databases are inspected concurrently.
+    # The entries are built here with known types, so they are serialized
+    # directly; response_model is kept for the OpenAPI docs only.
+    databases = await asyncio.gather(*(
+        _database_info(db_id, db_config)
+        for db_id, db_config in list(DATABASES.items())
+    ))
+    return ORJSONResponse(databases)
 
 
 @router.get("/databases/{database_id}/schema", response_model=SchemaInfo)
-async def get_database_schema(database_id: str):
+async def get_database_schema(database_id: str, if_none_match: Optional[str] = Header(None)):
     """Get schema information for a specific database"""
     if database_id not in DATABASES:
         raise HTTPException(status_code=404, detail="Database not found")
     
     db_config = DATABASES[database_id]
-    db_path = Path(db_config['path'])
+    stat = _db_stat(db_config['path'])
     
-    if not db_path.exists():
+    if stat is None:
         raise HTTPException(status_code=404, detail="Database file not found")
     
+    # The schema changes only with the file, so its version is the ETag and
+    # a revalidating client gets its 304 without the schema being read
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    not_modified = _not_modified(etag, if_none_match)
+    if not_modified is not None:
+        return not_modified
+    
     try:
-        db_manager = DatabaseManager(db_path=db_path)
-        schema_list = db_manager.get_schema()
+        schema_list = await _get_schema(db_config['path'])
         
-        return SchemaInfo(
+        response = model_response(SchemaInfo(
             tables=schema_list,
             table_count=len(schema_list)
-        )
+        ))
+        response.headers['etag'] = etag
+        return response
     except Exception as e:
         logger.error(f"Error getting schema: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/databases/{database_id}/examples", response_model=List[ExampleQuery])
-async def get_example_queries(database_id: str):
+async def get_example_queries(database_id: str, if_none_match: Optional[str] = Header(None)):
     """Get example queries for a specific database"""
     if database_id not in DATABASES:
         raise HTTPException(status_code=404, detail="Database not found")
     
-    return EXAMPLE_QUERIES.get(database_id, [])
+    etag = _EXAMPLES_ETAGS.get(database_id) or body_etag(b"[]")
+    not_modified = _not_modified(etag, if_none_match)
+    if not_modified is not None:
+        return not_modified
+    
+    # Returning a Response skips per-request model validation;
+    # response_model is kept for the OpenAPI docs
+    return Response(
+        content=_EXAMPLES_JSON.get(database_id, b"[]"),
+        media_type="application/json",
+        headers={'etag': etag}
+    )
+
+
+async def _describe_results(
+    request: AskRequest,
+    columns: List[str],
+    rows: List[List[Any]],
+    exec_ms: float,
+    currency_symbol: str
+):
+    """
+    Summarize results and detect charts/trends for the /ask data path
+
+    All three only read columns/rows, so they run concurrently.
+
+    Returns:
+        Tuple of (answer_text, charts, trends)
+    """
+    from src.core.summarizer import summarize_result
+    from src.core.trend_detector import detect_trends_from_results
+    
+    answer_text, chart_configs, trend_configs = await asyncio.gather(
+        asyncio.to_thread(
+            summarize_result,
+            question=request.question,
+            columns=columns,
+            rows=rows,
+            company_id=request.company_id,
+            section_ids=request.section_ids,
+            exec_ms=exec_ms,
+            currency_symbol=currency_symbol
+        ),
+        asyncio.to_thread(
+            detect_charts_from_results,
+            columns=columns,
+            rows=rows,
+            question=request.question,
+            use_ai=True,
+            currency_symbol=currency_symbol
+        ),
+        asyncio.to_thread(detect_trends_from_results, columns, rows)
+    )
+    charts = [ChartConfig(**config) for config in chart_configs] if chart_configs else None
+    trends = [TrendInsight(**config) for config in trend_configs] if trend_configs else None
+    return answer_text, charts, trends
 
 
 @router.post("/ask", response_model=AskResponse)
-async def ask_query(request: AskRequest):
+async def ask_query(request: AskRequest, stream: bool = False):
     """
     Execute a natural language query with AI-generated answer
     Modern endpoint with LLM-powered natural language summaries
@@ -263,32 +575,43 @@ async def ask_query(request: AskRequest):
     2. Generate SQL (single) or QueryPlan (multi)
     3. Execute query/plan against database
     4. Summarize results with LLM
+    
+    With ?stream=true the data path responds with NDJSON instead: a header
+    object (sql, columns, query_type, query_plan, timings, meta), one line
+    per row, then a trailer object with answer_text, charts and trends.
+    Rows go out as soon as SQL finishes; the summary follows when ready.
+    Analytical questions always return a single JSON body.
     """
     logger.info(f"Ask request: {request.question} on {request.company_id}")
     
-    if request.company_id not in DATABASES:
+    db_config = DATABASES.get(request.company_id)
+    if db_config is None:
         raise HTTPException(status_code=400, detail=f"Invalid company_id: {request.company_id}")
     
-    db_config = DATABASES[request.company_id]
     db_path = db_config['path']
+    currency_symbol = db_config.get('currency_symbol', '$')
     
-    if not Path(db_path).exists():
+    if _db_stat(db_path) is None:
         raise HTTPException(
             status_code=404,
             detail=f"Database not found: {db_path}. Run data generation first."
         )
     
     try:
-        engine = QueryEngine(db_path=db_path)
+        engine = await _get_engine(db_path)
         
+        # Classify the question up front. Both checks are in-process keyword
+        # scans, so they run inline rather than paying for a thread hop each.
         # Check if this is an analytical question (insights, recommendations, strategy)
         is_analytical = engine.analyst.is_analytical_question(request.question)
+        # Detect if multi-query is needed
+        needs_multi_query = engine.sql_generator.needs_multi_query(request.question)
         
         if is_analytical:
             # Analytical path: Use business analyst for strategic insights
             logger.info("Using analytical path (business insights)")
             
-            analysis_result = engine.analyst.analyze(request.question)
+            analysis_result = await asyncio.to_thread(engine.analyst.analyze, request.question)
             
             logger.info(f"Analysis result keys: {list(analysis_result.keys())}")
             logger.info(f"Has query_data: {'query_data' in analysis_result}")
@@ -305,8 +628,9 @@ async def ask_query(request: AskRequest):
             logger.info(f"Number of queries in query_data: {len(query_data)}")
             
             all_sqls = []
-            combined_results = []
-            all_charts = []  # Collect charts from all queries
+            result_blocks = []  # Successful non-empty result lists, one per query
+            chart_jobs = []  # (query_id, description) per chartable query
+            chart_inputs = []  # Columns/rows/question per chartable query, same order
             queries_succeeded = 0
             queries_failed = 0
             
@@ -329,28 +653,35 @@ async def ask_query(request: AskRequest):
                     queries_succeeded += 1
                     # Only include successful queries with data
                     if results and isinstance(results, list) and len(results) > 0:
-                        combined_results.extend(results)
+                        result_blocks.append(results)
                         
                         # Generate chart for this query if it has visualizable data
                         if len(results) > 1:  # Need at least 2 rows for meaningful chart
                             # Convert dict results to column/row format for chart detection
                             result_columns = list(results[0].keys())
-                            result_rows = [[row.get(col) for col in result_columns] for row in results]
-                            
-                            chart_configs = detect_charts_from_results(
-                                columns=result_columns,
-                                rows=result_rows,
-                                question=description,  # Use query description as context
-                                currency_symbol=db_config.get('currency_symbol')
-                            )
+                            result_rows = _to_rows(results, result_columns)
                             
-                            if chart_configs:
-                                for chart_config in chart_configs:
-                                    # Add query context to chart title
-                                    chart_config['title'] = f"{description}"
-                                    chart_config['id'] = f"chart_{query_id}"
-                                    all_charts.append(ChartConfig(**chart_config))
-                                    logger.info(f"Generated chart for query '{query_id}': {chart_config['type']}")
+                            chart_jobs.append((query_id, description))
+                            chart_inputs.append({
+                                'columns': result_columns,
+                                'rows': result_rows,
+                                'question': description,  # Use query description as context
+                            })
+            
+            # Detect charts for all queries with one AI selection call (results keep query order)
+            all_charts = []  # Collect charts from all queries
+            chart_results = []
+            if chart_inputs:
+                chart_results = await asyncio.to_thread(
+                    detect_charts_batch, chart_inputs, currency_symbol=currency_symbol
+                )
+            for (query_id, description), chart_configs in zip(chart_jobs, chart_results):
+                for chart_config in chart_configs or []:
+                    # Add query context to chart title
+                    chart_config['title'] = f"{description}"
+                    chart_config['id'] = f"chart_{query_id}"
+                    all_charts.append(ChartConfig(**chart_config))
+                    logger.info(f"Generated chart for query '{query_id}': {chart_config['type']}")
             
             # Combine SQLs for display
             combined_sql = "\n\n".join(all_sqls) if all_sqls else None
@@ -358,12 +689,12 @@ async def ask_query(request: AskRequest):
             # Format results for table display
             columns = []
             rows = []
-            if combined_results:
+            if result_blocks:
                 # Get columns from first result
-                columns = list(combined_results[0].keys())
-                rows = [[row.get(col) for col in columns] for row in combined_results[:100]]  # Limit to 100 rows
+                columns = list(result_blocks[0][0].keys())
+                rows = _combine_rows(result_blocks, columns, limit=100)  # Limit to 100 rows
             
-            return AskResponse(
+            return model_response(AskResponse(
                 answer_text=analysis_result['analysis_text'],
                 sql=combined_sql,
                 columns=columns if columns else None,
@@ -381,10 +712,8 @@ async def ask_query(request: AskRequest):
                     'charts_generated': len(all_charts),
                     'row_count': len(rows) if rows else 0
                 }
-            )
+            ))
         
-        # Detect if multi-query is needed
-        needs_multi_query = engine.sql_generator.needs_multi_query(request.question)
         logger.info(f"Multi-query needed: {needs_multi_query}")
         
         query_plan_model = None
@@ -394,14 +723,14 @@ async def ask_query(request: AskRequest):
             logger.info("Using multi-query execution path")
             
             # 1) Generate query plan with AI
-            gen_start = time.time()
-            query_plan = engine.sql_generator.generate_query_plan(request.question)
-            gen_ms = (time.time() - gen_start) * 1000.0
+            gen_start = time.perf_counter()
+            query_plan = await asyncio.to_thread(engine.sql_generator.generate_query_plan, request.question)
+            gen_ms = (time.perf_counter() - gen_start) * 1000.0
             
             # 2) Execute plan
-            exec_start = time.time()
-            executed_plan = engine.execute_plan(query_plan)
-            exec_ms = (time.time() - exec_start) * 1000.0
+            exec_start = time.perf_counter()
+            executed_plan = await asyncio.to_thread(engine.execute_plan, query_plan)
+            exec_ms = (time.perf_counter() - exec_start) * 1000.0
             
             # Get final results
             final_results = executed_plan.get_final_results()
@@ -446,16 +775,18 @@ async def ask_query(request: AskRequest):
             logger.info("Using single-query execution path")
             
             # 1) Generate SQL from natural language
-            gen_start = time.time()
-            sql = engine.generate_sql(request.question)
-            gen_ms = (time.time() - gen_start) * 1000.0
+            gen_start = time.perf_counter()
+            sql = await asyncio.to_thread(engine.generate_sql, request.question)
+            gen_ms = (time.perf_counter() - gen_start) * 1000.0
             
             # 2) Execute SQL
-            exec_start = time.time()
-            result = engine.execute_query(sql)
-            exec_ms = (time.time() - exec_start) * 1000.0
+            exec_start = time.perf_counter()
+            result = await asyncio.to_thread(engine.execute_query, sql)
+            exec_ms = (time.perf_counter() - exec_start) * 1000.0
             
             if not result['success']:
+                # Don't serve the failing SQL from cache on the next attempt
+                engine.forget_sql(request.question)
                 raise HTTPException(
                     status_code=500,
                     detail=result.get('error', 'Query execution failed')
@@ -468,37 +799,45 @@ async def ask_query(request: AskRequest):
             
             if results and len(results) > 0:
                 columns = list(results[0].keys())
-                rows = [[row.get(col) for col in columns] for row in results]
+                rows = _to_rows(results, columns)
         
-        # 3) Summarize results with intelligent LLM summarizer
-        db_config = DATABASES.get(request.company_id, {})
-        currency_symbol = db_config.get('currency_symbol', '$')
+        meta = {
+            'row_count': len(rows),
+            'multi_query': needs_multi_query,
+            'query_count': len(query_plan_model.queries) if query_plan_model else 1
+        }
         
-        answer_text = summarize_result(
-            question=request.question,
-            columns=columns,
-            rows=rows,
-            company_id=request.company_id,
-            section_ids=request.section_ids,
-            exec_ms=exec_ms,
-            currency_symbol=currency_symbol
-        )
+        if stream:
+            async def trailer() -> Dict[str, Any]:
+                answer_text, charts, trends = await _describe_results(
+                    request, columns, rows, exec_ms, currency_symbol
+                )
+                return {
+                    'answer_text': answer_text,
+                    'charts': [chart.model_dump() for chart in charts] if charts else None,
+                    'trends': [trend.model_dump() for trend in trends] if trends else None
+                }
+            
+            header = {
+                'sql': sql,
+                'columns': columns,
+                'query_type': "data",
+                'query_plan': query_plan_model.model_dump() if query_plan_model else None,
+                'timings': {'genMs': gen_ms, 'execMs': exec_ms},
+                'meta': meta
+            }
+            # Start summarizing now so it overlaps with sending the rows
+            return StreamingResponse(
+                _ndjson_lines(header, rows, asyncio.ensure_future(trailer())),
+                media_type="application/x-ndjson"
+            )
         
-        # 4) Detect charts from results (AI-powered)
-        chart_configs = detect_charts_from_results(
-            columns=columns,
-            rows=rows,
-            question=request.question,
-            use_ai=True,
-            currency_symbol=currency_symbol
+        # 3) Summarize results, 4) detect charts, 5) detect trends
+        answer_text, charts, trends = await _describe_results(
+            request, columns, rows, exec_ms, currency_symbol
         )
-        charts = [ChartConfig(**config) for config in chart_configs] if chart_configs else None
-        
-        # 5) Detect trends from results
-        trend_configs = detect_trends_from_results(columns, rows)
-        trends = [TrendInsight(**config) for config in trend_configs] if trend_configs else None
         
-        return AskResponse(
+        return model_response(AskResponse(
             answer_text=answer_text,
             sql=sql,
             columns=columns,
@@ -511,12 +850,8 @@ async def ask_query(request: AskRequest):
                 'genMs': gen_ms,
                 'execMs': exec_ms
             },
-            meta={
-                'row_count': len(rows),
-                'multi_query': needs_multi_query,
-                'query_count': len(query_plan_model.queries) if query_plan_model else 1
-            }
-        )
+            meta=meta
+        ))
     
     except HTTPException:
         raise
@@ -529,11 +864,34 @@ async def ask_query(request: AskRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+async def _detect_insights(question: str, columns: List[str], rows: List[List[Any]]) -> Dict[str, Any]:
+    """Detect charts (AI-powered) and trends for /query results, concurrently"""
+    from src.core.trend_detector import detect_trends_from_results
+    
+    chart_configs, trend_configs = await asyncio.gather(
+        asyncio.to_thread(
+            detect_charts_from_results,
+            columns=columns,
+            rows=rows,
+            question=question,
+            use_ai=True
+        ),
+        asyncio.to_thread(detect_trends_from_results, columns, rows)
+    )
+    return {
+        'charts': [ChartConfig(**config).model_dump() for config in chart_configs] if chart_configs else None,
+        'trends': [TrendInsight(**config).model_dump() for config in trend_configs] if trend_configs else None
+    }
+
+
 @router.post("/query", response_model=QueryResponse)
-async def execute_query(request: QueryRequest):
+async def execute_query(request: QueryRequest, stream: bool = False):
     """
     Execute natural language query (legacy endpoint)
     Returns raw results without AI summary
+    
+    With ?stream=true the rows are sent as NDJSON like /query/stream,
+    followed by a trailer object with charts and trends.
     """
     logger.info(f"Query request: {request.question} on {request.database}")
     
@@ -543,15 +901,15 @@ async def execute_query(request: QueryRequest):
     db_config = DATABASES[request.database]
     db_path = db_config['path']
     
-    if not Path(db_path).exists():
+    if _db_stat(db_path) is None:
         raise HTTPException(
             status_code=404,
             detail=f"Database not found: {db_path}. Run data generation first."
         )
     
     try:
-        engine = QueryEngine(db_path=db_path)
-        result = engine.ask(request.question)
+        engine = await _get_engine(db_path)
+        result = await asyncio.to_thread(engine.ask, request.question)
         
         if not result['success']:
             return QueryResponse(
@@ -567,31 +925,40 @@ async def execute_query(request: QueryRequest):
         # Transform dict results to lists
         results = result.get('results', [])
         columns = list(results[0].keys()) if results else []
-        rows = [[row.get(col) for col in columns] for row in results] if results else []
+        rows = _to_rows(results, columns)
         
-        # Detect charts from results (AI-powered)
-        chart_configs = detect_charts_from_results(
-            columns=columns, 
-            rows=rows,
-            question=request.question,
-            use_ai=True
-        )
-        charts = [ChartConfig(**config) for config in chart_configs] if chart_configs else None
+        if stream:
+            header = {
+                'sql': result.get('sql', ''),
+                'columns': columns,
+                'row_count': result.get('row_count', 0),
+                'execution_time': result.get('execution_time', 0)
+            }
+            # Chart/trend detection overlaps with sending the rows
+            return StreamingResponse(
+                _ndjson_lines(
+                    header, rows,
+                    asyncio.ensure_future(_detect_insights(request.question, columns, rows))
+                ),
+                media_type="application/x-ndjson"
+            )
         
-        # Detect trends from results
-        trend_configs = detect_trends_from_results(columns, rows)
-        trends = [TrendInsight(**config) for config in trend_configs] if trend_configs else None
+        insights = await _detect_insights(request.question, columns, rows)
         
-        return QueryResponse(
-            success=True,
-            sql=result.get('sql', ''),
-            columns=columns,
-            rows=rows,
-            row_count=result.get('row_count', 0),
-            execution_time=result.get('execution_time', 0),
-            charts=charts,
-            trends=trends
-        )
+        # Rows come straight from SQLite, so skip re-validating them and
+        # serialize with orjson (response_model still documents the shape)
+        return ORJSONResponse({
+            'success': True,
+            'sql': result.get('sql', ''),
+            'columns': columns,
+            'rows': rows,
+            'row_count': result.get('row_count', 0),
+            'execution_time': result.get('execution_time', 0),
+            'charts': insights['charts'],
+            'trends': insights['trends'],
+            'query_plan': None,
+            'error': None
+        })
     
     except Exception as e:
         logger.error(f"Query execution error: {e}")
@@ -606,13 +973,95 @@ async def execute_query(request: QueryRequest):
         )
 
 
-@router.get("/stats")
+# Rows per chunk written to the NDJSON stream
+_STREAM_BATCH_ROWS = 500
+
+
+async def _ndjson_lines(
+    header: Dict[str, Any],
+    rows: List[List[Any]],
+    trailer: Optional["asyncio.Future[Dict[str, Any]]"] = None
+) -> AsyncIterator[bytes]:
+    """
+    Yield a header line followed by result rows as NDJSON, in batches
+    
+    If a trailer future is given it is awaited after the last row and
+    written as a final object. A failure there can no longer change the
+    status code, so it is reported as {"error": ...} instead. The future
+    is cancelled if the client disconnects before it is sent.
+    """
+    try:
+        yield responses.dumps(header) + b"\n"
+        for start in range(0, len(rows), _STREAM_BATCH_ROWS):
+            batch = rows[start:start + _STREAM_BATCH_ROWS]
+            yield b"".join(responses.dumps(row) + b"\n" for row in batch)
+        if trailer is not None:
+            try:
+                extras = await trailer
+            except Exception as e:
+                logger.error(f"Stream trailer error: {e}")
+                extras = {'error': str(e)}
+            yield responses.dumps(extras) + b"\n"
+    finally:
+        if trailer is not None and not trailer.done():
+            trailer.cancel()
+
+
+@router.post("/query/stream")
+async def stream_query(request: QueryRequest):
+    """
+    Execute natural language query and stream rows as NDJSON
+    
+    The first line is a header object with sql, columns, row_count and
+    execution_time; each following line is one result row as a JSON array.
+    Intended for large result sets - no charts, trends or AI summary.
+    """
+    logger.info(f"Stream query request: {request.question} on {request.database}")
+    
+    if request.database not in DATABASES:
+        raise HTTPException(status_code=400, detail=f"Invalid database: {request.database}")
+    
+    db_path = DATABASES[request.database]['path']
+    
+    if _db_stat(db_path) is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Database not found: {db_path}. Run data generation first."
+        )
+    
+    try:
+        engine = await _get_engine(db_path)
+        result = await asyncio.to_thread(engine.ask, request.question)
+    except Exception as e:
+        logger.error(f"Stream query error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    if not result['success']:
+        raise HTTPException(status_code=500, detail=result.get('error', 'Unknown error'))
+    
+    results = result.get('results', [])
+    columns = list(results[0].keys()) if results else []
+    header = {
+        'sql': result.get('sql', ''),
+        'columns': columns,
+        'row_count': result.get('row_count', 0),
+        'execution_time': result.get('execution_time', 0)
+    }
+    
+    return StreamingResponse(
+        _ndjson_lines(header, _to_rows(results, columns)),
+        media_type="application/x-ndjson"
+    )
+
+
+@router.get("/stats", response_class=ORJSONResponse)
 async def get_stats():
     """Get system statistics"""
     stats = {
         "total_queries": 0,
         "total_databases": len(DATABASES),
-        "databases": {}
+        "databases": {},
+        "chart_cache": ai_chart_selector.cache_stats()
     }
     
     for db_id in DATABASES.keys():
@@ -624,13 +1073,98 @@ async def get_stats():
     return stats
 
 
-@router.post("/upload", response_model=UploadResponse)
-async def upload_files(files: List[UploadFile] = File(...)):
+# Large copy buffer for uploads (shutil's default is 64 KiB on Linux, 16 KiB elsewhere)
+_UPLOAD_COPY_BUFFER_SIZE = 4 * 1024 * 1024
+
+
+def _save_upload(src: BinaryIO, dest: Path) -> None:
+    """
+    Write an uploaded file to disk
+    
+    Uploads that were spooled to a temp file are copied in-kernel with
+    os.sendfile; in-memory uploads fall back to a large-buffer copy.
+    """
+    with dest.open('wb') as out:
+        # SpooledTemporaryFile keeps small uploads in a BytesIO (calling
+        # fileno() on it would force a pointless spill to disk)
+        if hasattr(os, 'sendfile') and not isinstance(getattr(src, '_file', src), io.BytesIO):
+            try:
+                in_fd = src.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                in_fd = None
+            
+            if in_fd is not None:
+                offset = src.tell()
+                size = os.fstat(in_fd).st_size
+                while offset < size:
+                    sent = os.sendfile(out.fileno(), in_fd, offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+        
+        shutil.copyfileobj(src, out, _UPLOAD_COPY_BUFFER_SIZE)
+
+
+# Background upload jobs by upload_id (see /upload?background=true)
+_UPLOAD_JOBS: Dict[str, 'asyncio.Task[UploadResponse]'] = {}
+
+# Uploaded entries of DATABASES by upload_id, so /uploads doesn't
+# scan (and filter out) the built-in databases
+_UPLOADED_DATABASES: Dict[str, Dict[str, Any]] = {}
+
+
+async def _process_upload(
+    upload_id: str,
+    temp_dir: Path,
+    db_path: Path,
+    file_count: int,
+    uploaded_at: datetime
+) -> UploadResponse:
+    """Run detection + conversion in the upload process pool, then register the database"""
+    logger.info(f"Analyzing schema and creating SQLite database: {db_path}")
+    processed = await asyncio.wrap_future(
+        uploads.get_executor().submit(uploads.process_upload, str(temp_dir), str(db_path))
+    )
+    
+    logger.info(
+        f"✅ Detected {processed['table_count']} tables, {processed['total_rows']} rows, "
+        f"{processed['relationships']} relationships"
+    )
+    
+    # Add to DATABASES registry (in-memory, not persistent)
+    DATABASES[upload_id] = _UPLOADED_DATABASES[upload_id] = {
+        'name': f"Upload {uploaded_at.strftime('%Y-%m-%d %H:%M')}",
+        'path': str(db_path),
+        'description': f"{processed['table_count']} tables uploaded by user",
+        'uploaded': True,
+        'upload_date': uploaded_at.isoformat(),
+        # Counts as of this file version, so listings can skip opening it
+        'table_count': processed['table_count'],
+        'total_rows': processed['total_rows'],
+        'mtime_ns': os.stat(db_path).st_mtime_ns
+    }
+    
+    logger.info(f"✅ Upload complete: {upload_id}")
+    
+    return UploadResponse(
+        upload_id=upload_id,
+        database_name=DATABASES[upload_id]['name'],
+        database_path=str(db_path),
+        message=f"Successfully uploaded {file_count} file(s) and created database",
+        **processed
+    )
+
+
+@router.post("/upload", response_model=UploadResponse, responses={202: {"model": UploadJobStatus}})
+async def upload_files(files: List[UploadFile] = File(...), background: bool = False):
     """
     Upload Excel/CSV files and automatically detect schema
     
     Args:
         files: List of Excel/CSV files to upload
+        background: Return 202 with the upload_id as soon as the files are
+                    saved; poll GET /upload/{upload_id}/status for the result
         
     Returns:
         UploadResponse with detected schema and database info
@@ -641,10 +1175,13 @@ async def upload_files(files: List[UploadFile] = File(...)):
         3. Convert Excel → SQLite database
         4. Store in user_uploads directory
         5. Return schema + database ID
+    
+    Steps 2-3 run in a separate worker process.
     """
     try:
-        # Generate unique upload ID
-        upload_id = f"upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
+        # Generate unique upload ID (one clock read also dates the registry entry)
+        uploaded_at = datetime.now()
+        upload_id = f"upload_{uploaded_at.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}"
         
         # Create directories
         upload_dir = Config.DATA_DIR / 'user_uploads' / upload_id
@@ -669,8 +1206,7 @@ async def upload_files(files: List[UploadFile] = File(...)):
             
             # Save file
             file_path = temp_dir / file.filename
-            with file_path.open('wb') as f:
-                shutil.copyfileobj(file.file, f)
+            await asyncio.to_thread(_save_upload, file.file, file_path)
             
             saved_files.append(str(file_path))
             logger.info(f"Saved uploaded file: {file.filename}")
@@ -681,49 +1217,18 @@ async def upload_files(files: List[UploadFile] = File(...)):
                 detail="No valid files uploaded"
             )
         
-        # Detect schema using SchemaDetector
-        logger.info(f"Analyzing schema for {len(saved_files)} file(s)...")
-        detector = SchemaDetector()
-        detector.analyze_directory(str(temp_dir))
-        
-        schema_dict = detector.to_dict()
-        table_count = len(detector.tables)
-        total_rows = sum(table.row_count for table in detector.tables.values())
-        relationship_count = len(detector.relationships) if hasattr(detector, 'relationships') else 0
-        
-        logger.info(f"✅ Detected {table_count} tables, {total_rows} rows, {relationship_count} relationships")
-        
-        # Convert Excel files to SQLite database
-        db_name = f"{upload_id}.db"
-        db_path = upload_dir / db_name
-        
-        logger.info(f"Creating SQLite database: {db_path}")
-        excel_to_sql(
-            excel_dir=str(temp_dir),
-            db_name=str(db_path)
-        )
-        
-        # Add to DATABASES registry (in-memory, not persistent)
-        DATABASES[upload_id] = {
-            'name': f"Upload {datetime.now().strftime('%Y-%m-%d %H:%M')}",
-            'path': str(db_path),
-            'description': f'{table_count} tables uploaded by user',
-            'uploaded': True,
-            'upload_date': datetime.now().isoformat()
-        }
+        db_path = upload_dir / f"{upload_id}.db"
         
-        logger.info(f"✅ Upload complete: {upload_id}")
+        if background:
+            _UPLOAD_JOBS[upload_id] = asyncio.create_task(
+                _process_upload(upload_id, temp_dir, db_path, len(saved_files), uploaded_at)
+            )
+            return ORJSONResponse(
+                UploadJobStatus(upload_id=upload_id, status="processing").model_dump(),
+                status_code=202
+            )
         
-        return UploadResponse(
-            upload_id=upload_id,
-            database_name=DATABASES[upload_id]['name'],
-            database_path=str(db_path),
-            detected_schema=schema_dict,
-            table_count=table_count,
-            total_rows=total_rows,
-            relationships=relationship_count,
-            message=f"Successfully uploaded {len(saved_files)} file(s) and created database"
-        )
+        return await _process_upload(upload_id, temp_dir, db_path, len(saved_files), uploaded_at)
         
     except HTTPException:
         raise
@@ -735,61 +1240,115 @@ async def upload_files(files: List[UploadFile] = File(...)):
         )
 
 
+@router.get("/upload/{upload_id}/status", response_model=UploadJobStatus)
+async def get_upload_status(upload_id: str):
+    """Get the status of a background upload (see POST /upload?background=true)"""
+    job = _UPLOAD_JOBS.get(upload_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Upload job not found")
+    
+    if not job.done():
+        return UploadJobStatus(upload_id=upload_id, status="processing")
+    
+    error = job.exception()
+    if error is not None:
+        return UploadJobStatus(upload_id=upload_id, status="failed", error=str(error))
+    
+    return UploadJobStatus(upload_id=upload_id, status="completed", result=job.result())
+
+
+@lru_cache(maxsize=64)
+def _cached_upload_counts(db_path: str, mtime_ns: int, size: int, exact: bool) -> Tuple[int, int]:
+    """
+    Count tables and total rows of a database file, memoized per file version
+    
+    Any write changes mtime_ns (and usually size), so repeat listings
+    skip the counting until the file actually changes. Unless exact is
+    set, row counts come from ANALYZE statistics rather than COUNT(*).
+    """
+    with db_pool.get_pool(db_path).connection() as conn:
+        tables = DatabaseManager.table_names(conn)
+        count = DatabaseManager.count_rows if exact else DatabaseManager.estimate_rows
+        return len(tables), sum(count(conn, tables).values())
+
+
+def _uploaded_database(db_id: str, db_info: Dict[str, Any], exact: bool = False) -> Dict[str, Any]:
+    """Build the UploadedDatabase payload for one upload (blocking file/DB reads)"""
+    stat = _db_stat(db_info['path'])
+    size_mb = stat.st_size / (1024 * 1024) if stat else 0
+    table_count = db_info.get('table_count', 0)
+    total_rows = db_info.get('total_rows', 0)
+    
+    # Counts recorded at upload time stay valid until the file changes
+    if stat is not None and (exact or stat.st_mtime_ns != db_info.get('mtime_ns')):
+        try:
+            table_count, total_rows = _cached_upload_counts(
+                str(db_info['path']), stat.st_mtime_ns, stat.st_size, exact
+            )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Could not count rows for {db_id}, using upload-time counts: {e}")
+    
+    return {
+        'id': db_id,
+        'name': db_info['name'],
+        'upload_date': db_info.get('upload_date', ''),
+        'table_count': table_count,
+        'total_rows': total_rows,
+        'size_mb': round(size_mb, 2)
+    }
+
+
 @router.get("/uploads", response_model=List[UploadedDatabase])
-async def list_uploads():
-    """List all uploaded databases"""
-    uploads = []
-    
-    for db_id, db_info in DATABASES.items():
-        if db_info.get('uploaded'):
-            db_path = Path(db_info['path'])
-            size_mb = db_path.stat().st_size / (1024 * 1024) if db_path.exists() else 0
-            
-            # Get table count from database
-            try:
-                db_manager = DatabaseManager(str(db_path))
-                schema = db_manager.get_schema()
-                table_count = len(schema)
-                
-                # Count total rows
-                total_rows = 0
-                for table in schema:
-                    result = db_manager.execute_query(f"SELECT COUNT(*) FROM {table['name']}")
-                    total_rows += result['rows'][0][0] if result['rows'] else 0
-            except:
-                table_count = db_info.get('table_count', 0)
-                total_rows = 0
-            
-            uploads.append(UploadedDatabase(
-                id=db_id,
-                name=db_info['name'],
-                upload_date=db_info.get('upload_date', ''),
-                table_count=table_count,
-                total_rows=total_rows,
-                size_mb=round(size_mb, 2)
-            ))
+async def list_uploads(exact: bool = False):
+    """
+    List all uploaded databases
     
-    return uploads
+    total_rows comes from the statistics gathered at upload time; pass
+    ?exact=true to count every table's rows instead.
+    """
+    # Entries are built with known types, so they are serialized directly;
+    # response_model is kept for the OpenAPI docs only
+    uploaded = await asyncio.gather(*(
+        asyncio.to_thread(_uploaded_database, db_id, db_info, exact)
+        for db_id, db_info in list(_UPLOADED_DATABASES.items())
+    ))
+    return ORJSONResponse(uploaded)
 
 
-@router.delete("/uploads/{upload_id}")
-async def delete_upload(upload_id: str):
-    """Delete an uploaded database"""
+@router.delete("/uploads/{upload_id}", response_class=ORJSONResponse)
+async def delete_upload(upload_id: str, background_tasks: BackgroundTasks):
+    """
+    Delete an uploaded database
+    
+    The upload directory is renamed aside and removed after the response
+    is sent, so large uploads don't hold up the request.
+    """
     if upload_id not in DATABASES:
         raise HTTPException(status_code=404, detail="Upload not found")
     
-    if not DATABASES[upload_id].get('uploaded'):
+    if upload_id not in _UPLOADED_DATABASES:
         raise HTTPException(status_code=400, detail="Cannot delete built-in database")
     
     try:
-        # Delete files
+        # Move the files out of the way (a single rename) ...
         upload_dir = Config.DATA_DIR / 'user_uploads' / upload_id
-        if upload_dir.exists():
-            shutil.rmtree(upload_dir)
+        trash_dir = upload_dir.with_name(f".deleted_{upload_id}")
+        try:
+            os.replace(upload_dir, trash_dir)
+        except FileNotFoundError:
+            trash_dir = None
         
         # Remove from registry
+        _evict_database(DATABASES[upload_id]['path'])
+        _DATABASE_INFO.pop(upload_id)
+        _UPLOAD_JOBS.pop(upload_id, None)
+        del _UPLOADED_DATABASES[upload_id]
         del DATABASES[upload_id]
         
+        # ... and delete them once the response is out (runs in the threadpool)
+        if trash_dir is not None:
+            background_tasks.add_task(shutil.rmtree, trash_dir, ignore_errors=True)
+        
         logger.info(f"Deleted upload: {upload_id}")
         return {"message": "Upload deleted successfully"}
         
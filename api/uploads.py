@@ -0,0 +1,68 @@
+"""
+Upload Processing
+Runs schema detection and Excel → SQLite conversion in worker processes
+so CPU-bound pandas work neither blocks the event loop nor holds the GIL
+of the API process
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Optional
+
+from src.utils.config import Config
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
+
+def process_upload(excel_dir: str, db_path: str) -> Dict[str, Any]:
+    """
+    Detect the schema of uploaded files and build their SQLite database
+
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Args:
+        excel_dir: Directory holding the uploaded Excel/CSV files
+        db_path: SQLite database file to create
+
+    Returns:
+        Dict with detected_schema, table_count, total_rows and relationships
+    """
+    from src.core.schema_detector import SchemaDetector
+    from src.data.converters import excel_to_sql
+
+    detector = SchemaDetector()
+    detector.analyze_directory(excel_dir)
+
+    # Also runs ANALYZE, so listings can read row counts from sqlite_stat1
+    excel_to_sql(excel_dir=excel_dir, db_name=db_path)
+
+    return {
+        'detected_schema': detector.to_dict(),
+        'table_count': len(detector.tables),
+        'total_rows': sum(table.row_count for table in detector.tables.values()),
+        'relationships': len(detector.relationships) if hasattr(detector, 'relationships') else 0
+    }
+
+
+def get_executor() -> ProcessPoolExecutor:
+    """Return the shared upload process pool, starting it on first use"""
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        # spawn, not fork: the API process runs threads and holds open SQLite connections
+        _EXECUTOR = ProcessPoolExecutor(
+            max_workers=Config.UPLOAD_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn")
+        )
+        logger.debug(f"Upload process pool started ({Config.UPLOAD_PROCESS_WORKERS} workers)")
+    return _EXECUTOR
+
+
+def shutdown() -> None:
+    """Stop the upload process pool (application shutdown)"""
+    global _EXECUTOR
+    if _EXECUTOR is not None:
+        _EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _EXECUTOR = None
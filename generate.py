@@ -19,33 +19,52 @@ from datetime import datetime
 logger = setup_logger(__name__)
 
 
+# Banner and summary are each written to stdout in one call
+_RULE = "=" * 70
+
+_BANNER = "\n".join([
+    "",
+    _RULE,
+    "  📊 ELECTRONICS APPLIANCE COMPANY - DATA GENERATION PIPELINE",
+    _RULE,
+    "  Started: {started}",
+    _RULE,
+    "",
+    "",
+])
+
+_SUMMARY = "\n".join([
+    "",
+    _RULE,
+    "  ✨ PIPELINE COMPLETED SUCCESSFULLY!",
+    _RULE,
+    "  Duration: {duration:.2f} seconds",
+    "",
+    "  📁 Generated Files:",
+    "     - data/excel/ (12 Excel files)",
+    "     - data/database/electronics_company.db (SQLite database)",
+    "     - docs/database_schema.md (Documentation)",
+    "     - docs/database_schema.sql (SQL DDL)",
+    "",
+    "  🚀 Next Steps:",
+    "     1. Review Excel files in data/excel/",
+    "     2. Query the database: python query.py",
+    "     3. Read schema documentation: docs/database_schema.md",
+    _RULE,
+    "",
+    "",
+])
+
+
 def print_banner():
     """Print welcome banner"""
-    print("\n" + "=" * 70)
-    print("  📊 ELECTRONICS APPLIANCE COMPANY - DATA GENERATION PIPELINE")
-    print("=" * 70)
-    print(f"  Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_BANNER.format(started=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
 
 
 def print_summary(start_time):
     """Print final summary"""
     duration = (datetime.now() - start_time).total_seconds()
-    
-    print("\n" + "=" * 70)
-    print("  ✨ PIPELINE COMPLETED SUCCESSFULLY!")
-    print("=" * 70)
-    print(f"  Duration: {duration:.2f} seconds")
-    print("\n  📁 Generated Files:")
-    print("     - data/excel/ (12 Excel files)")
-    print("     - data/database/electronics_company.db (SQLite database)")
-    print("     - docs/database_schema.md (Documentation)")
-    print("     - docs/database_schema.sql (SQL DDL)")
-    print("\n  🚀 Next Steps:")
-    print("     1. Review Excel files in data/excel/")
-    print("     2. Query the database: python query.py")
-    print("     3. Read schema documentation: docs/database_schema.md")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_SUMMARY.format(duration=duration))
 
 
 def main():
@@ -11,45 +11,48 @@ from pathlib import Path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
-from src.cli.query_cli import QueryCLI
 from src.utils.config import Config
 import os
 
 config = Config()
 
+# Menu choice -> (company name, database path)
+COMPANY_DATABASES = {
+    '1': ('Electronics Company', str(config.DATABASE_DIR / 'electronics_company.db')),
+    '2': ('Airline Company', str(config.DATABASE_DIR / 'airline_company.db'))
+}
+
 
 def select_company():
     """Let user select which company database to query"""
-    databases = {
-        '1': ('Electronics Company', str(config.DATABASE_DIR / 'electronics_company.db')),
-        '2': ('Airline Company', str(config.DATABASE_DIR / 'airline_company.db'))
-    }
+    # Check each file once; the result is shown in the menu and reused for the choice
+    available = {key: os.path.exists(path) for key, (_, path) in COMPANY_DATABASES.items()}
     
     print("\n" + "=" * 70)
     print("  🗄️  SELECT DATABASE TO QUERY")
     print("=" * 70)
     print("\n  Available Databases:")
-    for key, (name, path) in databases.items():
-        exists = "✅" if os.path.exists(path) else "❌"
+    for key, (name, path) in COMPANY_DATABASES.items():
+        exists = "✅" if available[key] else "❌"
         print(f"    {key}. {name} {exists}")
     print("\n" + "=" * 70)
     
-    choice = input("\n  Select database (1-2) or 'q' to quit: ").strip()
-    
-    if choice.lower() == 'q':
-        print("\n  👋 Goodbye!\n")
-        sys.exit(0)
-    
-    if choice in databases:
-        name, db_path = databases[choice]
-        if not os.path.exists(db_path):
-            print(f"\n  ❌ Error: Database not found: {db_path}")
-            print(f"  Run: python scripts/generate_all_companies.py\n")
-            sys.exit(1)
-        return name, db_path
-    else:
-        print("\n  ❌ Invalid choice. Please select 1 or 2.\n")
-        return select_company()
+    while True:
+        choice = input("\n  Select database (1-2) or 'q' to quit: ").strip()
+        
+        if choice.lower() == 'q':
+            print("\n  👋 Goodbye!\n")
+            sys.exit(0)
+        
+        if choice in COMPANY_DATABASES:
+            name, db_path = COMPANY_DATABASES[choice]
+            if not available[choice]:
+                print(f"\n  ❌ Error: Database not found: {db_path}")
+                print(f"  Run: python scripts/generate_all_companies.py\n")
+                sys.exit(1)
+            return name, db_path
+        
+        print("\n  ❌ Invalid choice. Please select 1 or 2.")
 
 
 def main():
@@ -69,7 +72,9 @@ def main():
     print(f"\n  📊 Selected: {company_name}")
     print(f"  🗄️  Database: {db_path}\n")
     
-    # Create CLI with selected database
+    # Create CLI with selected database (imported late: it loads the
+    # query engine and Gemini SDK, which the menu doesn't need)
+    from src.cli.query_cli import QueryCLI
     cli = QueryCLI(db_path=db_path)
     
     # Check if question provided
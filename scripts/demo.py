@@ -7,8 +7,6 @@ Shows 3 example queries with results
 import sys
 from pathlib import Path
 
-from query_engine import QueryEngine
-from cli import QueryCLI
 from logger import setup_logger
 from exceptions import AppException
 
@@ -33,6 +31,11 @@ def main():
             print(f"❌ Error generating data: {e}\n")
             sys.exit(1)
     
+    # Imported only now: the query engine pulls in the Gemini SDK (grpc,
+    # protobuf), which the data-generation path above never needs
+    from query_engine import QueryEngine
+    from cli import QueryCLI
+    
     # Initialize
     try:
         engine = QueryEngine()
@@ -3,7 +3,20 @@
 Example queries demonstrating various SQL query types
 """
 
-from llm_query import DatabaseQueryEngine
+import argparse
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.cli.query_cli import QueryCLI
+from src.core.query_engine import QueryEngine
+
+# Example questions answered concurrently (each is an LLM round-trip)
+MAX_CONCURRENT_QUESTIONS = 4
 
 
 EXAMPLE_QUESTIONS = [
@@ -33,28 +46,42 @@ EXAMPLE_QUESTIONS = [
 ]
 
 
-def run_examples():
-    """Run all example queries"""
+def run_examples(batch: bool = False, workers: int = MAX_CONCURRENT_QUESTIONS):
+    """
+    Run all example queries
+    
+    Questions are submitted up front and answered in a thread pool, so
+    LLM round-trips overlap (including while the previous answer is read).
+    
+    Args:
+        batch: Print every result without pausing between examples
+        workers: Questions answered concurrently
+    """
     print("\n" + "=" * 70)
     print("  📚 EXAMPLE QUERIES")
     print("=" * 70 + "\n")
     
     try:
-        engine = DatabaseQueryEngine()
+        engine = QueryEngine()
     except Exception as e:
         print(f"❌ {e}\n")
         return
     
-    for i, question in enumerate(EXAMPLE_QUESTIONS, 1):
-        print("=" * 70)
-        print(f"EXAMPLE {i}/{len(EXAMPLE_QUESTIONS)}")
-        print("=" * 70 + "\n")
-        
-        result = engine.ask(question)
-        engine.print_results(result)
+    cli = QueryCLI()
+    
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        # map() yields results in question order as each one completes
+        results = executor.map(engine.ask, EXAMPLE_QUESTIONS)
         
-        if i < len(EXAMPLE_QUESTIONS):
-            input("Press Enter for next example...\n")
+        for i, result in enumerate(results, 1):
+            print("=" * 70)
+            print(f"EXAMPLE {i}/{len(EXAMPLE_QUESTIONS)}: {EXAMPLE_QUESTIONS[i - 1]}")
+            print("=" * 70 + "\n")
+            
+            cli.print_results(result)
+            
+            if not batch and i < len(EXAMPLE_QUESTIONS):
+                input("Press Enter for next example...\n")
     
     print("=" * 70)
     print("  ✨ All Examples Complete!")
@@ -62,4 +89,13 @@ def run_examples():
 
 
 if __name__ == "__main__":
-    run_examples()
+    parser = argparse.ArgumentParser(description="Run example queries")
+    parser.add_argument('--batch', action='store_true', help="Print all results without pausing")
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=MAX_CONCURRENT_QUESTIONS,
+        help="Questions answered concurrently"
+    )
+    args = parser.parse_args()
+    run_examples(batch=args.batch, workers=args.workers)
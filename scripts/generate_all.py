@@ -14,33 +14,52 @@ from convert_to_sql import excel_to_sql, verify_database
 from generate_schema import generate_schema_file, generate_sql_schema
 
 
+# Banner and summary are each written to stdout in one call
+_RULE = "=" * 70
+
+_BANNER = "\n".join([
+    "",
+    _RULE,
+    "  📊 ELECTRONICS APPLIANCE COMPANY - DATA GENERATION PIPELINE",
+    _RULE,
+    "  Started: {started}",
+    _RULE,
+    "",
+    "",
+])
+
+_SUMMARY = "\n".join([
+    "",
+    _RULE,
+    "  ✨ PIPELINE COMPLETED SUCCESSFULLY!",
+    _RULE,
+    "  Duration: {duration:.2f} seconds",
+    "",
+    "  📁 Generated Files:",
+    "     - excel_files/ (12 Excel files)",
+    "     - electronics_company.db (SQLite database)",
+    "     - database_schema.md (Documentation)",
+    "     - database_schema.sql (SQL DDL)",
+    "",
+    "  🚀 Next Steps:",
+    "     1. Review Excel files in excel_files/ directory",
+    "     2. Query the database: sqlite3 electronics_company.db",
+    "     3. Read schema documentation: database_schema.md",
+    _RULE,
+    "",
+    "",
+])
+
+
 def print_banner():
     """Print welcome banner"""
-    print("\n" + "=" * 70)
-    print("  📊 ELECTRONICS APPLIANCE COMPANY - DATA GENERATION PIPELINE")
-    print("=" * 70)
-    print(f"  Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_BANNER.format(started=datetime.now().strftime('%Y-%m-%d %H:%M:%S')))
 
 
 def print_summary(start_time):
     """Print final summary"""
     duration = (datetime.now() - start_time).total_seconds()
-    
-    print("\n" + "=" * 70)
-    print("  ✨ PIPELINE COMPLETED SUCCESSFULLY!")
-    print("=" * 70)
-    print(f"  Duration: {duration:.2f} seconds")
-    print("\n  📁 Generated Files:")
-    print("     - excel_files/ (12 Excel files)")
-    print("     - electronics_company.db (SQLite database)")
-    print("     - database_schema.md (Documentation)")
-    print("     - database_schema.sql (SQL DDL)")
-    print("\n  🚀 Next Steps:")
-    print("     1. Review Excel files in excel_files/ directory")
-    print("     2. Query the database: sqlite3 electronics_company.db")
-    print("     3. Read schema documentation: database_schema.md")
-    print("=" * 70 + "\n")
+    sys.stdout.write(_SUMMARY.format(duration=duration))
 
 
 def main():
@@ -60,7 +79,7 @@ def main():
         # Step 2: Convert to SQL database
         print("STEP 2/3: Converting to SQL Database")
         print("-" * 70)
-        db_name, engine = excel_to_sql()
+        db_name = excel_to_sql()
         verify_database(db_name)
         print("\n")
         
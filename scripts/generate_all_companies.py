@@ -3,6 +3,9 @@ Multi-Company Database Generator
 Supports generating databases for multiple companies
 """
 
+import argparse
+import importlib
+import multiprocessing
 import os
 import sys
 from pathlib import Path
@@ -12,98 +15,104 @@ from datetime import datetime
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.data.generators import main as generate_electronics
-from src.data.airline_generators import main as generate_airline
-from src.data.edtech_generators import generate_all_edtech_data as generate_edtech
-from src.data.converters import excel_to_sql
-from src.data.schema import generate_schema_file, generate_sql_schema
 from src.utils.config import Config
 
 config = Config()
 
+# company key -> (display name, data directory/file prefix, generator module,
+#                 generator function, Excel files generated, random seed)
+# Generators (and pandas/openpyxl/SQLAlchemy behind them) are imported only
+# for the companies being generated. Each company is reseeded with its own
+# seed right before generating, so its output doesn't depend on which other
+# companies were imported or generated first
+COMPANIES = {
+    'electronics': ("Electronics Company", 'electronics', 'src.data.generators', 'main', 12, 42),
+    'airline': ("Airline Company", 'airline', 'src.data.airline_generators', 'main', 16, 100),
+    'edtech': ("EdTech India Company", 'edtech', 'src.data.edtech_generators', 'generate_all_edtech_data', 15, 200),
+}
+
+
+_RULE = "=" * 70
+
 
 def print_banner(company_name):
     """Print banner for company"""
-    print("\n" + "=" * 70)
-    print(f"  📊 {company_name.upper()} - DATA PIPELINE")
-    print("=" * 70)
+    sys.stdout.write(f"\n{_RULE}\n  📊 {company_name.upper()} - DATA PIPELINE\n{_RULE}\n")
 
 
-def generate_all_data():
-    """Generate data for all companies"""
-    print("\n" + "=" * 70)
-    print("  🏢 MULTI-COMPANY DATA GENERATION PIPELINE")
-    print("=" * 70)
-    print(f"  Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("=" * 70)
+def generate_one(company):
+    """Generate Excel files, SQL database and schema docs for one company"""
+    import random
+    from faker import Faker
+    from src.data.converters import excel_to_sql
+    from src.data.schema import generate_schema_file, generate_sql_schema
     
-    # Company 1: Electronics
-    print_banner("Electronics Company")
-    print("\n📝 Step 1/3: Generating Excel Files...")
-    generate_electronics()
-    
-    print("\n📝 Step 2/3: Converting to SQL Database...")
-    excel_dir = os.path.join(config.EXCEL_OUTPUT_DIR, 'electronics_company')
-    db_path = os.path.join(config.DATABASE_DIR, 'electronics_company.db')
-    excel_to_sql(excel_dir=excel_dir, db_name=db_path)
-    
-    print("\n📝 Step 3/3: Generating Schema Documentation...")
-    schema_md = os.path.join(config.DOCS_DIR, '06-database', 'electronics_schema.md')
-    schema_sql = os.path.join(config.DOCS_DIR, '06-database', 'electronics_schema.sql')
-    generate_schema_file(db_name=db_path, output_file=schema_md)
-    generate_sql_schema(db_name=db_path, output_file=schema_sql)
+    company_name, prefix, module_name, function_name, _, seed = COMPANIES[company]
+    generate = getattr(importlib.import_module(module_name), function_name)
+    # The generator module seeds on import, but that is skipped when it was
+    # already imported; reseed so every run starts from the same state
+    Faker.seed(seed)
+    random.seed(seed)
     
-    # Company 2: Airline
-    print_banner("Airline Company")
+    print_banner(company_name)
     print("\n📝 Step 1/3: Generating Excel Files...")
-    generate_airline()
+    generate()
     
     print("\n📝 Step 2/3: Converting to SQL Database...")
-    excel_dir = os.path.join(config.EXCEL_OUTPUT_DIR, 'airline_company')
-    db_path = os.path.join(config.DATABASE_DIR, 'airline_company.db')
+    excel_dir = os.path.join(config.EXCEL_OUTPUT_DIR, f'{prefix}_company')
+    db_path = os.path.join(config.DATABASE_DIR, f'{prefix}_company.db')
     excel_to_sql(excel_dir=excel_dir, db_name=db_path)
     
     print("\n📝 Step 3/3: Generating Schema Documentation...")
-    schema_md = os.path.join(config.DOCS_DIR, '06-database', 'airline_schema.md')
-    schema_sql = os.path.join(config.DOCS_DIR, '06-database', 'airline_schema.sql')
+    schema_md = os.path.join(config.DOCS_DIR, '06-database', f'{prefix}_schema.md')
+    schema_sql = os.path.join(config.DOCS_DIR, '06-database', f'{prefix}_schema.sql')
     generate_schema_file(db_name=db_path, output_file=schema_md)
     generate_sql_schema(db_name=db_path, output_file=schema_sql)
+
+
+def generate_all_data(companies=None):
+    """Generate data for all companies (or only the given company keys)"""
+    sys.stdout.write("\n".join([
+        "",
+        _RULE,
+        "  🏢 MULTI-COMPANY DATA GENERATION PIPELINE",
+        _RULE,
+        f"  Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+        _RULE,
+        "",
+    ]))
     
-    # Company 3: EdTech India
-    print_banner("EdTech India Company")
-    print("\n📝 Step 1/3: Generating Excel Files...")
-    generate_edtech()
-    
-    print("\n📝 Step 2/3: Converting to SQL Database...")
-    excel_dir = os.path.join(config.EXCEL_OUTPUT_DIR, 'edtech_company')
-    db_path = os.path.join(config.DATABASE_DIR, 'edtech_company.db')
-    excel_to_sql(excel_dir=excel_dir, db_name=db_path)
-    
-    print("\n📝 Step 3/3: Generating Schema Documentation...")
-    schema_md = os.path.join(config.DOCS_DIR, '06-database', 'edtech_schema.md')
-    schema_sql = os.path.join(config.DOCS_DIR, '06-database', 'edtech_schema.sql')
-    generate_schema_file(db_name=db_path, output_file=schema_md)
-    generate_sql_schema(db_name=db_path, output_file=schema_sql)
+    companies = companies or list(COMPANIES)
+    if len(companies) == 1:
+        generate_one(companies[0])
+    else:
+        # Companies are independent (own seed, output dirs and database),
+        # and the work is CPU-bound pandas/openpyxl, so run one process each
+        with multiprocessing.Pool(len(companies)) as pool:
+            pool.map(generate_one, companies)
     
-    # Final summary
-    print("\n" + "=" * 70)
-    print("  ✨ ALL COMPANIES PROCESSED SUCCESSFULLY!")
-    print("=" * 70)
-    print("\n  📊 Summary:")
-    print("     Electronics Company:")
-    print("       - data/excel/electronics_company/ (12 Excel files)")
-    print("       - data/database/electronics_company.db")
-    print("       - docs/06-database/electronics_schema.md")
-    print("\n     Airline Company:")
-    print("       - data/excel/airline_company/ (16 Excel files)")
-    print("       - data/database/airline_company.db")
-    print("       - docs/06-database/airline_schema.md")
-    print("\n     EdTech India Company:")
-    print("       - data/excel/edtech_company/ (15 Excel files)")
-    print("       - data/database/edtech_company.db")
-    print("       - docs/06-database/edtech_schema.md")
-    print("=" * 70 + "\n")
+    # Final summary (built up and written in one call)
+    lines = ["", _RULE, "  ✨ ALL COMPANIES PROCESSED SUCCESSFULLY!", _RULE, "", "  📊 Summary:"]
+    for i, company in enumerate(companies):
+        company_name, prefix, _, _, excel_files, _ = COMPANIES[company]
+        if i:
+            lines.append("")
+        lines += [
+            f"     {company_name}:",
+            f"       - data/excel/{prefix}_company/ ({excel_files} Excel files)",
+            f"       - data/database/{prefix}_company.db",
+            f"       - docs/06-database/{prefix}_schema.md",
+        ]
+    lines += [_RULE, "", ""]
+    sys.stdout.write("\n".join(lines))
 
 
 if __name__ == "__main__":
-    generate_all_data()
+    parser = argparse.ArgumentParser(description="Generate company databases")
+    parser.add_argument(
+        'companies',
+        nargs='*',
+        choices=list(COMPANIES),
+        help="Companies to generate (default: all)"
+    )
+    generate_all_data(parser.parse_args().companies)
@@ -6,18 +6,21 @@ Tests hardcoded query plans to validate the core execution logic.
 """
 
 from pathlib import Path
+from src.core import db_pool
+from src.core.database import DatabaseManager
 from src.core.query_engine import QueryEngine
 from src.core.query_plan import QueryPlan, QueryStep, create_comparison_plan
-import json
+import orjson
 
+DB_PATH = "data/database/electronics_company.db"
+SEP = "=" * 70
 
-def test_simple_single_query():
+
+def test_simple_single_query(engine):
     """Test 1: Simple single-query plan (backward compatibility)"""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("TEST 1: Simple Single Query")
-    print("="*70)
-    
-    engine = QueryEngine(db_path="data/database/electronics_company.db")
+    print(SEP)
     
     plan = QueryPlan.create_simple_plan(
         sql="SELECT COUNT(*) as total_employees FROM employees",
@@ -39,13 +42,11 @@ def test_simple_single_query():
     return executed_plan.is_complete()
 
 
-def test_department_comparison():
+def test_department_comparison(engine):
     """Test 2: Compare two departments (independent queries + merge)"""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("TEST 2: Department Comparison (3-step plan)")
-    print("="*70)
-    
-    engine = QueryEngine(db_path="data/database/electronics_company.db")
+    print(SEP)
     
     plan = QueryPlan(
         queries=[
@@ -119,13 +120,11 @@ def test_department_comparison():
     return executed_plan.is_complete()
 
 
-def test_chained_dependencies():
+def test_chained_dependencies(engine):
     """Test 3: Linear dependency chain (q1 -> q2 -> q3)"""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("TEST 3: Chained Dependencies (Linear)")
-    print("="*70)
-    
-    engine = QueryEngine(db_path="data/database/electronics_company.db")
+    print(SEP)
     
     plan = QueryPlan(
         queries=[
@@ -180,13 +179,11 @@ def test_chained_dependencies():
     return executed_plan.is_complete()
 
 
-def test_plan_serialization():
+def test_plan_serialization(engine):
     """Test 4: Verify plan can be serialized to JSON"""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("TEST 4: Plan Serialization")
-    print("="*70)
-    
-    engine = QueryEngine(db_path="data/database/electronics_company.db")
+    print(SEP)
     
     plan = QueryPlan.create_simple_plan(
         sql="SELECT department, COUNT(*) as count FROM employees GROUP BY department ORDER BY count DESC LIMIT 3",
@@ -197,23 +194,33 @@ def test_plan_serialization():
     
     # Serialize to JSON
     plan_dict = executed_plan.to_dict()
-    json_str = json.dumps(plan_dict, indent=2)
+    # orjson encodes in C straight to bytes (the API serializes plans the same way)
+    json_bytes = orjson.dumps(plan_dict, option=orjson.OPT_INDENT_2)
     
     print("Serialized plan (first 500 chars):")
-    print(json_str[:500] + "...")
+    print(json_bytes[:500].decode('utf-8', errors='ignore') + "...")
     
     print(f"\nSerialization: ✅ Success")
-    print(f"JSON size: {len(json_str)} bytes")
+    print(f"JSON size: {len(json_bytes)} bytes")
     
     return True
 
 
 def main():
     """Run all prototype tests"""
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("MULTI-QUERY PROTOTYPE TESTS")
     print("Testing QueryPlan execution without AI integration")
-    print("="*70)
+    print(SEP)
+    
+    # One engine (schema introspection, LLM clients) shared by every test;
+    # its queries borrow warm connections from the pool (tuned cache/temp
+    # store pragmas) instead of opening the database per query
+    try:
+        engine = QueryEngine(db_manager=DatabaseManager(db_path=Path(DB_PATH), pool=db_pool.get_pool(DB_PATH)))
+    except Exception as e:
+        print(f"\n❌ Could not create query engine: {e}")
+        return
     
     tests = [
         ("Simple single query", test_simple_single_query),
@@ -225,16 +232,16 @@ def main():
     results = []
     for name, test_func in tests:
         try:
-            success = test_func()
+            success = test_func(engine)
             results.append((name, success))
         except Exception as e:
             print(f"\n❌ Test failed with error: {e}")
             results.append((name, False))
     
     # Summary
-    print("\n" + "="*70)
+    print("\n" + SEP)
     print("TEST SUMMARY")
-    print("="*70)
+    print(SEP)
     
     for name, success in results:
         status = "✅ PASS" if success else "❌ FAIL"
@@ -250,6 +257,8 @@ def main():
         print("Next step: Add AI-powered query plan generation.")
     else:
         print("\n⚠️  Some tests failed. Review errors above.")
+    
+    db_pool.close_all()
 
 
 if __name__ == "__main__":
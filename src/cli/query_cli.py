@@ -3,15 +3,53 @@ Command-line interface for the query engine
 Production-ready with proper formatting and error handling
 """
 
+import atexit
 import sys
-from typing import Dict, Any, Optional
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 
+try:
+    import readline
+except ImportError:  # Windows: plain input() without history/completion
+    readline = None
+
+from src.core import db_pool
+from src.core.database import DatabaseManager
 from src.core.query_engine import QueryEngine
+from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.utils.exceptions import AppException
 
 logger = setup_logger(__name__)
 
+_RULE = "=" * 70
+
+# Interactive-mode welcome, built once and written in one call
+_BANNER = "\n".join([
+    _RULE,
+    "  🤖 NATURAL LANGUAGE DATABASE QUERY",
+    _RULE,
+    "",
+    "  Ask questions in plain English!",
+    "  Commands:",
+    "    - Type question to query",
+    "    - 'tables' - List available tables",
+    "    - 'schema' - Show database schema",
+    "    - 'clear-cache' - Regenerate SQL for repeated questions",
+    "    - 'exit' or 'quit' - Exit",
+    "",
+    _RULE,
+    "",
+    "",
+])
+
+# Interactive commands offered by tab completion alongside table/column names
+_COMMANDS = ['tables', 'schema', 'clear-cache', 'exit', 'quit']
+_HISTORY_LENGTH = 1000
+
+# Rows rendered per result; questions only fetch this many from the database
+_DISPLAY_LIMIT = 50
+
 
 class QueryCLI:
     """Command-line interface for natural language queries"""
@@ -25,6 +63,7 @@ class QueryCLI:
         """
         self.engine = None
         self.db_path = db_path
+        self._completion_corpus: List[str] = []
     
     def _init_engine(self):
         """Initialize query engine with error handling"""
@@ -33,7 +72,12 @@ class QueryCLI:
         
         try:
             print("🔄 Initializing query engine...")
-            self.engine = QueryEngine(db_path=self.db_path)
+            # Queries borrow warm read-only connections from the same pool the
+            # API uses, instead of opening the database for every question
+            db_path = str(self.db_path or Config.get_db_path())
+            self.engine = QueryEngine(
+                db_manager=DatabaseManager(db_path=Path(db_path), pool=db_pool.get_pool(db_path))
+            )
             print(f"✅ Connected to Google AI Studio")
             print(f"📦 Using model: {self.engine.model_name}")
             print(f"🗄️  Database: {self.engine.db_manager.db_path}\n")
@@ -46,6 +90,48 @@ class QueryCLI:
             print(f"\n❌ Unexpected error: {e}\n")
             sys.exit(1)
     
+    def _complete(self, text: str, state: int) -> Optional[str]:
+        """readline completer over commands, table and column names"""
+        options = [word for word in self._completion_corpus if word.startswith(text)]
+        return options[state] if state < len(options) else None
+    
+    def _init_readline(self):
+        """
+        Enable question history (persisted across sessions) and tab completion
+        
+        Recalling a previous question with the arrow keys re-asks it verbatim,
+        so it hits the SQL cache instead of costing another LLM round-trip.
+        """
+        if readline is None:
+            return
+        
+        history_file = Config.CLI_HISTORY_FILE
+        try:
+            readline.read_history_file(history_file)
+        except OSError:
+            pass  # First session (or unreadable file): start with empty history
+        readline.set_history_length(_HISTORY_LENGTH)
+        atexit.register(self._save_history, history_file)
+        
+        # Built once per session from the engine's cached table list
+        tables = self.engine.get_available_tables()
+        words = set(_COMMANDS).union(tables)
+        for table in tables:
+            words.update(column['name'] for column in self.engine.db_manager.get_table_info(table))
+        self._completion_corpus = sorted(words)
+        
+        readline.set_completer(self._complete)
+        readline.set_completer_delims(" \t\n,()'\"")
+        readline.parse_and_bind("tab: complete")
+    
+    @staticmethod
+    def _save_history(history_file: str):
+        """Write question history on exit"""
+        try:
+            readline.write_history_file(history_file)
+        except OSError as e:
+            logger.warning(f"Could not save CLI history to {history_file}: {e}")
+    
     def print_results(self, result: Dict[str, Any]):
         """
         Pretty print query results
@@ -59,63 +145,56 @@ class QueryCLI:
         
         results = result['results']
         
-        # Print metadata
-        print(f"✅ Success! ({result['row_count']} rows in {result['execution_time']:.3f}s)")
+        # The whole block is built up and written with one stdout call
+        lines = [f"✅ Success! ({result['row_count']} rows in {result['execution_time']:.3f}s)"]
         
         if result.get('truncated'):
-            print(f"⚠️  Results truncated to {len(results)} rows\n")
+            lines.append(f"⚠️  Results truncated to {len(results)} rows\n")
         else:
-            print()
+            lines.append("")
         
         if not results:
-            print("No results found.\n")
+            lines.append("No results found.\n")
+            sys.stdout.write("\n".join(lines) + "\n")
             return
         
         # Get columns
         columns = list(results[0].keys())
         
-        # Calculate column widths
-        widths = {col: len(col) for col in columns}
-        for row in results[:50]:  # Check first 50 for width
-            for col in columns:
-                val = str(row[col]) if row[col] is not None else "NULL"
-                widths[col] = min(max(widths[col], len(val)), 50)  # Max width 50
-        
-        # Print header
-        header = " | ".join(col.ljust(widths[col]) for col in columns)
-        separator = "-+-".join("-" * widths[col] for col in columns)
-        
-        print(header)
-        print(separator)
-        
-        # Print rows (limit display to 50)
-        display_limit = min(50, len(results))
+        # Stringify the displayed cells once, tracking column widths (max 50)
+        # in the same pass
+        display_limit = min(_DISPLAY_LIMIT, len(results))
+        widths = [len(col) for col in columns]
+        cells = []
+        # Every row comes from the same cursor, so its values are already in
+        # column order: read them positionally rather than hashing each key
         for row in results[:display_limit]:
-            line = " | ".join(
-                str(row[col])[:50].ljust(widths[col]) if row[col] is not None
-                else "NULL".ljust(widths[col])
-                for col in columns
-            )
-            print(line)
+            row_cells = ["NULL" if value is None else str(value)[:50] for value in row.values()]
+            for j, cell in enumerate(row_cells):
+                if len(cell) > widths[j]:
+                    widths[j] = len(cell)
+            cells.append(row_cells)
+        widths = [min(width, 50) for width in widths]
+        
+        # Header, separator and rows
+        lines.append(" | ".join(col.ljust(width) for col, width in zip(columns, widths)))
+        lines.append("-+-".join("-" * width for width in widths))
+        row_format = " | ".join(f"{{:<{width}}}" for width in widths)
+        lines.extend(row_format.format(*row_cells) for row_cells in cells)
         
         if len(results) > display_limit:
-            print(f"\n... ({len(results) - display_limit} more rows not shown)")
-        print()
+            lines.append(f"\n... ({len(results) - display_limit} more rows not shown)")
+        lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     
     def interactive_mode(self):
         """Run interactive query mode"""
-        print("=" * 70)
-        print("  🤖 NATURAL LANGUAGE DATABASE QUERY")
-        print("=" * 70)
-        print("\n  Ask questions in plain English!")
-        print("  Commands:")
-        print("    - Type question to query")
-        print("    - 'tables' - List available tables")
-        print("    - 'schema' - Show database schema")
-        print("    - 'exit' or 'quit' - Exit")
-        print("\n" + "=" * 70 + "\n")
+        # Only a person at a terminal needs the welcome (not pipes/CI)
+        if sys.stdout.isatty():
+            sys.stdout.write(_BANNER)
         
         self._init_engine()
+        self._init_readline()
         
         while True:
             try:
@@ -130,20 +209,25 @@ class QueryCLI:
                 
                 if question.lower() == 'tables':
                     tables = self.engine.get_available_tables()
+                    counts = self.engine.db_manager.get_row_counts(tables)
                     print(f"\n📋 Available tables ({len(tables)}):")
                     for table in tables:
-                        count = self.engine.db_manager.get_row_count(table)
-                        print(f"  - {table} ({count} rows)")
+                        print(f"  - {table} ({counts[table]} rows)")
                     print()
                     continue
                 
+                if question.lower() == 'clear-cache':
+                    self.engine.clear_caches()
+                    print("\n🧹 Cache cleared\n")
+                    continue
+                
                 if question.lower() == 'schema':
                     print(f"\n{self.engine.get_schema_info()}")
                     continue
                 
                 # Process question
                 print()
-                result = self.engine.ask(question)
+                result = self.engine.ask(question, max_results=_DISPLAY_LIMIT)
                 
                 # Show generated SQL
                 if result['success']:
@@ -169,7 +253,7 @@ class QueryCLI:
         
         print(f"🤔 Question: {question}\n")
         
-        result = self.engine.ask(question)
+        result = self.engine.ask(question, max_results=_DISPLAY_LIMIT)
         
         if result['success']:
             print(f"📝 SQL: {result['sql']}\n")
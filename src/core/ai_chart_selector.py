@@ -10,19 +10,121 @@ Author: Context Engineering
 Created: 2025-11-06
 """
 
-from typing import List, Dict, Optional, Any, Literal
+from typing import List, Dict, Optional, Any, Literal, Hashable
+import asyncio
+from bisect import bisect_left
 import logging
 from dataclasses import dataclass, asdict
+from datetime import date, datetime
+from operator import itemgetter
 
 from src.core.chart_detector import ChartConfig, ChartType, ColumnMetadata
+from src.utils.cache import TTLCache, normalize_question
+from src.utils.config import Config
+from src.utils.json_extract import parse_json
 from src.utils.llm import _get_client
 
 logger = logging.getLogger(__name__)
 
+# LLM chart choices keyed by result shape (column names + inferred types),
+# coarse cardinality and question. Only the recommendation is reused; the
+# chart data is always rebuilt from the current rows.
+_RECOMMENDATION_CACHE = TTLCache()
 
-@dataclass
+# Largest category count the rules chart as a bar without asking the LLM
+_RULE_MAX_BAR_CATEGORIES = 20
+
+# Most categories the prompt allows in a pie chart
+_MAX_PIE_CATEGORIES = 6
+
+# Cardinality bucket upper bounds for the cache key: a pie picked for a few
+# categories (or a bar for a short list) isn't reused for a long result
+_DISTINCT_COUNT_BUCKETS = (1, _MAX_PIE_CATEGORIES, _RULE_MAX_BAR_CATEGORIES)
+_ROW_COUNT_BUCKETS = (1, _MAX_PIE_CATEGORIES, _RULE_MAX_BAR_CATEGORIES, 100, 1000)
+
+# Data summary bounds: long text cells and float precision don't help the
+# LLM pick a chart type, they only cost prompt tokens
+_MAX_SAMPLE_CHARS = 40
+_MAX_SUMMARY_CHARS = 2000
+
+# Recommendation JSON validation
+_REQUIRED_FIELDS = frozenset({"chart_type", "reasoning", "x_column", "y_columns", "title"})
+_VALID_CHART_TYPES = frozenset({"line", "bar", "pie", "histogram", "none"})
+
+
+# Static instructions, sent as the system message so the provider can
+# cache this prefix; only the data summary and question vary per call
+_CHART_SELECTION_SYSTEM_PROMPT = """You are a data visualization expert. Analyze the query result you are given and determine if a chart would be helpful.
+
+**Decision Process:**
+1. First, decide if this data should be visualized at all
+2. If yes, select the BEST chart type
+
+**When NOT to visualize (use `none`):**
+- Single row/value results (e.g., "How many products?" → just a number)
+- Text-heavy data (employee names, descriptions)
+- Simple lookup results (e.g., "What is X's salary?" → one value)
+- Already clear from the data table
+
+**When TO visualize:**
+- Comparisons between categories
+- Trends over time
+- Distributions or patterns
+- Part-to-whole relationships
+
+**Available Chart Types:**
+- `line`: Time series, trends over time (requires temporal x-axis)
+- `bar`: Vertical bar for comparing categories (standard, up to 20 items)
+- `horizontal_bar`: Horizontal bars (better for long labels, many items, or rankings)
+- `pie`: Part-to-whole, percentages (best for 3-6 categories only)
+- `doughnut`: Modern alternative to pie (better for 4-8 categories)
+- `histogram`: Numeric distribution (single numeric column)
+- `area`: Filled line chart for cumulative/volume data
+- `stacked_bar`: Part-to-whole over categories (multiple series)
+- `stacked_area`: Cumulative trends over time
+- `grouped_bar`: Side-by-side comparison of multiple metrics
+- `combo`: Mixed bar + line (different scale metrics)
+- `scatter`: Correlation between two numeric variables
+- `none`: No visualization needed - data is clear from table
+
+**Best Practices:**
+- Pie/Doughnut: Only 3-8 categories showing proportions
+- Horizontal Bar: Use when labels are long (>15 chars) or there are many items (>10)
+- Scatter: Use for "X vs Y" questions to show correlation
+- Combo: Use when comparing metrics with different scales (e.g., sales $ and units)
+- None: Use for single values, text data, or when table is clearer
+- Bar charts: Better for comparing categories or when values don't sum to 100%
+- Line charts: Require temporal x-axis (dates/times)
+- Consider if the user's question really needs a chart
+
+**Your Response Format (JSON):**
+{
+  "chart_type": "bar|pie|line|histogram|none",
+  "reasoning": "Brief explanation why this chart type is best (or why no chart is needed)",
+  "x_column": "column name for x-axis (or empty string if none)",
+  "y_columns": ["column name(s) for y-axis (or empty array if none)"],
+  "title": "Descriptive chart title (or empty string if none)"
+}
+
+**Critical Rules:**
+1. Simple counts/single values → use `none`
+2. Comparing categories WITHOUT proportions → use `bar` not `pie`
+3. Showing top/bottom rankings → use `bar` not `pie`
+4. If >7 categories → NEVER use `pie`, use `bar`
+5. Trends over time → use `line`
+6. When in doubt, use `none` - let the data table speak for itself
+
+Respond ONLY with valid JSON, no other text."""
+
+
+def cache_stats() -> Dict[str, int]:
+    """Size and hit/miss counts of the chart recommendation cache."""
+    return _RECOMMENDATION_CACHE.stats()
+
+
+@dataclass(frozen=True, slots=True)
 class ChartRecommendation:
-    """AI recommendation for chart type."""
+    """AI recommendation for chart type (immutable: shared via the cache)."""
     
     chart_type: ChartType
     reasoning: str
@@ -72,57 +174,294 @@ class AIChartSelector:
             logger.info("Empty dataset - no chart to recommend")
             return None
         
-        # Build context for LLM
-        data_summary = self._build_data_summary(
-            columns, 
-            rows[:max_analyze],
-            column_metadata
-        )
-        
-        # Create prompt for LLM
-        prompt = self._build_chart_selection_prompt(
-            data_summary,
-            question
-        )
+        cache_key = self._cache_key(columns, rows, column_metadata, question)
         
         try:
-            # Call LLM (returns tuple: (response_text, provider))
-            response_text, provider = self.llm.generate_content(prompt)
-            logger.info(f"Chart selection using {provider}")
+            # Obvious shapes are decided by rules; only ambiguous ones reach the LLM
+            recommendation = self._rule_based_recommendation(rows, column_metadata)
+            if recommendation is None:
+                recommendation = _RECOMMENDATION_CACHE.get(cache_key)
             
-            # Parse recommendation
-            recommendation = self._parse_recommendation(response_text)
+            if recommendation is not None:
+                logger.info(f"Chart chosen without LLM call: {recommendation.reasoning}")
+            else:
+                # Build context for LLM
+                data_summary = self._build_data_summary(
+                    columns, 
+                    rows[:max_analyze],
+                    column_metadata
+                )
+                
+                # Create prompt for LLM
+                prompt = self._build_chart_selection_prompt(
+                    data_summary,
+                    question
+                )
+                
+                # Call LLM (returns tuple: (response_text, provider))
+                # JSON mode: the provider guarantees a parseable object
+                response_text, provider = self.llm.generate_content(
+                    prompt,
+                    system_message=_CHART_SELECTION_SYSTEM_PROMPT,
+                    json_mode=True
+                )
+                logger.info(f"Chart selection using {provider}")
+                
+                # Parse recommendation
+                recommendation = self._parse_recommendation(response_text)
+                
+                if not recommendation:
+                    logger.warning("LLM did not provide a valid recommendation")
+                    return None
+                
+                _RECOMMENDATION_CACHE.set(cache_key, recommendation)
             
-            if not recommendation:
-                logger.warning("LLM did not provide a valid recommendation")
-                return None
+            return self._chart_from_recommendation(recommendation, columns, rows, column_metadata)
             
-            # Check if AI decided no chart is needed
-            if recommendation.chart_type == "none":
-                logger.info(f"AI decided no chart needed: {recommendation.reasoning}")
-                return None
+        except Exception as e:
+            logger.error(f"AI chart selection failed: {e}")
+            return None
+    
+    async def aselect_chart(
+        self,
+        columns: List[str],
+        rows: List[List[Any]],
+        column_metadata: List[ColumnMetadata],
+        question: Optional[str] = None,
+        max_analyze: int = 100
+    ) -> Optional[ChartConfig]:
+        """
+        Async select_chart: the blocking LLM call runs in a worker thread.
+        
+        Args/Returns: as select_chart
+        """
+        return await asyncio.to_thread(
+            self.select_chart,
+            columns,
+            rows,
+            column_metadata,
+            question,
+            max_analyze
+        )
+    
+    async def select_charts_parallel(
+        self,
+        queries: List[Dict[str, Any]],
+        max_concurrency: int = Config.LLM_MAX_CONCURRENCY
+    ) -> List[Optional[ChartConfig]]:
+        """
+        Select charts for several query results with concurrent LLM calls.
+        
+        Args:
+            queries: Keyword arguments for select_chart, one dict per result
+            max_concurrency: Most LLM calls in flight at once (provider rate limits)
             
-            # Build ChartConfig from recommendation
-            chart = self._build_chart_config(
-                recommendation,
-                columns,
-                rows,
-                column_metadata
-            )
+        Returns:
+            ChartConfig (or None) for each query, in the same order
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def select(query: Dict[str, Any]) -> Optional[ChartConfig]:
+            async with semaphore:
+                return await self.aselect_chart(**query)
+        
+        return list(await asyncio.gather(*(select(query) for query in queries)))
+    
+    def select_charts_batch(
+        self,
+        queries: List[Dict[str, Any]],
+        max_analyze: int = 100
+    ) -> List[Optional[ChartConfig]]:
+        """
+        Select charts for several query results with a single LLM call.
+        
+        Cached shapes are answered without the LLM; the remaining results
+        (one per distinct shape and question) share one prompt, so the static
+        instructions and the network round-trip are paid once, not per result.
+        
+        Args:
+            queries: Dicts with 'columns', 'rows', 'column_metadata' and an
+                     optional 'question', as select_chart takes them
+            max_analyze: Max rows per result to send to LLM (default 100)
             
-            if chart:
-                logger.info(
-                    f"AI recommended {chart.type} chart: {chart.title} "
-                    f"(confidence: {chart.confidence:.0%}, reasoning: {recommendation.reasoning[:100]})"
+        Returns:
+            ChartConfig (or None) for each query, in the same order
+        """
+        recommendations: List[Optional[ChartRecommendation]] = [None] * len(queries)
+        pending: Dict[Hashable, List[int]] = {}
+        
+        for i, query in enumerate(queries):
+            if not query['rows'] or not query['columns']:
+                continue
+            recommendations[i] = self._rule_based_recommendation(query['rows'], query['column_metadata'])
+            if recommendations[i] is not None:
+                continue
+            cache_key = self._cache_key(
+                query['columns'], query['rows'], query['column_metadata'], query.get('question')
+            )
+            recommendations[i] = _RECOMMENDATION_CACHE.get(cache_key)
+            if recommendations[i] is None:
+                pending.setdefault(cache_key, []).append(i)
+        
+        if pending:
+            sections = []
+            for n, indices in enumerate(pending.values(), 1):
+                query = queries[indices[0]]
+                data_summary = self._build_data_summary(
+                    query['columns'],
+                    query['rows'][:max_analyze],
+                    query['column_metadata']
                 )
+                prompt = self._build_chart_selection_prompt(data_summary, query.get('question'))
+                sections.append(f"### Query {n}\n{prompt}")
+            sections.append(
+                f"Respond with a JSON array of {len(pending)} objects in the same order as the queries."
+            )
             
-            return chart
-            
-            return chart
+            try:
+                response_text, provider = self.llm.generate_content(
+                    "\n\n".join(sections),
+                    system_message=_CHART_SELECTION_SYSTEM_PROMPT
+                )
+                logger.info(f"Batched chart selection for {len(pending)} results using {provider}")
+                parsed = self._parse_recommendations(response_text, len(pending))
+            except Exception as e:
+                logger.error(f"AI batch chart selection failed: {e}")
+                parsed = [None] * len(pending)
             
-        except Exception as e:
-            logger.error(f"AI chart selection failed: {e}")
+            for (cache_key, indices), recommendation in zip(pending.items(), parsed):
+                if recommendation is None:
+                    continue
+                _RECOMMENDATION_CACHE.set(cache_key, recommendation)
+                for i in indices:
+                    recommendations[i] = recommendation
+        
+        charts = []
+        for query, recommendation in zip(queries, recommendations):
+            chart = None
+            if recommendation is not None:
+                try:
+                    chart = self._chart_from_recommendation(
+                        recommendation,
+                        query['columns'],
+                        query['rows'],
+                        query['column_metadata']
+                    )
+                except Exception as e:
+                    logger.error(f"AI chart selection failed: {e}")
+            charts.append(chart)
+        return charts
+    
+    @staticmethod
+    def _rule_based_recommendation(
+        rows: List[List[Any]],
+        column_metadata: List[ColumnMetadata]
+    ) -> Optional[ChartRecommendation]:
+        """
+        Decide unambiguous result shapes without the LLM.
+        
+        - A single row → no chart
+        - Exactly one date column and one numeric column → line
+        - Exactly one categorical column (≤ 20 values) and one numeric column → bar
+        
+        Returns:
+            ChartRecommendation, or None when the shape needs the LLM
+        """
+        if len(rows) <= 1:
+            return ChartRecommendation(
+                chart_type="none",
+                reasoning="Single row result (rule)",
+                confidence=0.9,
+                x_column="",
+                y_columns=[],
+                title=""
+            )
+        
+        if len(column_metadata) != 2:
+            return None
+        
+        numeric = [meta for meta in column_metadata if meta.is_numeric()]
+        if len(numeric) != 1:
+            return None
+        x_meta = next(meta for meta in column_metadata if meta is not numeric[0])
+        y_name = numeric[0].name
+        
+        if x_meta.is_temporal():
+            return ChartRecommendation(
+                chart_type="line",
+                reasoning="Numeric values over a date column (rule)",
+                confidence=0.9,
+                x_column=x_meta.name,
+                y_columns=[y_name],
+                title=f"{y_name} over {x_meta.name}"
+            )
+        
+        if x_meta.is_categorical() and x_meta.distinct_count <= _RULE_MAX_BAR_CATEGORIES:
+            return ChartRecommendation(
+                chart_type="bar",
+                reasoning="One numeric value per category (rule)",
+                confidence=0.9,
+                x_column=x_meta.name,
+                y_columns=[y_name],
+                title=f"{y_name} by {x_meta.name}"
+            )
+        
+        return None
+    
+    @staticmethod
+    def _cache_key(
+        columns: List[str],
+        rows: List[List[Any]],
+        column_metadata: List[ColumnMetadata],
+        question: Optional[str]
+    ) -> Hashable:
+        """
+        Recommendation cache key: result shape, cardinality and normalized question.
+        
+        Cardinality is bucketed: the row count, and the distinct count of the
+        likely x column (first non-numeric one) capped at the pie/bar limits.
+        """
+        x_meta = next(
+            (meta for meta in column_metadata if not meta.is_numeric()),
+            column_metadata[0] if column_metadata else None
+        )
+        distinct_count = x_meta.distinct_count if x_meta else 0
+        return (
+            tuple(columns),
+            tuple(meta.inferred_type for meta in column_metadata),
+            bisect_left(_ROW_COUNT_BUCKETS, len(rows)),
+            bisect_left(_DISTINCT_COUNT_BUCKETS, distinct_count),
+            normalize_question(question or "")
+        )
+    
+    def _chart_from_recommendation(
+        self,
+        recommendation: ChartRecommendation,
+        columns: List[str],
+        rows: List[List[Any]],
+        column_metadata: List[ColumnMetadata]
+    ) -> Optional[ChartConfig]:
+        """Build the chart for one result set, or None if AI chose no chart."""
+        # Check if AI decided no chart is needed
+        if recommendation.chart_type == "none":
+            logger.info(f"AI decided no chart needed: {recommendation.reasoning}")
             return None
+        
+        # Build ChartConfig from recommendation
+        chart = self._build_chart_config(
+            recommendation,
+            columns,
+            rows,
+            column_metadata
+        )
+        
+        if chart:
+            logger.info(
+                f"AI recommended {chart.type} chart: {chart.title} "
+                f"(confidence: {chart.confidence:.0%}, reasoning: {recommendation.reasoning[:100]})"
+            )
+        
+        return chart
     
     def _build_data_summary(
         self,
@@ -130,167 +469,149 @@ class AIChartSelector:
         rows: List[List[Any]],
         column_metadata: List[ColumnMetadata]
     ) -> str:
-        """Build concise data summary for LLM."""
-        summary_parts = []
+        """
+        Build concise data summary for LLM.
         
-        # Dataset shape
-        summary_parts.append(f"Dataset: {len(rows)} rows × {len(columns)} columns")
+        One line of statistics per column; the chart type depends on the
+        column types and cardinalities, not on raw rows, so none are sent.
+        """
+        header = [f"Dataset: {len(rows)} rows × {len(columns)} columns", "Columns:"]
+        column_lines = []
+        samples = []
         
-        # Column details
-        summary_parts.append("\nColumns:")
         for col_meta in column_metadata:
-            col_desc = (
-                f"  - {col_meta.name}: {col_meta.inferred_type} "
-                f"({col_meta.distinct_count} distinct values"
-            )
+            fields = [
+                f"  - {col_meta.name}",
+                col_meta.inferred_type,
+                f"{col_meta.distinct_count} distinct"
+            ]
             if col_meta.null_count > 0:
-                col_desc += f", {col_meta.null_count} nulls"
-            col_desc += ")"
+                fields.append(f"{col_meta.null_count} nulls")
             
-            # Add sample values
-            sample_str = ", ".join(str(v) for v in col_meta.sample_values[:5])
-            col_desc += f"\n    Samples: {sample_str}"
+            if col_meta.is_numeric():
+                values = [
+                    row[col_meta.index] for row in rows
+                    if isinstance(row[col_meta.index], (int, float))
+                ]
+                if values:
+                    fields.append(
+                        f"min {min(values):.4g}, max {max(values):.4g}, "
+                        f"mean {sum(values) / len(values):.4g}"
+                    )
+                samples.append("")
+            else:
+                samples.append(" | e.g. " + ", ".join(map(self._format_sample, col_meta.sample_values[:3])))
             
-            summary_parts.append(col_desc)
+            column_lines.append(" | ".join(fields))
         
-        # Sample data (first 5 rows)
-        summary_parts.append("\nSample Data:")
-        for i, row in enumerate(rows[:5]):
-            row_dict = dict(zip(columns, row))
-            summary_parts.append(f"  Row {i+1}: {row_dict}")
+        # Over budget: drop example values, last columns first
+        lines = header + column_lines
+        length = sum(map(len, lines)) + len(lines) - 1 + sum(map(len, samples))
+        for i in reversed(range(len(samples))):
+            if length <= _MAX_SUMMARY_CHARS:
+                break
+            length -= len(samples[i])
+            samples[i] = ""
         
-        return "\n".join(summary_parts)
+        return "\n".join(header + [line + sample for line, sample in zip(column_lines, samples)])
+    
+    @staticmethod
+    def _format_sample(value: Any) -> str:
+        """Compact prompt form of a sample value."""
+        if isinstance(value, float):
+            return f"{value:.4g}"
+        if isinstance(value, datetime):
+            return value.date().isoformat()
+        if isinstance(value, date):
+            return value.isoformat()
+        text = str(value)
+        if len(text) > _MAX_SAMPLE_CHARS:
+            return text[:_MAX_SAMPLE_CHARS - 1] + "…"
+        return text
     
     def _build_chart_selection_prompt(
         self,
         data_summary: str,
         question: Optional[str]
     ) -> str:
-        """Build prompt for LLM chart selection."""
-        prompt = f"""You are a data visualization expert. Analyze this query result and determine if a chart would be helpful.
-
-{data_summary}
-
-{"User's Question: " + question if question else ""}
-
-**Decision Process:**
-1. First, decide if this data should be visualized at all
-2. If yes, select the BEST chart type
-
-**When NOT to visualize (use `none`):**
-- Single row/value results (e.g., "How many products?" → just a number)
-- Text-heavy data (employee names, descriptions)
-- Simple lookup results (e.g., "What is X's salary?" → one value)
-- Already clear from the data table
-
-**When TO visualize:**
-- Comparisons between categories
-- Trends over time
-- Distributions or patterns
-- Part-to-whole relationships
-
-**Available Chart Types:**
-- `line`: Time series, trends over time (requires temporal x-axis)
-- `bar`: Vertical bar for comparing categories (standard, up to 20 items)
-- `horizontal_bar`: Horizontal bars (better for long labels, many items, or rankings)
-- `pie`: Part-to-whole, percentages (best for 3-6 categories only)
-- `doughnut`: Modern alternative to pie (better for 4-8 categories)
-- `histogram`: Numeric distribution (single numeric column)
-- `area`: Filled line chart for cumulative/volume data
-- `stacked_bar`: Part-to-whole over categories (multiple series)
-- `stacked_area`: Cumulative trends over time
-- `grouped_bar`: Side-by-side comparison of multiple metrics
-- `combo`: Mixed bar + line (different scale metrics)
-- `scatter`: Correlation between two numeric variables
-- `none`: No visualization needed - data is clear from table
-
-**Best Practices:**
-- Pie/Doughnut: Only 3-8 categories showing proportions
-- Horizontal Bar: Use when labels are long (>15 chars) or there are many items (>10)
-- Scatter: Use for "X vs Y" questions to show correlation
-- Combo: Use when comparing metrics with different scales (e.g., sales $ and units)
-- None: Use for single values, text data, or when table is clearer
-- Bar charts: Better for comparing categories or when values don't sum to 100%
-- Line charts: Require temporal x-axis (dates/times)
-- Consider if the user's question really needs a chart
-
-**Your Response Format (JSON):**
-{{
-  "chart_type": "bar|pie|line|histogram|none",
-  "reasoning": "Brief explanation why this chart type is best (or why no chart is needed)",
-  "x_column": "column name for x-axis (or empty string if none)",
-  "y_columns": ["column name(s) for y-axis (or empty array if none)"],
-  "title": "Descriptive chart title (or empty string if none)"
-}}
-
-**Critical Rules:**
-1. Simple counts/single values → use `none`
-2. Comparing categories WITHOUT proportions → use `bar` not `pie`
-3. Showing top/bottom rankings → use `bar` not `pie`
-4. If >7 categories → NEVER use `pie`, use `bar`
-5. Trends over time → use `line`
-6. When in doubt, use `none` - let the data table speak for itself
-
-Respond ONLY with valid JSON, no other text."""
-
+        """Build the per-call part of the chart selection prompt."""
+        prompt = data_summary
+        if question:
+            prompt += f"\n\nUser's Question: {question}"
         return prompt
     
     def _parse_recommendation(self, response_text: str) -> Optional[ChartRecommendation]:
         """Parse LLM response into ChartRecommendation."""
         try:
-            # Extract JSON from response
-            import json
-            import re
-            
-            # Try to find JSON in response
-            json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-            if not json_match:
-                logger.warning(f"No JSON found in LLM response: {response_text[:200]}")
-                return None
+            return self._recommendation_from_dict(parse_json(response_text))
             
-            data = json.loads(json_match.group())
-            
-            # Validate required fields
-            required = ["chart_type", "reasoning", "x_column", "y_columns", "title"]
-            if not all(k in data for k in required):
-                logger.warning(f"Missing required fields in recommendation: {data}")
-                return None
-            
-            # Validate chart_type
-            valid_types = ["line", "bar", "pie", "histogram", "none"]
-            if data["chart_type"] not in valid_types:
-                logger.warning(f"Invalid chart type: {data['chart_type']}")
-                return None
-            
-            # If no chart needed, allow empty fields
-            if data["chart_type"] == "none":
-                return ChartRecommendation(
-                    chart_type="none",
-                    reasoning=data.get("reasoning", "No visualization needed"),
-                    confidence=0.9,
-                    x_column="",
-                    y_columns=[],
-                    title=""
-                )
+        except Exception as e:
+            logger.error(f"Failed to parse recommendation: {e}\nResponse: {response_text[:500]}")
+            return None
+    
+    def _parse_recommendations(
+        self,
+        response_text: str,
+        expected: int
+    ) -> List[Optional[ChartRecommendation]]:
+        """Parse a batched LLM response (JSON array) into recommendations."""
+        try:
+            items = parse_json(response_text, opener='[')
+            if not isinstance(items, list) or len(items) != expected:
+                logger.warning(f"Expected {expected} recommendations in LLM response: {response_text[:200]}")
+                return [None] * expected
             
-            # For actual charts, validate columns exist
-            if not data.get("x_column") or not data.get("y_columns"):
-                logger.warning(f"Missing column information for chart type {data['chart_type']}: {data}")
-                return None
+            recommendations = []
+            for item in items:
+                try:
+                    recommendations.append(self._recommendation_from_dict(item))
+                except Exception as e:
+                    logger.warning(f"Skipping invalid recommendation {item}: {e}")
+                    recommendations.append(None)
+            return recommendations
             
-            # Build recommendation
+        except Exception as e:
+            logger.error(f"Failed to parse recommendations: {e}\nResponse: {response_text[:500]}")
+            return [None] * expected
+    
+    def _recommendation_from_dict(self, data: Dict[str, Any]) -> Optional[ChartRecommendation]:
+        """Validate one parsed JSON recommendation."""
+        # Validate required fields
+        if not _REQUIRED_FIELDS.issubset(data):
+            logger.warning(f"Missing required fields in recommendation: {data}")
+            return None
+        
+        # Validate chart_type
+        if data["chart_type"] not in _VALID_CHART_TYPES:
+            logger.warning(f"Invalid chart type: {data['chart_type']}")
+            return None
+        
+        # If no chart needed, allow empty fields
+        if data["chart_type"] == "none":
             return ChartRecommendation(
-                chart_type=data["chart_type"],
-                reasoning=data["reasoning"],
-                confidence=0.9,  # High confidence in AI decision
-                x_column=data["x_column"],
-                y_columns=data["y_columns"] if isinstance(data["y_columns"], list) else [data["y_columns"]],
-                title=data["title"]
+                chart_type="none",
+                reasoning=data.get("reasoning", "No visualization needed"),
+                confidence=0.9,
+                x_column="",
+                y_columns=[],
+                title=""
             )
-            
-        except Exception as e:
-            logger.error(f"Failed to parse recommendation: {e}\nResponse: {response_text[:500]}")
+        
+        # For actual charts, validate columns exist
+        if not data.get("x_column") or not data.get("y_columns"):
+            logger.warning(f"Missing column information for chart type {data['chart_type']}: {data}")
             return None
+        
+        # Build recommendation
+        return ChartRecommendation(
+            chart_type=data["chart_type"],
+            reasoning=data["reasoning"],
+            confidence=0.9,  # High confidence in AI decision
+            x_column=data["x_column"],
+            y_columns=data["y_columns"] if isinstance(data["y_columns"], list) else [data["y_columns"]],
+            title=data["title"]
+        )
+
     
     def _build_chart_config(
         self,
@@ -304,24 +625,23 @@ Respond ONLY with valid JSON, no other text."""
         if recommendation.chart_type == "none":
             return None
         
-        # Find column indices
+        # Find column indices (first occurrence wins, as with list.index)
+        column_index = {name: i for i, name in reversed(list(enumerate(columns)))}
+        keys = (recommendation.x_column, *recommendation.y_columns)
         try:
-            x_idx = columns.index(recommendation.x_column)
-            y_indices = [columns.index(y) for y in recommendation.y_columns]
-        except ValueError as e:
+            indices = [column_index[key] for key in keys]
+        except KeyError as e:
             logger.error(f"Column not found: {e}")
             return None
         
-        # Build data array
-        data = []
-        for row in rows:
-            point = {recommendation.x_column: row[x_idx]}
-            for y_col, y_idx in zip(recommendation.y_columns, y_indices):
-                point[y_col] = row[y_idx]
-            data.append(point)
+        # Build data array: one point dict per row, values picked in a single call
+        pick = itemgetter(*indices)
+        data = [dict(zip(keys, pick(row))) for row in rows]
         
         # Determine x_type
-        x_meta = next((m for m in column_metadata if m.name == recommendation.x_column), None)
+        # Metadata is one entry per column, in column order: reuse the x index
+        x_idx = indices[0]
+        x_meta = column_metadata[x_idx] if x_idx < len(column_metadata) else None
         if x_meta:
             if x_meta.is_temporal():
                 x_type = "date"
@@ -21,6 +21,16 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Common date patterns, compiled once into a single alternation
+_DATE_PATTERN = re.compile("|".join([
+    r'\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
+    r'\d{4}-\d{2}',        # YYYY-MM (month aggregations)
+    r'\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
+    r'\d{4}/\d{2}',        # YYYY/MM (month aggregations)
+    r'\d{2}-\d{2}-\d{4}',  # DD-MM-YYYY
+    r'\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
+]))
+
 ChartType = Literal[
     "line",           # Time series trends
     "bar",            # Vertical bar chart
@@ -64,7 +74,7 @@ class ColumnMetadata:
         return self.inferred_type == "categorical"
 
 
-@dataclass
+@dataclass(slots=True)
 class ChartConfig:
     """Configuration for a single chart."""
     
@@ -121,8 +131,9 @@ class ChartDetector:
     
     def _analyze_columns(self) -> None:
         """Analyze each column to infer types and metadata."""
-        for idx, col_name in enumerate(self.columns):
-            values = [row[idx] for row in self.rows if row[idx] is not None]
+        # Transpose once (zip runs in C) instead of indexing every row per column
+        for idx, (col_name, column) in enumerate(zip(self.columns, zip(*self.rows))):
+            values = [value for value in column if value is not None]
             null_count = self.row_count - len(values)
             
             # Sample up to 100 values for analysis
@@ -188,17 +199,7 @@ class ChartDetector:
         if not isinstance(value, str):
             return False
         
-        # Common date patterns
-        patterns = [
-            r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-            r'^\d{4}-\d{2}$',        # YYYY-MM (month aggregations)
-            r'^\d{4}/\d{2}/\d{2}$',  # YYYY/MM/DD
-            r'^\d{4}/\d{2}$',        # YYYY/MM (month aggregations)
-            r'^\d{2}-\d{2}-\d{4}$',  # DD-MM-YYYY
-            r'^\d{2}/\d{2}/\d{4}$',  # MM/DD/YYYY
-        ]
-        
-        return any(re.match(pattern, value.strip()) for pattern in patterns)
+        return _DATE_PATTERN.fullmatch(value.strip()) is not None
     
     def _looks_like_datetime(self, value: str) -> bool:
         """Check if string looks like a datetime."""
@@ -798,3 +799,52 @@ def detect_charts_from_results(
         for cd in chart_dicts:
             cd['currency_symbol'] = currency_symbol
     return chart_dicts
+
+
+def detect_charts_batch(
+    results: List[Dict[str, Any]],
+    currency_symbol: Optional[str] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Detect charts for several query results with one AI selection call.
+    
+    Results the AI gives no chart for (or all of them, if the call fails)
+    fall back to heuristics, as in detect_charts_from_results.
+    
+    Args:
+        results: Dicts with 'columns', 'rows' and an optional 'question'
+        currency_symbol: Currency symbol attached to every chart
+        
+    Returns:
+        List of chart config dicts for each result, in the same order
+    """
+    detectors = [
+        ChartDetector(result['columns'], result['rows'], question=result.get('question'))
+        for result in results
+    ]
+    
+    ai_charts: List[Optional[ChartConfig]] = [None] * len(detectors)
+    try:
+        from src.core.ai_chart_selector import AIChartSelector
+        
+        ai_charts = AIChartSelector().select_charts_batch([
+            {
+                'columns': detector.columns,
+                'rows': detector.rows,
+                'column_metadata': detector.column_metadata,
+                'question': detector.question,
+            }
+            for detector in detectors
+        ])
+    except Exception as e:
+        logger.warning(f"AI batch chart selection failed, falling back to heuristics: {e}")
+    
+    all_chart_dicts = []
+    for detector, ai_chart in zip(detectors, ai_charts):
+        charts = [ai_chart] if ai_chart else detector.detect_charts(use_ai=False)
+        chart_dicts = [chart.to_dict() for chart in charts]
+        if currency_symbol:
+            for cd in chart_dicts:
+                cd['currency_symbol'] = currency_symbol
+        all_chart_dicts.append(chart_dicts)
+    return all_chart_dicts
@@ -14,20 +14,50 @@ from src.utils.exceptions import DatabaseError
 
 logger = setup_logger(__name__)
 
+# SQLite's default SQLITE_MAX_COMPOUND_SELECT
+MAX_COMPOUND_SELECT = 500
+
+# sqlite_master filter for user tables (excludes sqlite_sequence, sqlite_stat1, ...)
+USER_TABLES_FILTER = "type='table' AND name NOT LIKE 'sqlite\\_%' ESCAPE '\\'"
+
+
+def quote_identifier(name: str) -> str:
+    """Quote a table/column name for safe interpolation into SQL"""
+    return '"' + name.replace('"', '""') + '"'
+
 
 class DatabaseManager:
     """Manages database connections and operations"""
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(self, db_path: Optional[Path] = None, pool: Optional[Any] = None):
         """
         Initialize database manager
         
         Args:
             db_path: Path to database file. Uses config default if None.
+            pool: Optional connection pool (anything with a connection()
+                  context manager). Connections are borrowed from it
+                  instead of being opened per call.
         """
         self.db_path = db_path or Config.get_db_path()
+        self.pool = pool
         logger.debug(f"DatabaseManager initialized with path: {self.db_path}")
     
+    @contextmanager
+    def _open_connection(self):
+        """Borrow a pooled connection, or open a fresh one"""
+        if self.pool is not None:
+            with self.pool.connection() as conn:
+                yield conn
+            return
+        
+        conn = sqlite3.connect(str(self.db_path))
+        conn.row_factory = sqlite3.Row
+        try:
+            yield conn
+        finally:
+            conn.close()
+    
     @contextmanager
     def get_connection(self):
         """
@@ -36,28 +66,32 @@ class DatabaseManager:
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = None
         try:
-            conn = sqlite3.connect(str(self.db_path))
-            conn.row_factory = sqlite3.Row
-            yield conn
-            conn.commit()
+            with self._open_connection() as conn:
+                try:
+                    yield conn
+                    conn.commit()
+                except sqlite3.Error:
+                    conn.rollback()
+                    raise
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"Database error: {e}")
             raise DatabaseError(f"Database operation failed: {e}")
-        finally:
-            if conn:
-                conn.close()
     
-    def execute_query(self, query: str, params: tuple = ()) -> List[Dict[str, Any]]:
+    def execute_query(
+        self,
+        query: str,
+        params: tuple = (),
+        max_rows: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results
         
         Args:
             query: SQL query string
             params: Query parameters
+            max_rows: Stop reading after this many rows (None reads them all);
+                      SQLite steps lazily, so the rest of the scan never runs
             
         Returns:
             List of result rows as dictionaries with intelligently rounded numbers
@@ -105,7 +139,12 @@ class DatabaseManager:
             cursor.execute(query, params)
 
             columns = [desc[0] for desc in cursor.description] if cursor.description else []
-            results = cursor.fetchall()
+            if max_rows is None:
+                results = cursor.fetchall()
+            else:
+                results = cursor.fetchmany(max_rows)
+                # Reset the half-read statement so it releases its read lock
+                cursor.close()
 
             # Convert to dictionaries with intelligent number rounding
             processed_results = []
@@ -160,7 +199,7 @@ class DatabaseManager:
         Returns:
             List of table names
         """
-        query = "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+        query = f"SELECT name FROM sqlite_master WHERE {USER_TABLES_FILTER} ORDER BY name"
         results = self.execute_query(query)
         return [row['name'] for row in results]
     
@@ -191,6 +230,19 @@ class DatabaseManager:
         result = self.execute_query(query)
         return result[0]['count'] if result else 0
     
+    def get_row_counts(self, tables: List[str]) -> Dict[str, int]:
+        """
+        Get number of rows of several tables in one query
+        
+        Args:
+            tables: Table names
+            
+        Returns:
+            Dictionary mapping table name to row count
+        """
+        with self.get_connection() as conn:
+            return self.count_rows(conn, tables)
+    
     def table_exists(self, table_name: str) -> bool:
         """
         Check if a table exists
@@ -222,21 +274,37 @@ class DatabaseManager:
         if not self.database_exists():
             raise DatabaseError("Database does not exist")
         
-        tables = self.get_tables()
+        with self.get_connection() as conn:
+            return self.read_schema(conn)
+    
+    @staticmethod
+    def read_schema(conn: sqlite3.Connection) -> List[Dict[str, Any]]:
+        """
+        Read database schema over an existing connection
+        
+        Args:
+            conn: Open SQLite connection (e.g. borrowed from a pool)
+            
+        Returns:
+            List of tables with their schema information
+        """
+        tables = DatabaseManager.table_names(conn)
         schema = []
         
+        row_counts = DatabaseManager.count_rows(conn, tables)
+        
         for table in tables:
-            columns = self.get_table_info(table)
-            row_count = self.get_row_count(table)
+            columns = conn.execute(f'PRAGMA table_info({quote_identifier(table)})').fetchall()
+            row_count = row_counts[table]
             
             schema.append({
                 'name': table,
                 'columns': [
                     {
-                        'name': col['name'],
-                        'type': col['type'],
-                        'notnull': bool(col['notnull']),
-                        'pk': bool(col['pk'])
+                        'name': col[1],
+                        'type': col[2],
+                        'notnull': bool(col[3]),
+                        'pk': bool(col[5])
                     }
                     for col in columns
                 ],
@@ -245,6 +313,96 @@ class DatabaseManager:
         
         return schema
     
+    @staticmethod
+    def table_names(conn: sqlite3.Connection) -> List[str]:
+        """
+        List table names over an existing connection
+        
+        SQLite's internal tables (sqlite_sequence, sqlite_stat1, ...) are
+        not user data and are left out.
+        
+        Args:
+            conn: Open SQLite connection
+            
+        Returns:
+            Table names, sorted
+        """
+        return [
+            row[0] for row in conn.execute(
+                f"SELECT name FROM sqlite_master WHERE {USER_TABLES_FILTER} ORDER BY name"
+            )
+        ]
+    
+    @staticmethod
+    def count_tables(conn: sqlite3.Connection) -> int:
+        """
+        Count tables without reading their definitions
+        
+        Args:
+            conn: Open SQLite connection
+            
+        Returns:
+            Number of tables in the database
+        """
+        return conn.execute(f"SELECT count(*) FROM sqlite_master WHERE {USER_TABLES_FILTER}").fetchone()[0]
+    
+    @staticmethod
+    def count_rows(conn: sqlite3.Connection, tables: List[str]) -> Dict[str, int]:
+        """
+        Count rows of many tables in one round-trip
+        
+        Builds a single UNION ALL of COUNT(*) subqueries (batched to stay
+        under SQLite's compound SELECT limit).
+        
+        Args:
+            conn: Open SQLite connection
+            tables: Table names to count
+            
+        Returns:
+            Dictionary mapping table name to row count
+        """
+        counts: Dict[str, int] = {}
+        
+        for start in range(0, len(tables), MAX_COMPOUND_SELECT):
+            batch = tables[start:start + MAX_COMPOUND_SELECT]
+            query = " UNION ALL ".join(
+                f"SELECT {i}, COUNT(*) FROM {quote_identifier(table)}"
+                for i, table in enumerate(batch)
+            )
+            for i, count in conn.execute(query):
+                counts[batch[i]] = count
+        
+        return counts
+    
+    @staticmethod
+    def estimate_rows(conn: sqlite3.Connection, tables: List[str]) -> Dict[str, int]:
+        """
+        Approximate row counts from ANALYZE statistics
+        
+        sqlite_stat1 stores each table's row count as the first number of
+        its stat column, so this is a lookup instead of a COUNT(*) scan.
+        Tables without statistics (never analyzed) are counted exactly.
+        
+        Args:
+            conn: Open SQLite connection
+            tables: Table names to count
+            
+        Returns:
+            Dictionary mapping table name to (approximate) row count
+        """
+        estimates: Dict[str, int] = {}
+        try:
+            for table, stat in conn.execute("SELECT tbl, stat FROM sqlite_stat1"):
+                estimates.setdefault(table, int(stat.split(" ", 1)[0]))
+        except sqlite3.OperationalError:
+            pass  # No sqlite_stat1 table - database was never analyzed
+        
+        counts = {table: estimates[table] for table in tables if table in estimates}
+        missing = [table for table in tables if table not in counts]
+        if missing:
+            counts.update(DatabaseManager.count_rows(conn, missing))
+        return counts
+    
     def get_schema_summary(self) -> Dict[str, Any]:
         """
         Get complete database schema summary
@@ -256,11 +414,12 @@ class DatabaseManager:
             raise DatabaseError("Database does not exist")
         
         tables = self.get_tables()
+        row_counts = self.get_row_counts(tables)
         schema = {}
         
         for table in tables:
             columns = self.get_table_info(table)
-            row_count = self.get_row_count(table)
+            row_count = row_counts[table]
             
             schema[table] = {
                 'columns': [
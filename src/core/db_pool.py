@@ -0,0 +1,239 @@
+"""
+SQLite Connection Pool
+Keeps pre-opened connections per database file so API and CLI queries
+don't pay for sqlite3.connect() and a cold page cache on every call
+"""
+
+import asyncio
+import queue
+import sqlite3
+import threading
+from contextlib import asynccontextmanager, contextmanager
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Iterator
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Pool sizing per database file
+MIN_POOL_SIZE = 4
+MAX_POOL_SIZE = 16
+ACQUIRE_TIMEOUT_SECONDS = 30.0
+
+# Prepared statements kept per connection (sqlite3 default is 128); schema,
+# count and example queries repeat verbatim and skip re-parsing on a hit
+STATEMENT_CACHE_SIZE = 1024
+
+# Applied to every pooled connection
+CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA cache_size=-64000",  # ~64 MB page cache per connection
+    "PRAGMA temp_store=MEMORY",  # Sorts/GROUP BY temp tables stay off disk
+    "PRAGMA mmap_size=268435456",  # Read pages via a 256 MB memory map instead of read()
+)
+
+
+def read_only_uri(db_path: str) -> str:
+    """SQLite URI opening a database file read-only (never creates it)"""
+    return Path(db_path).resolve().as_uri() + "?mode=ro"
+
+
+class ConnectionPool:
+    """Thread-safe pool of SQLite connections for a single database file"""
+
+    def __init__(
+        self,
+        db_path: str,
+        min_size: int = MIN_POOL_SIZE,
+        max_size: int = MAX_POOL_SIZE,
+        timeout: float = ACQUIRE_TIMEOUT_SECONDS,
+        read_only: bool = True
+    ):
+        """
+        Initialize connection pool
+
+        Args:
+            db_path: Path to SQLite database file
+            min_size: Connections opened by prefill()
+            max_size: Upper bound on open connections
+            timeout: Seconds to wait for a free connection when exhausted
+            read_only: Open connections with mode=ro (the API only reads;
+                       this also rejects any write an LLM-generated query attempts)
+        """
+        self.db_path = str(db_path)
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.read_only = read_only
+        # LIFO keeps the most recently used (warmest) connections in rotation
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._size = 0
+        self._closed = False
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        """Number of open connections (idle + checked out)"""
+        return self._size
+
+    def _reserve(self) -> bool:
+        """Reserve a slot for a new connection if below max_size"""
+        with self._lock:
+            if self._size >= self.max_size:
+                return False
+            self._size += 1
+            return True
+
+    def _open(self) -> sqlite3.Connection:
+        """Open a connection into a previously reserved slot"""
+        try:
+            if self.read_only:
+                conn = sqlite3.connect(
+                    read_only_uri(self.db_path),
+                    uri=True,
+                    check_same_thread=False,
+                    cached_statements=STATEMENT_CACHE_SIZE
+                )
+            else:
+                conn = sqlite3.connect(
+                    self.db_path,
+                    check_same_thread=False,
+                    cached_statements=STATEMENT_CACHE_SIZE
+                )
+            conn.row_factory = sqlite3.Row
+            for pragma in CONNECTION_PRAGMAS:
+                conn.execute(pragma)
+            return conn
+        except Exception:
+            with self._lock:
+                self._size -= 1
+            raise
+
+    def prefill(self) -> None:
+        """Open connections until the pool holds min_size"""
+        while self._size < self.min_size and self._reserve():
+            self._idle.put(self._open())
+        logger.debug(f"Connection pool ready for {self.db_path} ({self._size} connections)")
+
+    def get(self, block: bool = True) -> sqlite3.Connection:
+        """
+        Take a connection from the pool
+
+        Args:
+            block: Wait for a connection to be released when the pool is exhausted
+
+        Returns:
+            sqlite3.Connection
+
+        Raises:
+            queue.Empty: If no connection became available
+        """
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        if self._reserve():
+            return self._open()
+
+        if not block:
+            raise queue.Empty
+        return self._idle.get(timeout=self.timeout)
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        """Return a connection to the pool"""
+        if self._closed:
+            conn.close()
+            return
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Context manager borrowing a connection
+
+        Yields:
+            sqlite3.Connection: Pooled connection
+        """
+        conn = self.get()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close(self) -> None:
+        """Close idle connections; checked-out ones close on release"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        self._size = 0
+
+
+# Shared pools, keyed by database file path
+_POOLS: Dict[str, ConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_pool(db_path: str) -> ConnectionPool:
+    """Return the shared pool for a database file, creating it on first use"""
+    key = str(db_path)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(key)
+            if pool is None:
+                pool = _POOLS[key] = ConnectionPool(key)
+    return pool
+
+
+@asynccontextmanager
+async def acquire(db_path: str) -> AsyncIterator[sqlite3.Connection]:
+    """
+    Borrow a pooled connection from async code
+
+    Waiting on an exhausted pool happens in a worker thread so the
+    event loop keeps serving other requests.
+
+    Example:
+        >>> async with acquire(db_path) as conn:
+        ...     conn.execute("SELECT 1").fetchone()
+    """
+    pool = get_pool(db_path)
+    try:
+        conn = pool.get(block=False)
+    except queue.Empty:
+        conn = await asyncio.to_thread(pool.get)
+    try:
+        yield conn
+    finally:
+        pool.release(conn)
+
+
+def prefill(db_paths: Iterable[str]) -> None:
+    """Open min_size connections for each existing database file"""
+    for db_path in db_paths:
+        if Path(db_path).exists():
+            get_pool(db_path).prefill()
+
+
+def close_pool(db_path: str) -> None:
+    """Close and forget the pool for a database file"""
+    with _POOLS_LOCK:
+        pool = _POOLS.pop(str(db_path), None)
+    if pool is not None:
+        pool.close()
+
+
+def close_all() -> None:
+    """Close every pool (application shutdown)"""
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
@@ -47,7 +47,12 @@ class GroqModel:
         self.client = client
         self.model_name = model_name
     
-    def generate_content(self, prompt: str, system_message: str = None) -> GroqResponse:
+    def generate_content(
+        self,
+        prompt: str,
+        system_message: str = None,
+        json_mode: bool = False
+    ) -> GroqResponse:
         """
         Generate content matching Gemini interface with optional system message
         
@@ -58,6 +63,8 @@ class GroqModel:
         Args:
             prompt: Input prompt for generation (user message)
             system_message: Optional system instructions (cached by Groq)
+            json_mode: Constrain output to a single valid JSON object
+                       (the messages must mention JSON)
             
         Returns:
             GroqResponse with .text property
@@ -74,12 +81,17 @@ class GroqModel:
                 messages.append({"role": "system", "content": system_message})
             messages.append({"role": "user", "content": prompt})
             
+            options = {}
+            if json_mode:
+                options["response_format"] = {"type": "json_object"}
+            
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
                 temperature=0.1,  # Low temperature for consistent SQL generation
                 max_tokens=500,   # Sufficient for SQL queries
                 top_p=1,
+                **options
             )
             
             content = response.choices[0].message.content
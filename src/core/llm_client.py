@@ -88,7 +88,12 @@ class UnifiedLLMClient:
                     "Please set GROQ_API_KEY or GOOGLE_API_KEY in .env"
                 )
     
-    def generate_content(self, prompt: str, system_message: str = None) -> Tuple[str, str]:
+    def generate_content(
+        self,
+        prompt: str,
+        system_message: str = None,
+        json_mode: bool = False
+    ) -> Tuple[str, str]:
         """
         Generate content using Groq with rotation, fallback to Gemini with rotation
         
@@ -102,6 +107,8 @@ class UnifiedLLMClient:
         Args:
             prompt: Input prompt for generation (user message)
             system_message: Optional system message (static content for caching)
+            json_mode: Ask the provider for a syntactically valid JSON object
+                       (Groq response_format / Gemini response_mime_type)
         
         Returns:
             Tuple of (generated_text, provider_used)
@@ -127,7 +134,11 @@ class UnifiedLLMClient:
                     start_time = time.time()
                     
                     model = self.groq_client.get_model()
-                    response = model.generate_content(prompt, system_message=system_message)
+                    response = model.generate_content(
+                        prompt,
+                        system_message=system_message,
+                        json_mode=json_mode
+                    )
                     
                     duration = time.time() - start_time
                     logger.info(f"✅ Groq succeeded in {duration:.2f}s (key {self.groq_key_manager.get_key_index()}/{max_groq_attempts})")
@@ -172,6 +183,9 @@ class UnifiedLLMClient:
             gemini_prompt = prompt
             if system_message:
                 gemini_prompt = f"{system_message}\n\n{prompt}"
+            gemini_options = {}
+            if json_mode:
+                gemini_options["generation_config"] = {"response_mime_type": "application/json"}
             
             while gemini_attempts < max_gemini_attempts:
                 try:
@@ -183,7 +197,7 @@ class UnifiedLLMClient:
                     start_time = time.time()
                     
                     model = self.gemini_client.get_model()
-                    response = model.generate_content(gemini_prompt)
+                    response = model.generate_content(gemini_prompt, **gemini_options)
                     
                     duration = time.time() - start_time
                     logger.info(f"✅ Gemini succeeded in {duration:.2f}s (key {self.gemini_key_manager.get_key_index()}/{max_gemini_attempts})")
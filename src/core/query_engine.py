@@ -5,8 +5,10 @@ Uses Groq (primary) with Gemini fallback for both SQL generation and summarizati
 Supports multi-query execution with dependency resolution
 """
 
+import os
 import time
-from typing import Dict, Any, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Hashable
 from datetime import datetime
 from pathlib import Path
 
@@ -16,6 +18,7 @@ from src.core.llm_client import UnifiedLLMClient
 from src.core.sql_generator import SQLGenerator
 from src.core.query_plan import QueryPlan, QueryStep, QueryStatus
 from src.core.analyst import BusinessAnalyst
+from src.utils.cache import TTLCache
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.utils.exceptions import ConfigurationError
@@ -23,6 +26,11 @@ from src.utils.exceptions import ConfigurationError
 logger = setup_logger(__name__)
 
 
+def _copy_results(results: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a step's results so cached rows can't be changed through a plan"""
+    return {"columns": list(results["columns"]), "rows": [list(row) for row in results["rows"]]}
+
+
 class QueryEngine:
     """
     Natural language to SQL query engine using Google Gemini AI
@@ -76,6 +84,11 @@ class QueryEngine:
                 "Run 'python main.py' to generate data first."
             )
         
+        # Step results of executed plans, keyed by database version and plan SQL
+        self._plan_result_cache = TTLCache(maxsize=Config.PLAN_RESULT_CACHE_SIZE)
+        # (mtime_ns, table names) of the last get_available_tables() read
+        self._tables_cache: Optional[tuple] = None
+        
         # Initialize components
         self.api_key_manager = APIKeyManager()
         self.llm_client = UnifiedLLMClient()  # Groq primary + Gemini fallback
@@ -145,6 +158,18 @@ class QueryEngine:
         """
         return self.sql_generator.generate(question)
     
+    def forget_sql(self, question: str) -> None:
+        """
+        Drop the cached SQL for a question so the next ask regenerates it
+        
+        Callers use this when the generated SQL failed to execute; otherwise
+        the broken SQL would be served from cache until it expires.
+        
+        Args:
+            question: Natural language question
+        """
+        self.sql_generator.forget_sql(question)
+    
     def _clean_sql(self, sql: str) -> str:
         """
         Clean and validate SQL (for backward compatibility with tests)
@@ -187,14 +212,13 @@ class QueryEngine:
         
         try:
             start_time = time.time()
-            results = self.db_manager.execute_query(sql)
+            # One row past the cap is enough to tell whether results were truncated
+            results = self.db_manager.execute_query(sql, max_rows=max_results + 1)
             execution_time = time.time() - start_time
             
             # Limit results if needed
             if len(results) > max_results:
-                logger.warning(
-                    f"Results truncated from {len(results)} to {max_results}"
-                )
+                logger.warning(f"Results truncated to {max_results} rows")
                 results = results[:max_results]
                 truncated = True
             else:
@@ -285,6 +309,8 @@ class QueryEngine:
             logger.info(f"Detected data query: {question[:100]}")
             sql = self.generate_sql(question)
             result = self.execute_query(sql, max_results)
+            if not result['success']:
+                self.forget_sql(question)
             result['question'] = question
             result['query_type'] = 'data'
             return result
@@ -307,14 +333,30 @@ class QueryEngine:
         """
         return self.schema_text
     
+    def clear_caches(self) -> None:
+        """Forget cached generated SQL/plans and plan results"""
+        self.sql_generator.clear_cache()
+        self._plan_result_cache.clear()
+        self._tables_cache = None
+    
     def get_available_tables(self) -> List[str]:
         """
         Get list of available tables
         
+        Re-read only when the database file changes (mtime_ns).
+        
         Returns:
             List of table names
         """
-        return self.db_manager.get_tables()
+        try:
+            mtime_ns = os.stat(self.db_manager.db_path).st_mtime_ns
+        except OSError:
+            return self.db_manager.get_tables()
+        
+        cached = self._tables_cache
+        if cached is None or cached[0] != mtime_ns:
+            cached = self._tables_cache = (mtime_ns, self.db_manager.get_tables())
+        return list(cached[1])
     
     def validate_query(self, sql: str) -> bool:
         """
@@ -353,7 +395,8 @@ class QueryEngine:
         """
         Execute a multi-query plan with dependency resolution.
         
-        Executes queries in topological order (dependencies first).
+        Executes queries level by level in dependency order; independent
+        queries within a level run concurrently.
         Supports result substitution via temporary tables/CTEs.
         
         Args:
@@ -379,106 +422,53 @@ class QueryEngine:
         max_results = max_results or Config.MAX_QUERY_RESULTS
         plan_start_time = time.time()
         
-        # Get execution order (topological sort)
-        execution_order = plan.get_execution_order()
-        
-        # Store intermediate results by query ID
+        # An identical plan against an unchanged database returns the same rows
+        cache_key = self._plan_cache_key(plan, max_results)
+        cached_steps = self._plan_result_cache.get(cache_key) if cache_key else None
+        if cached_steps is not None:
+            for query, (sql, results, execution_time_ms) in zip(plan.queries, cached_steps):
+                query.sql = sql
+                query.results = _copy_results(results)
+                query.row_count = len(results["rows"])
+                query.execution_time_ms = execution_time_ms
+                query.status = QueryStatus.COMPLETED
+            plan.total_execution_time_ms = (time.time() - plan_start_time) * 1000
+            logger.info(f"Plan results served from cache: {plan.total_execution_time_ms:.1f}ms total")
+            return plan
+        
+        # Group into dependency levels; queries within a level are independent
+        execution_levels = plan.get_execution_levels()
+        
+        # Store intermediate results by query ID (each step writes only its own key
+        # and reads keys from earlier levels)
         results_cache: Dict[str, Dict[str, Any]] = {}
         
-        # Execute queries in order
-        for query in execution_order:
-            max_retries = Config.MAX_SQL_ERROR_RETRIES if hasattr(Config, 'MAX_SQL_ERROR_RETRIES') else 2
-            retry_count = 0
-            sql = None
-            
-            while retry_count <= max_retries:
-                try:
-                    logger.debug(f"Executing query {query.id}: {query.description}")
-                    query.status = QueryStatus.EXECUTING
-                    
-                    # Replace result references in SQL (e.g., "FROM q1" -> temp table)
-                    if retry_count == 0:
-                        # First attempt: use original SQL
-                        sql = self._resolve_dependencies(query, results_cache)
-                    # else: sql already contains the AI-corrected version from previous iteration
-                    
-                    # Execute query
-                    start_time = time.time()
-                    raw_results = self.db_manager.execute_query(sql)
-                    execution_time = (time.time() - start_time) * 1000  # milliseconds
-                    
-                    # Store results
-                    query_results = {
-                        "columns": list(raw_results[0].keys()) if raw_results else [],
-                        "rows": [list(row.values()) for row in raw_results] if raw_results else []
-                    }
-                    
-                    # Apply max_results only to final query
-                    if query.id == plan.final_query_id and len(query_results["rows"]) > max_results:
-                        logger.warning(
-                            f"Final query results truncated from {len(query_results['rows'])} to {max_results}"
-                        )
-                        query_results["rows"] = query_results["rows"][:max_results]
-                    
-                    # Update query step
-                    query.status = QueryStatus.COMPLETED
-                    query.results = query_results
-                    query.execution_time_ms = execution_time
-                    query.row_count = len(query_results["rows"])
-                    
-                    # Cache for dependent queries
-                    results_cache[query.id] = query_results
-                    
-                    logger.info(
-                        f"Query {query.id} completed: {query.row_count} rows in {execution_time:.1f}ms"
-                    )
-                    
-                    # Success - break retry loop
-                    break
-                    
-                except Exception as e:
-                    error_message = str(e)
-                    logger.error(f"Query {query.id} failed: {error_message}")
-                    
-                    # Check if this is a retryable SQL error
-                    if retry_count < max_retries and self._is_retryable_error(error_message):
-                        retry_count += 1
-                        logger.warning(f"🔄 Attempting AI-powered SQL correction (retry {retry_count}/{max_retries})")
-                        
-                        try:
-                            # Use AI to fix the SQL error
-                            corrected_sql = self.sql_generator.fix_sql_error(
-                                failing_sql=sql,
-                                error_message=error_message,
-                                question=query.description,
-                                attempt=retry_count
-                            )
-                            
-                            # Update the query SQL for next iteration
-                            sql = corrected_sql
-                            query.sql = corrected_sql  # Update the plan with corrected SQL
-                            
-                            logger.info(f"✅ AI generated corrected SQL, retrying execution...")
-                            continue  # Retry with corrected SQL
-                            
-                        except Exception as fix_error:
-                            logger.error(f"AI correction failed: {fix_error}")
-                            # Fall through to mark query as failed
-                    
-                    # Either max retries reached or non-retryable error or AI fix failed
-                    query.status = QueryStatus.FAILED
-                    query.error = error_message
-                    
-                    # Stop execution on error
-                    break
+        # Execute levels in order, running the queries of a level concurrently
+        for level in execution_levels:
+            if len(level) == 1:
+                self._execute_step(level[0], plan, results_cache, max_results)
+            else:
+                # Capped so a wide plan doesn't check out every pooled connection
+                workers = min(len(level), Config.MAX_PLAN_CONCURRENCY)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    list(executor.map(
+                        lambda query: self._execute_step(query, plan, results_cache, max_results),
+                        level
+                    ))
             
-            # If query failed after all retries, stop execution
-            if query.status == QueryStatus.FAILED:
+            # If any query failed after all retries, stop execution
+            if any(query.status == QueryStatus.FAILED for query in level):
                 break
         
         # Calculate total time
         plan.total_execution_time_ms = (time.time() - plan_start_time) * 1000
         
+        if cache_key and plan.is_complete():
+            self._plan_result_cache.set(cache_key, [
+                (query.sql, _copy_results(query.results), query.execution_time_ms)
+                for query in plan.queries
+            ])
+        
         logger.info(
             f"Plan execution {'completed' if plan.is_complete() else 'failed'}: "
             f"{plan.total_execution_time_ms:.1f}ms total"
@@ -486,6 +476,125 @@ class QueryEngine:
         
         return plan
     
+    def _plan_cache_key(self, plan: QueryPlan, max_results: int) -> Optional[Hashable]:
+        """
+        Result cache key for a plan, or None if the database can't be stat'ed
+        
+        The database file's mtime_ns is part of the key, so any write to
+        the database invalidates earlier results.
+        """
+        try:
+            mtime_ns = os.stat(self.db_manager.db_path).st_mtime_ns
+        except OSError:
+            return None
+        steps = tuple((query.id, query.sql, tuple(query.depends_on)) for query in plan.queries)
+        return (mtime_ns, max_results, plan.final_query_id, steps)
+    
+    def _execute_step(
+        self,
+        query: QueryStep,
+        plan: QueryPlan,
+        results_cache: Dict[str, Dict[str, Any]],
+        max_results: int
+    ) -> None:
+        """
+        Execute one plan step, retrying with AI-corrected SQL on fixable errors.
+        
+        Updates the step's status, results, row count and timing in place,
+        and stores its results in results_cache for dependent queries.
+        
+        Args:
+            query: Query step to execute
+            plan: Plan the step belongs to
+            results_cache: Results of already executed queries
+            max_results: Maximum results for the final query
+        """
+        max_retries = Config.MAX_SQL_ERROR_RETRIES if hasattr(Config, 'MAX_SQL_ERROR_RETRIES') else 2
+        retry_count = 0
+        sql = None
+        
+        while retry_count <= max_retries:
+            try:
+                logger.debug(f"Executing query {query.id}: {query.description}")
+                query.status = QueryStatus.EXECUTING
+                
+                # Replace result references in SQL (e.g., "FROM q1" -> temp table)
+                if retry_count == 0:
+                    # First attempt: use original SQL
+                    sql = self._resolve_dependencies(query, results_cache)
+                # else: sql already contains the AI-corrected version from previous iteration
+                
+                # Execute query
+                start_time = time.time()
+                # Intermediate steps feed later ones in full; only the final
+                # step is capped (one extra row detects truncation)
+                max_rows = max_results + 1 if query.id == plan.final_query_id else None
+                raw_results = self.db_manager.execute_query(sql, max_rows=max_rows)
+                execution_time = (time.time() - start_time) * 1000  # milliseconds
+                
+                # Store results
+                query_results = {
+                    "columns": list(raw_results[0].keys()) if raw_results else [],
+                    "rows": [list(row.values()) for row in raw_results] if raw_results else []
+                }
+                
+                # Apply max_results only to final query
+                if query.id == plan.final_query_id and len(query_results["rows"]) > max_results:
+                    logger.warning(f"Final query results truncated to {max_results} rows")
+                    query_results["rows"] = query_results["rows"][:max_results]
+                
+                # Update query step
+                query.status = QueryStatus.COMPLETED
+                query.results = query_results
+                query.execution_time_ms = execution_time
+                query.row_count = len(query_results["rows"])
+                
+                # Cache for dependent queries
+                results_cache[query.id] = query_results
+                
+                logger.info(
+                    f"Query {query.id} completed: {query.row_count} rows in {execution_time:.1f}ms"
+                )
+                
+                # Success - break retry loop
+                break
+                
+            except Exception as e:
+                error_message = str(e)
+                logger.error(f"Query {query.id} failed: {error_message}")
+                
+                # Check if this is a retryable SQL error
+                if retry_count < max_retries and self._is_retryable_error(error_message):
+                    retry_count += 1
+                    logger.warning(f"🔄 Attempting AI-powered SQL correction (retry {retry_count}/{max_retries})")
+                    
+                    try:
+                        # Use AI to fix the SQL error
+                        corrected_sql = self.sql_generator.fix_sql_error(
+                            failing_sql=sql,
+                            error_message=error_message,
+                            question=query.description,
+                            attempt=retry_count
+                        )
+                        
+                        # Update the query SQL for next iteration
+                        sql = corrected_sql
+                        query.sql = corrected_sql  # Update the plan with corrected SQL
+                        
+                        logger.info(f"✅ AI generated corrected SQL, retrying execution...")
+                        continue  # Retry with corrected SQL
+                        
+                    except Exception as fix_error:
+                        logger.error(f"AI correction failed: {fix_error}")
+                        # Fall through to mark query as failed
+                
+                # Either max retries reached or non-retryable error or AI fix failed
+                query.status = QueryStatus.FAILED
+                query.error = error_message
+                
+                # Stop execution on error
+                break
+    
     def _is_retryable_error(self, error_message: str) -> bool:
         """
         Determine if a database error is retryable with AI correction
@@ -578,8 +687,10 @@ class QueryEngine:
                 columns = dep_results["columns"]
                 rows = dep_results["rows"]
                 
-                # Format: (col1, col2, ...) AS (SELECT val1, val2, ... UNION ALL ...)
-                values_clauses = []
+                # Format: q1(col1, col2, ...) AS (VALUES (val1, val2, ...), ...)
+                # A single VALUES list is parsed and evaluated as one statement
+                # (a UNION ALL of one SELECT per row is capped at 500 terms)
+                values_rows = []
                 for row in rows:
                     formatted_values = []
                     for val in row:
@@ -592,10 +703,9 @@ class QueryEngine:
                         else:
                             formatted_values.append(str(val))
                     
-                    values_clauses.append(f"SELECT {', '.join(formatted_values)}")
+                    values_rows.append(f"({', '.join(formatted_values)})")
                 
-                cte_sql = " UNION ALL ".join(values_clauses)
-                cte = f"{dep_id}({', '.join(columns)}) AS ({cte_sql})"
+                cte = f"{dep_id}({', '.join(columns)}) AS (VALUES {', '.join(values_rows)})"
                 ctes.append(cte)
         
         # Prepend CTEs to query
@@ -244,6 +244,33 @@ class QueryPlan:
         
         return execution_order
     
+    def get_execution_levels(self) -> List[List[QueryStep]]:
+        """
+        Group queries into levels that can run concurrently.
+        
+        Every query's dependencies are in an earlier level, so the queries
+        within one level are independent of each other.
+        
+        Returns:
+            List of levels, each a list of QueryStep objects
+            
+        Example:
+            >>> # q1, q2 (no deps), q3 (depends on q1, q2)
+            >>> levels = plan.get_execution_levels()
+            >>> # Returns: [[q1, q2], [q3]]
+        """
+        level_of: Dict[str, int] = {}
+        levels: List[List[QueryStep]] = []
+        
+        for query in self.get_execution_order():
+            level = 1 + max((level_of[dep_id] for dep_id in query.depends_on), default=-1)
+            level_of[query.id] = level
+            if level == len(levels):
+                levels.append([])
+            levels[level].append(query)
+        
+        return levels
+    
     def get_final_results(self) -> Optional[Dict[str, Any]]:
         """Get results from the final query"""
         final_query = self.get_query(self.final_query_id)
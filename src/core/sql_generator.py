@@ -4,6 +4,7 @@ Converts natural language to SQLite queries using Groq (primary) with Gemini fal
 Supports both single SQL queries and multi-query execution plans
 """
 
+import re
 import time
 import json
 from typing import Dict, Any, Optional
@@ -11,12 +12,30 @@ from typing import Dict, Any, Optional
 from src.core.llm_client import UnifiedLLMClient
 from src.core.api_key_manager import APIKeyManager
 from src.core.query_plan import QueryPlan, QueryStep
+from src.utils.cache import TTLCache, normalize_question
 from src.utils.config import Config
 from src.utils.logger import setup_logger
 from src.utils.exceptions import QueryError
 
 logger = setup_logger(__name__)
 
+# Phrases that suggest a question needs a multi-query plan
+_MULTI_QUERY_PHRASES = (
+    # Comparison/multi-step queries
+    'compare', 'comparison', 'vs', 'versus', 'difference between',
+    'both', 'each', 'and also', 'as well as', 'in addition to',
+    # Time period comparisons
+    'this month vs last month', 'this year vs last year',
+    'quarter over quarter', 'year over year',
+    'monthly comparison', 'annual comparison',
+    # Multi-entity queries
+    'top 5 and bottom 5', 'best and worst',
+    'highest and lowest', 'maximum and minimum',
+)
+
+# One substring scan of the question instead of a loop per phrase list
+_MULTI_QUERY_PATTERN = re.compile('|'.join(map(re.escape, _MULTI_QUERY_PHRASES)))
+
 
 class SQLGenerator:
     """
@@ -51,6 +70,19 @@ class SQLGenerator:
         self.schema_text = schema_text
         self.llm_client = llm_client
         self.api_key_manager = api_key_manager
+        
+        # Generated SQL / parsed plans keyed by normalized question
+        self._sql_cache = TTLCache()
+        self._plan_cache = TTLCache()
+    
+    def clear_cache(self) -> None:
+        """Forget generated SQL and plans (the next question goes to the LLM)"""
+        self._sql_cache.clear()
+        self._plan_cache.clear()
+    
+    def forget_sql(self, question: str) -> None:
+        """Drop the cached SQL for a question (e.g. after it failed to execute)"""
+        self._sql_cache.pop(normalize_question(question))
     
     def generate(self, question: str) -> str:
         """
@@ -82,6 +114,12 @@ class SQLGenerator:
         if not question or not question.strip():
             raise QueryError("Question cannot be empty")
         
+        cache_key = normalize_question(question)
+        cached_sql = self._sql_cache.get(cache_key)
+        if cached_sql is not None:
+            logger.info("Using cached SQL for repeated question")
+            return cached_sql
+        
         # Pre-validate: Check if question keywords match available tables
         question_lower = question.lower()
         
@@ -141,6 +179,7 @@ class SQLGenerator:
             sql = self._clean_sql(sql_text)
             logger.info(f"Generated SQL: {sql[:100]}...")
             
+            self._sql_cache.set(cache_key, sql)
             return sql
             
         except Exception as e:
@@ -371,43 +410,7 @@ CORRECTED SQL QUERY:"""
             >>> generator.needs_multi_query("How many employees?")
             False
         """
-        question_lower = question.lower()
-        
-        # Keywords that suggest comparison/multi-step queries
-        comparison_keywords = [
-            'compare', 'comparison', 'vs', 'versus', 'difference between',
-            'both', 'each', 'and also', 'as well as', 'in addition to'
-        ]
-        
-        # Time period comparisons
-        time_comparisons = [
-            'this month vs last month', 'this year vs last year',
-            'quarter over quarter', 'year over year',
-            'monthly comparison', 'annual comparison'
-        ]
-        
-        # Multi-entity queries
-        multi_entity = [
-            'top 5 and bottom 5', 'best and worst',
-            'highest and lowest', 'maximum and minimum'
-        ]
-        
-        # Check for comparison keywords
-        for keyword in comparison_keywords:
-            if keyword in question_lower:
-                return True
-        
-        # Check for time comparisons
-        for pattern in time_comparisons:
-            if pattern in question_lower:
-                return True
-        
-        # Check for multi-entity patterns
-        for pattern in multi_entity:
-            if pattern in question_lower:
-                return True
-        
-        return False
+        return _MULTI_QUERY_PATTERN.search(question.lower()) is not None
     
     def generate_query_plan(self, question: str) -> QueryPlan:
         """
@@ -435,6 +438,13 @@ CORRECTED SQL QUERY:"""
         if not question or not question.strip():
             raise QueryError("Question cannot be empty")
         
+        # Plans are cached as parsed dicts so each caller gets fresh QueryStep objects
+        cache_key = normalize_question(question)
+        cached_plan = self._plan_cache.get(cache_key)
+        if cached_plan is not None:
+            logger.info("Using cached query plan for repeated question")
+            return self._build_query_plan(cached_plan, question)
+        
         # Pre-validate: Check if question keywords match available tables
         question_lower = question.lower()
         
@@ -497,6 +507,7 @@ CORRECTED SQL QUERY:"""
                 
                 # Convert to QueryPlan object
                 plan = self._build_query_plan(plan_dict, question)
+                self._plan_cache.set(cache_key, plan_dict)
                 
                 logger.info(f"Generated plan with {len(plan.queries)} queries")
                 if attempt > 0:
@@ -552,6 +563,10 @@ RULES:
 5. Keep queries simple and focused on one task each
 6. Use proper SQLite syntax
 7. No markdown, code blocks, or explanations - just JSON
+8. When comparing groups of the same table with the same aggregates (e.g. IT vs Sales
+   headcount and average salary), compute all groups in ONE step with GROUP BY
+   (e.g. WHERE department IN ('IT', 'Sales') GROUP BY department) instead of one step
+   per group - a single scan of the table instead of one per group
 
 OUTPUT FORMAT (valid JSON only):
 {{
@@ -8,10 +8,15 @@ import math
 import logging
 from typing import Any, Dict, List
 
+from src.utils.cache import TTLCache, digest
 from src.utils.llm import generate_text
 
 logger = logging.getLogger(__name__)
 
+# Summaries keyed by a hash of the prompt (minus execution time), so the
+# same question over the same result set reuses the previous summary
+_SUMMARY_CACHE = TTLCache()
+
 
 def _is_time_col(name: str) -> bool:
     """
@@ -161,10 +166,19 @@ def summarize_result(
         "RESULT JSON:\n" + json.dumps(payload, ensure_ascii=False, default=str)
     )
     
+    cache_key = digest(system + json.dumps({**payload, "execution_ms": None}, ensure_ascii=False, default=str))
+    cached = _SUMMARY_CACHE.get(cache_key)
+    if cached is not None:
+        logger.debug("Using cached summary")
+        return cached
+    
     # Generate summary with fallback
     try:
         txt = generate_text(system, user)
-        return txt if txt.strip() else f"Found {row_count} row(s) across {col_count} column(s)."
+        if not txt.strip():
+            return f"Found {row_count} row(s) across {col_count} column(s)."
+        _SUMMARY_CACHE.set(cache_key, txt)
+        return txt
     except Exception as e:
         # Log detailed error for debugging
         logger.error(f"LLM summarization failed: {type(e).__name__}: {str(e)}")
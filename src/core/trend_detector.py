@@ -22,6 +22,12 @@ import re
 
 logger = logging.getLogger(__name__)
 
+# Date-like string values (YYYY-MM-DD, YYYY-MM, YYYY/MM/DD, YYYY/MM, DD-MM-YYYY, MM/DD/YYYY)
+_DATE_PATTERN = re.compile(
+    r'^(?:\d{4}-\d{2}-\d{2}|\d{4}-\d{2}$|\d{4}/\d{2}/\d{2}|\d{4}/\d{2}$'
+    r'|\d{2}-\d{2}-\d{4}|\d{2}/\d{2}/\d{4})'
+)
+
 
 @dataclass
 class TrendInsight:
@@ -98,6 +104,9 @@ class TrendDetector:
         else:
             self.df = pd.DataFrame(columns=columns)
             logger.warning("TrendDetector initialized with empty dataset")
+        
+        # Numeric columns are resolved once and shared by all detectors
+        self.numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
     
     def detect_trends(self) -> List[TrendInsight]:
         """
@@ -137,27 +146,24 @@ class TrendDetector:
         """
         insights = []
         
-        # Find temporal columns
-        temporal_cols = []
-        for col in self.df.columns:
-            if self._is_temporal_column(col):
-                temporal_cols.append(col)
+        # Find numeric columns (checked first - it skips scanning values for dates)
+        numeric_cols = self.numeric_cols
         
-        if not temporal_cols:
+        if not numeric_cols:
             return insights
         
-        # Find numeric columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        # Find temporal columns
+        temporal_cols = [col for col in self.df.columns if self._is_temporal_column(col)]
         
-        if not numeric_cols:
+        if not temporal_cols:
             return insights
         
         # Analyze first temporal + numeric pair
         time_col = temporal_cols[0]
         value_col = numeric_cols[0]
         
-        # Sort by time
-        df_sorted = self.df.sort_values(by=time_col).copy()
+        # Sort by time (only the two columns in use)
+        df_sorted = self.df[[time_col, value_col]].sort_values(by=time_col)
         df_sorted = df_sorted.dropna(subset=[time_col, value_col])
         
         if len(df_sorted) < 3:
@@ -192,8 +198,8 @@ class TrendDetector:
         min_idx = np.argmin(values)
         peak_value = values[max_idx]
         trough_value = values[min_idx]
-        peak_date = df_sorted.iloc[max_idx][time_col]
-        trough_date = df_sorted.iloc[min_idx][time_col]
+        peak_date = df_sorted[time_col].iat[max_idx]
+        trough_date = df_sorted[time_col].iat[min_idx]
         
         # Volatility (coefficient of variation)
         if mean_value != 0:
@@ -277,7 +283,7 @@ class TrendDetector:
             return insights
         
         # Identify categorical and numeric columns
-        numeric_cols = self.df.select_dtypes(include=[np.number]).columns.tolist()
+        numeric_cols = self.numeric_cols
         
         if len(numeric_cols) != 1:
             return insights
@@ -391,7 +397,7 @@ class TrendDetector:
         col = self.df.columns[0]
         
         # Must be numeric
-        if col not in self.df.select_dtypes(include=[np.number]).columns:
+        if col not in self.numeric_cols:
             return insights
         
         # Need enough distinct values
@@ -517,16 +523,7 @@ class TrendDetector:
             return True
         
         if isinstance(value, str):
-            # Common date patterns
-            date_patterns = [
-                r'^\d{4}-\d{2}-\d{2}',  # YYYY-MM-DD
-                r'^\d{4}-\d{2}$',        # YYYY-MM
-                r'^\d{4}/\d{2}/\d{2}',  # YYYY/MM/DD
-                r'^\d{4}/\d{2}$',        # YYYY/MM
-                r'^\d{2}-\d{2}-\d{4}',  # DD-MM-YYYY
-                r'^\d{2}/\d{2}/\d{4}',  # MM/DD/YYYY
-            ]
-            return any(re.match(pattern, value) for pattern in date_patterns)
+            return _DATE_PATTERN.match(value) is not None
         
         return False
     
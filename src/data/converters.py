@@ -5,15 +5,41 @@ Creates a comprehensive SQL database from generated Excel files
 
 import pandas as pd
 import sqlite3
-from sqlalchemy import create_engine, inspect
+from sqlalchemy import create_engine, event, inspect
 import os
 from datetime import datetime
 
+from src.core.database import USER_TABLES_FILTER
 from src.utils.config import Config
 
 # Load config
 config = Config()
 
+# The database is rebuilt from scratch on every conversion, so the bulk load
+# trades durability for speed: no fsyncs, rollback journal kept in memory
+# (savepoints still work), and a large page cache for index/table building
+BULK_LOAD_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-262144",  # ~256 MB
+)
+
+
+def _apply_bulk_load_pragmas(dbapi_conn, connection_record):
+    """Engine connect hook applying BULK_LOAD_PRAGMAS"""
+    # pysqlite never emits BEGIN before DDL or SAVEPOINT, so without this the
+    # first savepoint would become the outermost transaction and commit on
+    # release; transactions are begun explicitly by _begin_transaction
+    dbapi_conn.isolation_level = None
+    for pragma in BULK_LOAD_PRAGMAS:
+        dbapi_conn.execute(pragma)
+
+
+def _begin_transaction(conn):
+    """Engine begin hook: emit the BEGIN pysqlite leaves out"""
+    conn.exec_driver_sql("BEGIN")
+
 
 def excel_to_sql(excel_dir=None, db_name=None):
     """Convert all Excel files to SQL database"""
@@ -35,6 +61,8 @@ def excel_to_sql(excel_dir=None, db_name=None):
     
     # Create SQLAlchemy engine
     engine = create_engine(f'sqlite:///{db_name}', echo=False)
+    event.listen(engine, 'connect', _apply_bulk_load_pragmas)
+    event.listen(engine, 'begin', _begin_transaction)
     
     # Get all Excel and CSV files
     data_files = [f for f in os.listdir(excel_dir) if f.endswith(('.xlsx', '.xls', '.csv'))]
@@ -43,41 +71,49 @@ def excel_to_sql(excel_dir=None, db_name=None):
         print(f"❌ No Excel or CSV files found in {excel_dir}/")
         return
     
-    # Convert each file to a table
-    for data_file in sorted(data_files):
-        file_path = os.path.join(excel_dir, data_file)
-        
-        # Determine table name (remove file extension and sanitize)
-        if data_file.endswith('.xlsx'):
-            table_name = data_file.replace('.xlsx', '')
-        elif data_file.endswith('.xls'):
-            table_name = data_file.replace('.xls', '')
-        else:  # .csv
-            table_name = data_file.replace('.csv', '')
-        
-        # Sanitize table name: replace hyphens and other special chars with underscores
-        # SQL table names should only contain letters, numbers, and underscores
-        table_name = table_name.replace('-', '_').replace(' ', '_').replace('.', '_')
-        # Remove any other non-alphanumeric characters except underscores
-        table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in table_name)
-        # Ensure it starts with a letter or underscore (SQL requirement)
-        if table_name and table_name[0].isdigit():
-            table_name = 't_' + table_name
-        
-        try:
-            # Read file based on extension
-            if data_file.endswith('.csv'):
-                df = pd.read_csv(file_path)
-            else:
-                df = pd.read_excel(file_path)
-            
-            # Write to SQL database
-            df.to_sql(table_name, engine, if_exists='replace', index=False)
-            
-            print(f"✅ Converted: {data_file} → table '{table_name}' ({len(df)} rows)")
-            
-        except Exception as e:
-            print(f"❌ Error converting {data_file}: {str(e)}")
+    # Write every table in one transaction: one commit (and journal fsync) for
+    # the whole database instead of one per table. A savepoint per file keeps
+    # a file that fails to convert from affecting the others.
+    try:
+        with engine.begin() as conn:
+            for data_file in sorted(data_files):
+                file_path = os.path.join(excel_dir, data_file)
+                
+                # Determine table name (remove file extension and sanitize)
+                if data_file.endswith('.xlsx'):
+                    table_name = data_file.replace('.xlsx', '')
+                elif data_file.endswith('.xls'):
+                    table_name = data_file.replace('.xls', '')
+                else:  # .csv
+                    table_name = data_file.replace('.csv', '')
+                
+                # Sanitize table name: replace hyphens and other special chars with underscores
+                # SQL table names should only contain letters, numbers, and underscores
+                table_name = table_name.replace('-', '_').replace(' ', '_').replace('.', '_')
+                # Remove any other non-alphanumeric characters except underscores
+                table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in table_name)
+                # Ensure it starts with a letter or underscore (SQL requirement)
+                if table_name and table_name[0].isdigit():
+                    table_name = 't_' + table_name
+                
+                try:
+                    # Read file based on extension
+                    if data_file.endswith('.csv'):
+                        df = pd.read_csv(file_path)
+                    else:
+                        df = pd.read_excel(file_path)
+                    
+                    # Write to SQL database
+                    with conn.begin_nested():
+                        df.to_sql(table_name, conn, if_exists='replace', index=False)
+                    
+                    print(f"✅ Converted: {data_file} → table '{table_name}' ({len(df)} rows)")
+                
+                except Exception as e:
+                    print(f"❌ Error converting {data_file}: {str(e)}")
+    finally:
+        # The engine is private to the conversion; release its pooled file handle
+        engine.dispose()
     
     print("-" * 60)
     print(f"✨ Database created successfully: {db_name}")
@@ -85,7 +121,7 @@ def excel_to_sql(excel_dir=None, db_name=None):
     # Display database statistics
     with sqlite3.connect(db_name) as conn:
         cursor = conn.cursor()
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table';")
+        cursor.execute(f"SELECT name FROM sqlite_master WHERE {USER_TABLES_FILTER};")
         tables = cursor.fetchall()
         
         print(f"\n📊 Database contains {len(tables)} tables:")
@@ -95,8 +131,12 @@ def excel_to_sql(excel_dir=None, db_name=None):
             cursor.execute(f'SELECT COUNT(*) FROM "{table_name}"')
             count = cursor.fetchone()[0]
             print(f"   - {table_name}: {count} rows")
+        
+        # Record table statistics for the query planner (and for row
+        # estimates that read sqlite_stat1 instead of counting)
+        cursor.execute("ANALYZE")
     
-    return db_name, engine
+    return db_name
 
 
 def verify_database(db_name=None):
@@ -176,6 +216,6 @@ def verify_database(db_name=None):
 
 
 if __name__ == "__main__":
-    db_name, engine = excel_to_sql()
+    db_name = excel_to_sql()
     verify_database(db_name)
     print("\n✅ Conversion complete!")
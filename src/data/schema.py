@@ -7,6 +7,7 @@ import sqlite3
 from datetime import datetime
 import os
 
+from src.core.database import USER_TABLES_FILTER
 from src.utils.config import Config
 
 # Load config
@@ -42,7 +43,7 @@ def generate_schema_file(db_name=None, output_file=None):
         cursor = conn.cursor()
         
         # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")
+        cursor.execute(f"SELECT name FROM sqlite_master WHERE {USER_TABLES_FILTER} ORDER BY name;")
         tables = [table[0] for table in cursor.fetchall()]
         
         # Start building schema document
@@ -239,7 +240,7 @@ def generate_sql_schema(db_name=None, output_file=None):
         cursor = conn.cursor()
         
         # Get all tables
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' ORDER BY name;")
+        cursor.execute(f"SELECT name FROM sqlite_master WHERE {USER_TABLES_FILTER} ORDER BY name;")
         tables = [table[0] for table in cursor.fetchall()]
         
         sql_statements = []
@@ -0,0 +1,97 @@
+"""
+In-memory TTL cache for LLM responses
+Repeat questions reuse generated SQL, plans and summaries instead of
+paying for another LLM round-trip
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+from src.utils.config import Config
+
+
+def normalize_question(question: str) -> str:
+    """Cache key form of a question (case and whitespace insensitive)"""
+    return ' '.join(question.lower().split())
+
+
+def digest(text: str) -> str:
+    """Short stable hash of a (possibly large) cache key component"""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL
+    
+    Example:
+        >>> cache = TTLCache(maxsize=2, ttl=60)
+        >>> cache.set('q', 'SELECT 1')
+        >>> cache.get('q')
+        'SELECT 1'
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = Config.LLM_CACHE_SIZE,
+        ttl: float = Config.LLM_CACHE_TTL_SECONDS
+    ):
+        """
+        Initialize cache
+        
+        Args:
+            maxsize: Maximum number of entries (least recently used evicted first)
+            ttl: Seconds an entry stays valid
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value, evicting the least recently used entry when full"""
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry if present"""
+        with self._lock:
+            self._data.pop(key, None)
+    
+    def clear(self) -> None:
+        """Drop all entries"""
+        with self._lock:
+            self._data.clear()
+    
+    def stats(self) -> Dict[str, int]:
+        """Entry count and lookup hit/miss counters since creation"""
+        return {'size': len(self._data), 'hits': self.hits, 'misses': self.misses}
+    
+    def __len__(self) -> int:
+        return len(self._data)
@@ -26,6 +26,7 @@ class Config:
     DATABASE_PATH = os.getenv("DATABASE_PATH", str(DATABASE_DIR / "electronics_company.db"))
     EXCEL_OUTPUT_DIR = os.getenv("EXCEL_OUTPUT_DIR", str(EXCEL_DIR))
     LOG_FILE = os.getenv("LOG_FILE", str(LOGS_DIR / "app.log"))
+    CLI_HISTORY_FILE = os.getenv("CLI_HISTORY_FILE", str(Path.home() / ".memova_history"))
     
     # API Configuration
     GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
@@ -130,6 +131,22 @@ class Config:
         """
         return cls.GROQ_API_KEY
     
+    # API Server (used by `python -m api.main`)
+    API_HOST = os.getenv("API_HOST", "0.0.0.0")
+    API_PORT = int(os.getenv("PORT", "8000"))
+    # Single process by default: the upload registry and upload job status
+    # live in per-process dicts, so with more workers an upload registered
+    # on one worker is unknown to the others
+    UVICORN_WORKERS = int(os.getenv("UVICORN_WORKERS", "1"))
+    # Threads per worker for blocking LLM/SQLite calls run via asyncio.to_thread
+    API_THREAD_POOL_SIZE = int(os.getenv("API_THREAD_POOL_SIZE", "64"))
+    # Worker processes for upload schema detection / Excel → SQLite conversion,
+    # per API worker (each starts its own pool), so the CPUs are shared out
+    UPLOAD_PROCESS_WORKERS = int(os.getenv(
+        "UPLOAD_PROCESS_WORKERS",
+        str(max(1, (os.cpu_count() or 4) // max(1, UVICORN_WORKERS)))
+    ))
+    
     # Logging
     LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
     
@@ -144,6 +161,13 @@ class Config:
     QUERY_TIMEOUT_SECONDS = int(os.getenv("QUERY_TIMEOUT_SECONDS", "30"))
     DEFAULT_RESULT_LIMIT = int(os.getenv("DEFAULT_RESULT_LIMIT", "100"))
     MAX_SQL_ERROR_RETRIES = int(os.getenv("MAX_SQL_ERROR_RETRIES", "2"))  # AI-powered retry attempts
+    MAX_PLAN_CONCURRENCY = int(os.getenv("MAX_PLAN_CONCURRENCY", "8"))  # Independent plan steps run at once
+    PLAN_RESULT_CACHE_SIZE = int(os.getenv("PLAN_RESULT_CACHE_SIZE", "128"))  # Executed plans kept per engine
+    
+    # LLM Response Cache (repeat questions skip the LLM round-trip)
+    LLM_CACHE_SIZE = int(os.getenv("LLM_CACHE_SIZE", "4096"))
+    LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", "3600"))
+    LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # In-flight LLM calls per parallel fan-out
     
     @classmethod
     def validate(cls) -> list[str]:
@@ -0,0 +1,95 @@
+"""
+JSON extraction from LLM responses
+Finds the first balanced JSON object/array in free text (prose, markdown
+fences) and repairs the usual near-JSON mistakes before giving up
+"""
+
+import re
+from typing import Any, Optional
+
+import orjson
+
+_CLOSERS = {'{': '}', '[': ']'}
+
+# Repairs tried only after a strict parse fails
+_SMART_QUOTES = str.maketrans({'“': '"', '”': '"', '„': '"'})
+_TRAILING_COMMA = re.compile(r',\s*([}\]])')
+_PYTHON_LITERALS = (
+    (re.compile(r'\bTrue\b'), 'true'),
+    (re.compile(r'\bFalse\b'), 'false'),
+    (re.compile(r'\bNone\b'), 'null'),
+)
+
+
+def extract_json(text: str, opener: str = '{') -> Optional[str]:
+    """
+    Return the first balanced JSON span starting with opener
+
+    Single pass tracking bracket depth; brackets inside double-quoted
+    strings (with backslash escapes) don't count.
+
+    Args:
+        text: LLM response text
+        opener: '{' for an object, '[' for an array
+
+    Returns:
+        The JSON substring, or None if there is no balanced span
+    """
+    start = text.find(opener)
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in _CLOSERS:
+            depth += 1
+        elif char in '}]':
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
+
+
+def parse_json(text: str, opener: str = '{') -> Any:
+    """
+    Parse the first JSON object/array in an LLM response
+
+    Tries the span as-is, then again after replacing smart quotes,
+    trailing commas and Python literals (True/False/None).
+
+    Args:
+        text: LLM response text
+        opener: '{' for an object, '[' for an array
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        ValueError: If no parseable JSON is found
+    """
+    span = extract_json(text, opener)
+    if span is not None:
+        try:
+            return orjson.loads(span)
+        except orjson.JSONDecodeError:
+            pass
+
+    span = extract_json(text.translate(_SMART_QUOTES), opener)
+    if span is None:
+        raise ValueError(f"No JSON {opener}...{_CLOSERS[opener]} found in response")
+    span = _TRAILING_COMMA.sub(r'\1', span)
+    for pattern, replacement in _PYTHON_LITERALS:
+        span = pattern.sub(replacement, span)
+    return orjson.loads(span)
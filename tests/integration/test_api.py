@@ -7,6 +7,8 @@ import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
 import sys
+import json
+from unittest.mock import patch
 
 project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
@@ -95,6 +97,38 @@ class TestAPIEndpoints:
         assert 'category' in example
         assert 'complexity' in example
     
+    def test_example_queries_etag(self, client):
+        """Test GET endpoints return an ETag and honour If-None-Match"""
+        response = client.get("/databases/electronics/examples")
+        assert response.status_code == 200
+        etag = response.headers.get('etag')
+        assert etag
+
+        cached = client.get("/databases/electronics/examples", headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers.get('etag') == etag
+
+    def test_schema_etag(self, client):
+        """Test schema ETag follows the database file and short-circuits to 304"""
+        response = client.get("/databases/electronics/schema")
+        if response.status_code == 404:
+            pytest.skip("Electronics database not found")
+
+        etag = response.headers.get('etag')
+        assert etag
+
+        with patch('api.routes._get_schema', side_effect=AssertionError("schema read on 304")):
+            cached = client.get("/databases/electronics/schema", headers={'If-None-Match': etag})
+        assert cached.status_code == 304
+        assert cached.headers.get('etag') == etag
+
+    def test_stale_etag_returns_full_body(self, client):
+        """Test a non-matching If-None-Match gets the full response"""
+        response = client.get("/databases/electronics/examples", headers={'If-None-Match': '"stale"'})
+        assert response.status_code == 200
+        assert len(response.json()) > 0
+
     def test_get_stats(self, client):
         """Test GET /stats endpoint"""
         response = client.get("/stats")
@@ -124,6 +158,117 @@ class TestAPIEndpoints:
         assert response.status_code == 422  # Validation error
 
 
+class StubEngine:
+    """QueryEngine stand-in returning fixed results (no LLM calls)"""
+    
+    def __init__(self, results):
+        self.results = results
+    
+    def ask(self, question):
+        return {
+            'success': True,
+            'sql': 'SELECT name, total FROM sales',
+            'results': self.results,
+            'row_count': len(self.results),
+            'execution_time': 0.01
+        }
+
+
+class TestQueryStreaming:
+    """Test POST /query/stream NDJSON endpoint"""
+    
+    @pytest.fixture
+    def client(self):
+        """Create test client"""
+        return TestClient(app)
+    
+    def _patch_engine(self, results):
+        async def fake_get_engine(db_path):
+            return StubEngine(results)
+        return patch('api.routes._get_engine', fake_get_engine)
+    
+    def test_stream_header_and_rows(self, client):
+        """Test stream emits a header line then one line per row"""
+        results = [{'name': f'item {i}', 'total': i * 1.5} for i in range(1200)]
+        
+        with self._patch_engine(results):
+            response = client.post("/query/stream", json={
+                "question": "Show sales",
+                "database": "electronics"
+            })
+        
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+        
+        lines = response.text.strip().split("\n")
+        header = json.loads(lines[0])
+        assert header['columns'] == ['name', 'total']
+        assert header['row_count'] == 1200
+        assert len(lines) == 1201
+        assert json.loads(lines[1]) == ['item 0', 0.0]
+        assert json.loads(lines[-1]) == ['item 1199', 1798.5]
+    
+    def test_stream_empty_results(self, client):
+        """Test stream with no rows still returns the header"""
+        with self._patch_engine([]):
+            response = client.post("/query/stream", json={
+                "question": "Show nothing",
+                "database": "electronics"
+            })
+        
+        assert response.status_code == 200
+        lines = response.text.strip().split("\n")
+        assert len(lines) == 1
+        assert json.loads(lines[0])['columns'] == []
+    
+    def test_query_stream_param_appends_trailer(self, client):
+        """Test /query?stream=true sends rows then a charts/trends trailer"""
+        results = [{'name': f'item {i}', 'total': i} for i in range(3)]
+
+        async def fake_insights(question, columns, rows):
+            return {'charts': None, 'trends': []}
+
+        with self._patch_engine(results), patch('api.routes._detect_insights', fake_insights):
+            response = client.post("/query?stream=true", json={
+                "question": "Show sales",
+                "database": "electronics"
+            })
+
+        assert response.status_code == 200
+        assert response.headers['content-type'].startswith('application/x-ndjson')
+
+        lines = [json.loads(line) for line in response.text.strip().split("\n")]
+        assert lines[0]['columns'] == ['name', 'total']
+        assert lines[1:4] == [['item 0', 0], ['item 1', 1], ['item 2', 2]]
+        assert lines[4] == {'charts': None, 'trends': []}
+
+    def test_query_stream_trailer_error(self, client):
+        """Test a failing trailer is reported after the rows were sent"""
+        async def failing_insights(question, columns, rows):
+            raise RuntimeError("chart detection failed")
+
+        with self._patch_engine([{'name': 'a', 'total': 1}]), \
+                patch('api.routes._detect_insights', failing_insights):
+            response = client.post("/query?stream=true", json={
+                "question": "Show sales",
+                "database": "electronics"
+            })
+
+        assert response.status_code == 200
+        lines = response.text.strip().split("\n")
+        assert json.loads(lines[1]) == ['a', 1]
+        assert json.loads(lines[-1]) == {'error': "chart detection failed"}
+
+    def test_stream_invalid_database(self, client):
+        """Test stream rejects unknown databases"""
+        response = client.post("/query/stream", json={
+            "question": "How many users?",
+            "database": "invalid_db"
+        })
+        
+        assert response.status_code == 400
+
+
 class TestAPIQueryExecution:
     """Integration tests for query execution via API"""
     
@@ -20,7 +20,7 @@ from src.data.generators import (
     generate_inventory,
     generate_suppliers
 )
-from src.data.converters import verify_database
+from src.data.converters import excel_to_sql, verify_database
 
 
 class TestDataGenerators:
@@ -212,3 +212,74 @@ class TestExcelGeneration:
         xl_file = pd.ExcelFile(excel_file)
         assert 'Employees' in xl_file.sheet_names
         assert 'Products' in xl_file.sheet_names
+
+
+class TestSQLConversion:
+    """Test Excel/CSV → SQLite conversion"""
+    
+    def test_excel_to_sql(self, tmp_path):
+        """Test converted tables hold every row and are analyzed"""
+        excel_dir = tmp_path / "excel"
+        excel_dir.mkdir()
+        generate_employees(num_rows=25).to_csv(excel_dir / "employees.csv", index=False)
+        generate_products(num_rows=10).to_excel(excel_dir / "products.xlsx", index=False)
+        db_path = tmp_path / "test.db"
+        
+        assert excel_to_sql(excel_dir=str(excel_dir), db_name=str(db_path)) == str(db_path)
+        
+        conn = sqlite3.connect(db_path)
+        try:
+            assert conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0] == 25
+            assert conn.execute("SELECT COUNT(*) FROM products").fetchone()[0] == 10
+            stats = dict(conn.execute("SELECT tbl, stat FROM sqlite_stat1").fetchall())
+            # Bulk-load pragmas are per connection and don't stick to the file
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'delete'
+        finally:
+            conn.close()
+        
+        assert stats['employees'].split()[0] == '25'
+    
+    def test_excel_to_sql_single_transaction(self, tmp_path):
+        """Test all files are written in one BEGIN/COMMIT, one savepoint each"""
+        from unittest.mock import patch
+        from src.data import converters
+        
+        excel_dir = tmp_path / "excel"
+        excel_dir.mkdir()
+        for name in ("customers", "products", "suppliers"):
+            generate_products(num_rows=5).to_csv(excel_dir / f"{name}.csv", index=False)
+        
+        statements = []
+        apply_pragmas = converters._apply_bulk_load_pragmas
+        
+        def traced(dbapi_conn, connection_record):
+            dbapi_conn.set_trace_callback(statements.append)
+            apply_pragmas(dbapi_conn, connection_record)
+        
+        with patch.object(converters, "_apply_bulk_load_pragmas", traced):
+            excel_to_sql(excel_dir=str(excel_dir), db_name=str(tmp_path / "test.db"))
+        
+        keywords = [s.split()[0].upper() for s in statements]
+        assert keywords.count("BEGIN") == 1
+        assert keywords.count("COMMIT") == 1
+        assert keywords.count("SAVEPOINT") == 3
+        assert keywords.index("BEGIN") < keywords.index("SAVEPOINT")
+    
+    def test_schema_docs_skip_internal_tables(self, tmp_path):
+        """Test schema docs of an analyzed database don't list sqlite_* tables"""
+        from src.data.schema import generate_schema_file, generate_sql_schema
+        
+        excel_dir = tmp_path / "excel"
+        excel_dir.mkdir()
+        generate_employees(num_rows=5).to_csv(excel_dir / "employees.csv", index=False)
+        db_path = tmp_path / "test.db"
+        excel_to_sql(excel_dir=str(excel_dir), db_name=str(db_path))
+        
+        md_path = tmp_path / "schema.md"
+        sql_path = tmp_path / "schema.sql"
+        generate_schema_file(db_name=str(db_path), output_file=str(md_path))
+        generate_sql_schema(db_name=str(db_path), output_file=str(sql_path))
+        
+        for doc in (md_path.read_text(), sql_path.read_text()):
+            assert 'sqlite_' not in doc.lower()
+            assert 'Total Tables:** 1' in doc or 'Total Tables: 1' in doc
@@ -6,6 +6,7 @@ Tests the execute_plan() method with real database and QueryPlan objects.
 
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
 from src.core.query_engine import QueryEngine
 from src.core.database import DatabaseManager
@@ -285,6 +286,51 @@ class TestMultiQueryExecution:
         assert q1.row_count > 5  # No limit
         assert q2.row_count == 5  # Limited to max_results
     
+    def test_dependency_with_many_rows(self, electronics_db_path):
+        """Test a dependency with more rows than a compound SELECT allows (500)"""
+        engine = QueryEngine(db_path=electronics_db_path)
+        
+        plan = QueryPlan(
+            queries=[
+                QueryStep(
+                    id="q1",
+                    description="Generate 600 numbers",
+                    sql="WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n LIMIT 600) SELECT x FROM n",
+                    depends_on=[]
+                ),
+                QueryStep(
+                    id="q2",
+                    description="Count them",
+                    sql="SELECT COUNT(*) as total FROM q1",
+                    depends_on=["q1"]
+                )
+            ],
+            final_query_id="q2"
+        )
+        
+        executed_plan = engine.execute_plan(plan)
+        
+        assert executed_plan.is_complete()
+        assert executed_plan.get_final_results()["rows"][0][0] == 600
+    
+    def test_repeat_plan_reuses_results(self, electronics_db_path):
+        """Test an identical plan on an unchanged database skips SQLite"""
+        engine = QueryEngine(db_path=electronics_db_path)
+        
+        def make_plan():
+            return QueryPlan.create_simple_plan(
+                sql="SELECT COUNT(*) as employee_count FROM employees",
+                question="How many employees?"
+            )
+        
+        first = engine.execute_plan(make_plan()).get_final_results()
+        
+        with patch.object(engine.db_manager, 'execute_query', side_effect=AssertionError("re-executed")):
+            repeat = engine.execute_plan(make_plan())
+        
+        assert repeat.is_complete()
+        assert repeat.get_final_results() == first
+    
     def test_plan_timing_metadata(self, electronics_db_path):
         """Test that execution times are recorded"""
         engine = QueryEngine(db_path=electronics_db_path)
@@ -12,6 +12,8 @@ import pytest
 from fastapi.testclient import TestClient
 from pathlib import Path
 import shutil
+import time
+from unittest.mock import patch
 
 from api.main import app
 
@@ -118,6 +120,33 @@ class TestUploadAPI:
         # Check if our upload is in the list
         upload_ids = [u['id'] for u in uploads]
         assert upload_id in upload_ids
+        
+        # Counts come from the uploaded database itself
+        ours = next(u for u in uploads if u['id'] == upload_id)
+        assert ours['table_count'] == 1
+        assert ours['total_rows'] == 5
+    
+    def test_list_uploads_reuses_counts(self, client, sample_excel_file):
+        """Test repeat listings reuse row counts while the file is unchanged"""
+        with open(sample_excel_file, 'rb') as f:
+            upload_id = client.post(
+                "/upload",
+                files={"files": ("customers.xlsx", f, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
+            ).json()['upload_id']
+        
+        client.get("/uploads?exact=true")
+        with patch('api.routes.DatabaseManager.count_rows', side_effect=AssertionError("recounted")):
+            uploads = client.get("/uploads?exact=true").json()
+            # Unchanged since upload: the recorded counts are used as-is
+            with patch('api.routes._cached_upload_counts', side_effect=AssertionError("opened")):
+                default = client.get("/uploads").json()
+        
+        ours = next(u for u in uploads if u['id'] == upload_id)
+        assert ours['total_rows'] == 5
+        ours = next(u for u in default if u['id'] == upload_id)
+        assert (ours['table_count'], ours['total_rows']) == (1, 5)
+        
+        client.delete(f"/uploads/{upload_id}")
     
     def test_delete_upload(self, client, sample_excel_file):
         """Test deleting an uploaded database"""
@@ -141,6 +170,44 @@ class TestUploadAPI:
         uploads = list_response.json()
         upload_ids = [u['id'] for u in uploads]
         assert upload_id not in upload_ids
+        
+        # Files are removed by a background task after the response
+        upload_root = Path(upload_response.json()['database_path']).parent.parent
+        assert not (upload_root / upload_id).exists()
+        assert not (upload_root / f".deleted_{upload_id}").exists()
+    
+    def test_upload_background_job(self, sample_excel_file):
+        """Test background upload returns 202 and reports the result via /status"""
+        # Context manager keeps one event loop alive for the background job
+        with TestClient(app) as client:
+            with open(sample_excel_file, 'rb') as f:
+                response = client.post(
+                    "/upload?background=true",
+                    files={"files": ("customers.xlsx", f, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")}
+                )
+            
+            assert response.status_code == 202
+            job = response.json()
+            assert job['status'] == 'processing'
+            upload_id = job['upload_id']
+            
+            deadline = time.monotonic() + 60
+            status = job
+            while status['status'] == 'processing' and time.monotonic() < deadline:
+                time.sleep(0.1)
+                status = client.get(f"/upload/{upload_id}/status").json()
+            
+            assert status['status'] == 'completed'
+            assert status['result']['upload_id'] == upload_id
+            assert status['result']['table_count'] == 1
+            assert status['result']['total_rows'] == 5
+            
+            client.delete(f"/uploads/{upload_id}")
+    
+    def test_upload_status_unknown_job(self, client):
+        """Test polling an unknown upload job"""
+        response = client.get("/upload/nonexistent_id/status")
+        assert response.status_code == 404
     
     def test_delete_nonexistent_upload(self, client):
         """Test deleting a non-existent upload"""
@@ -13,6 +13,7 @@ from src.core.chart_detector import (
     ChartDetector,
     ChartConfig,
     ColumnMetadata,
+    detect_charts_batch,
     detect_charts_from_results
 )
 
@@ -315,3 +316,209 @@ class TestChartPrioritization:
         if len(charts) > 1:
             for i in range(len(charts) - 1):
                 assert charts[i].confidence >= charts[i + 1].confidence
+
+
+class TestAIRecommendationCache:
+    """Test AI chart recommendations are reused for the same result shape."""
+    
+    def test_same_shape_reuses_recommendation(self):
+        """Should call the LLM once and rebuild chart data from each result set."""
+        from unittest.mock import Mock, patch
+        from src.core import ai_chart_selector
+        
+        llm = Mock()
+        llm.generate_content.return_value = (
+            '{"chart_type": "bar", "reasoning": "compare categories", '
+            '"x_column": "region", "y_columns": ["sales"], "title": "Sales by region"}',
+            "groq"
+        )
+        # Two numeric columns: ambiguous enough to need the LLM
+        columns = ["region", "sales", "units"]
+        first_rows = [["North", 100, 1], ["South", 200, 2], ["East", 150, 3]]
+        second_rows = [["North", 300, 4], ["South", 50, 5], ["East", 75, 6]]
+        
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        before = ai_chart_selector.cache_stats()
+        with patch.object(ai_chart_selector, "_get_client", return_value=llm):
+            first = detect_charts_from_results(columns, first_rows, question="Sales by region")
+            second = detect_charts_from_results(columns, second_rows, question="sales  by REGION")
+        after = ai_chart_selector.cache_stats()
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        
+        llm.generate_content.assert_called_once()
+        prompt = llm.generate_content.call_args.args[0]
+        assert llm.generate_content.call_args.kwargs["system_message"] == ai_chart_selector._CHART_SELECTION_SYSTEM_PROMPT
+        assert llm.generate_content.call_args.kwargs["json_mode"] is True
+        assert prompt.startswith("Dataset: 3 rows") and prompt.endswith("User's Question: Sales by region")
+        assert after["hits"] - before["hits"] == 1
+        assert after["misses"] - before["misses"] == 1
+        assert first[0]["type"] == second[0]["type"] == "bar"
+        assert first[0]["data"][0]["sales"] == 100
+        assert second[0]["data"][0]["sales"] == 300
+    
+    def test_cardinality_splits_cache_entries(self):
+        """Should not reuse a pie picked for a few categories on a long result."""
+        from unittest.mock import Mock, patch
+        from src.core import ai_chart_selector
+        
+        llm = Mock()
+        llm.generate_content.side_effect = [
+            ('{"chart_type": "pie", "reasoning": "share", "x_column": "region", '
+             '"y_columns": ["sales"], "title": "Sales share"}', "groq"),
+            ('{"chart_type": "bar", "reasoning": "many categories", "x_column": "region", '
+             '"y_columns": ["sales"], "title": "Sales by region"}', "groq"),
+        ]
+        columns = ["region", "sales", "units"]
+        few_rows = [["North", 100, 1], ["South", 200, 2], ["East", 150, 3]]
+        many_rows = [[f"Region {i}", i * 10, i] for i in range(15)]  # Still categorical
+        
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        with patch.object(ai_chart_selector, "_get_client", return_value=llm):
+            few = detect_charts_from_results(columns, few_rows, question="Sales by region")
+            many = detect_charts_from_results(columns, many_rows, question="Sales by region")
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        
+        assert llm.generate_content.call_count == 2
+        assert few[0]["type"] == "pie"
+        assert many[0]["type"] == "bar"
+    
+    def test_batch_selection_uses_one_llm_call(self):
+        """Should ask for all uncached result shapes in a single prompt."""
+        from unittest.mock import Mock, patch
+        from src.core import ai_chart_selector
+        
+        llm = Mock()
+        llm.generate_content.return_value = (
+            '[{"chart_type": "bar", "reasoning": "compare", "x_column": "region", '
+            '"y_columns": ["sales"], "title": "Sales by region"}, '
+            '{"chart_type": "none", "reasoning": "single value", "x_column": "", '
+            '"y_columns": [], "title": ""}]',
+            "groq"
+        )
+        
+        def query(columns, rows, question):
+            detector = ChartDetector(columns, rows, question)
+            return {"columns": columns, "rows": rows,
+                    "column_metadata": detector.column_metadata, "question": question}
+        
+        queries = [
+            query(["region", "sales", "units"], [["North", 100, 1], ["South", 200, 2]], "Sales by region"),
+            query(["total"], [[42]], "How many orders?"),  # Single row: decided by rules
+            query(["region", "sales", "units"], [["East", 5, 1], ["West", 7, 2]], "sales by region"),
+            query(["name", "email"], [["Ann", "a@x.io"], ["Bo", "b@x.io"]], "List customers"),
+        ]
+        
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        with patch.object(ai_chart_selector, "_get_client", return_value=llm):
+            charts = ai_chart_selector.AIChartSelector().select_charts_batch(queries)
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        
+        llm.generate_content.assert_called_once()
+        prompt = llm.generate_content.call_args.args[0]
+        assert "### Query 2" in prompt and "### Query 3" not in prompt
+        assert "How many orders?" not in prompt
+        assert charts[0].type == charts[2].type == "bar"
+        assert charts[1] is None and charts[3] is None
+        assert charts[2].data[0]["sales"] == 5
+    
+    def test_detect_charts_batch_falls_back_per_result(self):
+        """Should make one LLM call for all results and use heuristics where AI gives no chart."""
+        from unittest.mock import Mock, patch
+        from src.core import ai_chart_selector
+        
+        llm = Mock()
+        llm.generate_content.return_value = (
+            '[{"chart_type": "bar", "reasoning": "compare", "x_column": "region", '
+            '"y_columns": ["sales"], "title": "Sales by region"}, '
+            '{"chart_type": "none", "reasoning": "no chart", "x_column": "", '
+            '"y_columns": [], "title": ""}]',
+            "groq"
+        )
+        results = [
+            {"columns": ["region", "sales", "units"], "rows": [["North", 100, 1], ["South", 200, 2]],
+             "question": "Sales by region"},
+            {"columns": ["month", "revenue", "cost"],
+             "rows": [["2025-01-01", 10, 4], ["2025-02-01", 15, 6], ["2025-03-01", 12, 5]],
+             "question": "Revenue and cost by month"},
+        ]
+        
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        with patch.object(ai_chart_selector, "_get_client", return_value=llm):
+            charts = detect_charts_batch(results, currency_symbol="$")
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        
+        llm.generate_content.assert_called_once()
+        assert "### Query 2" in llm.generate_content.call_args.args[0]
+        assert len(charts) == 2
+        assert charts[0][0]["type"] == "bar" and charts[0][0]["currency_symbol"] == "$"
+        assert charts[1] and charts[1][0]["x_column"] == "month"
+    
+    def test_parallel_selection_bounds_concurrency(self):
+        """Should overlap LLM calls, up to max_concurrency, keeping query order."""
+        import asyncio
+        import threading
+        import time
+        from unittest.mock import Mock, patch
+        from src.core import ai_chart_selector
+        
+        lock = threading.Lock()
+        in_flight = {"now": 0, "max": 0}
+        
+        def generate_content(prompt, system_message=None, json_mode=False):
+            with lock:
+                in_flight["now"] += 1
+                in_flight["max"] = max(in_flight["max"], in_flight["now"])
+            time.sleep(0.05)
+            with lock:
+                in_flight["now"] -= 1
+            column = "sales" if "sales" in prompt else "units"
+            return (
+                f'{{"chart_type": "bar", "reasoning": "compare", "x_column": "region", '
+                f'"y_columns": ["{column}"], "title": "{column}"}}',
+                "groq"
+            )
+        
+        llm = Mock()
+        llm.generate_content.side_effect = generate_content
+        queries = []
+        for i, metric in enumerate(["sales", "units", "sales", "units"]):
+            columns = ["region", metric, "margin"]
+            rows = [["North", 1, 0.1], ["South", 2, 0.2]]
+            queries.append({
+                "columns": columns,
+                "rows": rows,
+                "column_metadata": ChartDetector(columns, rows).column_metadata,
+                "question": f"{metric} by region {i}"
+            })
+        
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        with patch.object(ai_chart_selector, "_get_client", return_value=llm):
+            selector = ai_chart_selector.AIChartSelector()
+            charts = asyncio.run(selector.select_charts_parallel(queries, max_concurrency=2))
+        ai_chart_selector._RECOMMENDATION_CACHE.clear()
+        
+        assert llm.generate_content.call_count == 4
+        assert in_flight["max"] == 2
+        assert [chart.y_columns[0] for chart in charts] == ["sales", "units", "sales", "units"]
+    
+    def test_rules_decide_obvious_shapes(self):
+        """Should chart single-series shapes without calling the LLM."""
+        from unittest.mock import Mock, patch
+        from src.core import ai_chart_selector
+        
+        llm = Mock()
+        with patch.object(ai_chart_selector, "_get_client", return_value=llm):
+            selector = ai_chart_selector.AIChartSelector()
+            
+            def select(columns, rows):
+                metadata = ChartDetector(columns, rows).column_metadata
+                return selector.select_chart(columns, rows, metadata)
+            
+            single = select(["total"], [[42]])
+            trend = select(["month", "revenue"], [["2024-01-01", 10], ["2024-02-01", 12]])
+            bars = select(["region", "sales"], [["North", 100], ["South", 200], ["East", 150]])
+        
+        llm.generate_content.assert_not_called()
+        assert single is None
+        assert trend.type == "line" and trend.x_column == "month"
+        assert bars.type == "bar" and bars.y_columns == ["sales"]
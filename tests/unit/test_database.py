@@ -133,6 +133,14 @@ class TestDatabaseManager:
         results = db.execute_query("SELECT SUM(amount) as total FROM orders")
         assert results[0]['total'] == 324.49  # 99.99 + 149.50 + 75.00
     
+    def test_execute_query_max_rows(self, db_path):
+        """Test execute_query stops reading at max_rows"""
+        db = DatabaseManager(db_path=db_path)
+        
+        results = db.execute_query("SELECT * FROM orders ORDER BY id", max_rows=2)
+        assert [r['id'] for r in results] == [1, 2]
+        assert len(db.execute_query("SELECT * FROM orders", max_rows=10)) == 3
+    
     def test_execute_query_invalid_sql(self, db_path):
         """Test execute_query with invalid SQL"""
         db = DatabaseManager(db_path=db_path)
@@ -153,7 +161,53 @@ class TestDatabaseManager:
         
         orders_schema = next(t for t in schema if t['name'] == 'orders')
         assert orders_schema['row_count'] == 3
-    
+
+    def test_count_rows(self, db_path):
+        """Test count_rows counts several tables in one query"""
+        conn = sqlite3.connect(str(db_path))
+        conn.execute('CREATE TABLE "odd ""name""" (id INTEGER)')
+        try:
+            counts = DatabaseManager.count_rows(conn, ['users', 'orders', 'odd "name"'])
+        finally:
+            conn.close()
+
+        assert counts == {'users': 2, 'orders': 3, 'odd "name"': 0}
+
+    def test_get_row_counts(self, db_path):
+        """Test get_row_counts matches get_row_count per table"""
+        db = DatabaseManager(db_path=db_path)
+        
+        assert db.get_row_counts(['users', 'orders']) == {
+            'users': db.get_row_count('users'),
+            'orders': db.get_row_count('orders')
+        }
+
+    def test_estimate_rows(self, db_path):
+        """Test estimate_rows reads ANALYZE statistics, counting unanalyzed tables"""
+        conn = sqlite3.connect(str(db_path))
+        try:
+            # Never analyzed: falls back to exact counts
+            assert DatabaseManager.estimate_rows(conn, ['users', 'orders']) == {'users': 2, 'orders': 3}
+
+            conn.execute("ANALYZE")
+            conn.execute("INSERT INTO users VALUES (3, 'Carol', 'carol@test.com', 41)")
+            conn.execute("CREATE TABLE notes (id INTEGER)")
+            conn.execute("INSERT INTO notes VALUES (1)")
+            counts = DatabaseManager.estimate_rows(conn, ['users', 'orders', 'notes'])
+        finally:
+            conn.close()
+
+        # users still reports the analyzed count; notes has no statistics yet
+        assert counts == {'users': 2, 'orders': 3, 'notes': 1}
+
+    def test_count_tables(self, db_path):
+        """Test count_tables matches the tables get_tables lists"""
+        conn = sqlite3.connect(str(db_path))
+        try:
+            assert DatabaseManager.count_tables(conn) == 2
+        finally:
+            conn.close()
+
     def test_get_schema_summary(self, db_path):
         """Test get_schema_summary method"""
         db = DatabaseManager(db_path=db_path)
@@ -0,0 +1,130 @@
+"""
+Unit Tests for SQLite Connection Pool
+Tests connection reuse, sizing limits, and async acquisition
+"""
+
+import asyncio
+import queue
+import sqlite3
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core import db_pool
+from src.core.db_pool import ConnectionPool
+
+
+class TestConnectionPool:
+    """Test ConnectionPool behaviour"""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """Create a temporary test database"""
+        db_file = tmp_path / "pool.db"
+        conn = sqlite3.connect(str(db_file))
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+        conn.execute("INSERT INTO items VALUES (1, 'widget')")
+        conn.commit()
+        conn.close()
+        return str(db_file)
+
+    def test_prefill_opens_min_size(self, db_path):
+        """Test prefill opens min_size connections"""
+        pool = ConnectionPool(db_path, min_size=3, max_size=5)
+        pool.prefill()
+
+        assert pool.size == 3
+        pool.close()
+
+    def test_connection_is_reused(self, db_path):
+        """Test released connections are handed out again"""
+        pool = ConnectionPool(db_path, min_size=1, max_size=2)
+
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            assert second is first
+
+        assert pool.size == 1
+        pool.close()
+
+    def test_max_size_enforced(self, db_path):
+        """Test pool never opens more than max_size connections"""
+        pool = ConnectionPool(db_path, min_size=0, max_size=2, timeout=0.01)
+
+        conn1 = pool.get()
+        conn2 = pool.get()
+        with pytest.raises(queue.Empty):
+            pool.get(block=False)
+        with pytest.raises(queue.Empty):
+            pool.get()
+
+        pool.release(conn1)
+        assert pool.get() is conn1
+
+        pool.release(conn1)
+        pool.release(conn2)
+        pool.close()
+
+    def test_release_rolls_back_open_transaction(self, db_path):
+        """Test uncommitted writes are discarded on release"""
+        pool = ConnectionPool(db_path, min_size=0, max_size=1, read_only=False)
+
+        with pool.connection() as conn:
+            conn.execute("INSERT INTO items VALUES (2, 'gadget')")
+        with pool.connection() as conn:
+            count = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+
+        assert count == 1
+        pool.close()
+
+    def test_read_only_rejects_writes(self, db_path):
+        """Test default pools open connections read-only"""
+        pool = ConnectionPool(db_path, min_size=0, max_size=1)
+
+        with pool.connection() as conn:
+            with pytest.raises(sqlite3.OperationalError, match="readonly"):
+                conn.execute("INSERT INTO items VALUES (2, 'gadget')")
+            assert conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 1
+
+        pool.close()
+
+    def test_read_only_does_not_create_missing_file(self, tmp_path):
+        """Test a read-only pool never creates an empty database file"""
+        missing = tmp_path / "missing.db"
+        pool = ConnectionPool(str(missing), min_size=0, max_size=1)
+
+        with pytest.raises(sqlite3.OperationalError):
+            pool.get()
+
+        assert not missing.exists()
+        assert pool.size == 0
+        pool.close()
+
+    def test_async_acquire(self, db_path):
+        """Test acquire() yields a usable shared connection"""
+        async def read_name():
+            async with db_pool.acquire(db_path) as conn:
+                return conn.execute("SELECT name FROM items").fetchone()['name']
+
+        try:
+            assert asyncio.run(read_name()) == 'widget'
+            assert db_pool.get_pool(db_path).size == 1
+        finally:
+            db_pool.close_pool(db_path)
+
+    def test_database_manager_borrows_from_pool(self, db_path):
+        """Test DatabaseManager queries reuse pooled connections"""
+        from src.core.database import DatabaseManager
+
+        pool = ConnectionPool(db_path, min_size=0, max_size=1)
+        db = DatabaseManager(db_path=Path(db_path), pool=pool)
+
+        assert db.execute_query("SELECT name FROM items") == [{'name': 'widget'}]
+        assert db.get_row_count('items') == 1
+        assert pool.size == 1
+        pool.close()
@@ -0,0 +1,52 @@
+"""
+Unit Tests for LLM Response JSON Extraction
+Tests balanced-span scanning and near-JSON repairs
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# Add project root to path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.json_extract import extract_json, parse_json
+
+
+class TestExtractJson:
+    """Test extract_json span scanning"""
+
+    def test_first_object_among_prose(self):
+        """Test prose and a second object around the first one are ignored"""
+        text = 'Here you go: {"a": {"b": 1}} and also {"c": 2}'
+        assert extract_json(text) == '{"a": {"b": 1}}'
+
+    def test_brackets_inside_strings(self):
+        """Test braces and escaped quotes inside strings don't end the span"""
+        text = '{"title": "Sales {by} \\"region\\"", "y": ["}"]} trailing }'
+        assert extract_json(text) == '{"title": "Sales {by} \\"region\\"", "y": ["}"]}'
+
+    def test_array_and_missing(self):
+        """Test arrays are found by opener and unbalanced text returns None"""
+        assert extract_json('```json\n[{"a": 1}, {"b": [2]}]\n```', opener='[') == '[{"a": 1}, {"b": [2]}]'
+        assert extract_json('{"a": 1') is None
+        assert extract_json('no json here') is None
+
+
+class TestParseJson:
+    """Test parse_json strict and repaired parsing"""
+
+    def test_fenced_response(self):
+        """Test markdown fences around valid JSON"""
+        assert parse_json('```json\n{"chart_type": "bar"}\n```') == {"chart_type": "bar"}
+
+    def test_repairs(self):
+        """Test smart quotes, trailing commas and Python literals are repaired"""
+        text = '{“ok”: True, "items": [1, 2,], "none": None,}'
+        assert parse_json(text) == {"ok": True, "items": [1, 2], "none": None}
+
+    def test_no_json(self):
+        """Test a response without JSON raises ValueError"""
+        with pytest.raises(ValueError):
+            parse_json("I cannot recommend a chart.")
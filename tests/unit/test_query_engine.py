@@ -51,6 +51,22 @@ class TestQueryEngine:
         assert engine is not None
         assert engine.db_manager is not None
     
+    def test_failed_sql_not_cached(self, test_db):
+        """Test SQL that fails to execute is regenerated on the next ask"""
+        engine = QueryEngine(db_path=str(test_db))
+        
+        with patch.object(engine.llm_client, 'generate_content', side_effect=[
+            ("SELECT COUNT(*) FROM product", "groq"),
+            ("SELECT COUNT(*) FROM products", "groq"),
+        ]) as generate_content:
+            first = engine.ask("How many products are there?")
+            second = engine.ask("How many products are there?")
+        
+        assert first['success'] is False
+        assert second['success'] is True
+        assert second['sql'] == "SELECT COUNT(*) FROM products"
+        assert generate_content.call_count == 2
+    
     def test_clean_sql_basic(self, test_db):
         """Test SQL cleaning"""
         engine = QueryEngine(db_path=str(test_db))
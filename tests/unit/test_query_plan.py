@@ -226,6 +226,24 @@ class TestExecutionOrder:
         # q2 and q3 can be in any order
         assert set(order_ids[1:3]) == {"q2", "q3"}
     
+    def test_execution_levels_diamond(self):
+        """Test independent queries share a level (q1 -> q2, q3 -> q4)"""
+        plan = QueryPlan(
+            queries=[
+                QueryStep(id="q4", description="Merge", sql="SELECT 4", depends_on=["q2", "q3"]),
+                QueryStep(id="q1", description="Root", sql="SELECT 1", depends_on=[]),
+                QueryStep(id="q2", description="Branch A", sql="SELECT 2", depends_on=["q1"]),
+                QueryStep(id="q3", description="Branch B", sql="SELECT 3", depends_on=["q1"])
+            ],
+            final_query_id="q4"
+        )
+        
+        levels = [[q.id for q in level] for level in plan.get_execution_levels()]
+        
+        assert levels[0] == ["q1"]
+        assert set(levels[1]) == {"q2", "q3"}
+        assert levels[2] == ["q4"]
+    
     def test_no_dependencies(self):
         """Test plan with all independent queries"""
         plan = QueryPlan(
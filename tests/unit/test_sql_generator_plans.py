@@ -304,6 +304,57 @@ class TestGenerateQueryPlan:
         # Verify LLM was called
         mock_llm_client.generate_content.assert_called_once()
     
+    def test_generate_plan_cached_for_repeat_question(self, sql_generator, mock_llm_client):
+        """Test repeated questions reuse the cached plan"""
+        mock_llm_client.generate_content.return_value = ("""
+        {
+            "queries": [
+                {"id": "q1", "description": "Count", "sql": "SELECT COUNT(*) FROM sales", "depends_on": []}
+            ],
+            "final_query_id": "q1"
+        }
+        """, "groq")
+        
+        first = sql_generator.generate_query_plan("Compare sales vs last year")
+        second = sql_generator.generate_query_plan("  compare SALES vs last year ")
+        
+        mock_llm_client.generate_content.assert_called_once()
+        assert second is not first
+        assert second.queries[0].sql == first.queries[0].sql
+        assert second.question == "  compare SALES vs last year "
+    
+    def test_generate_sql_cached_for_repeat_question(self, sql_generator, mock_llm_client):
+        """Test repeated questions reuse the cached SQL"""
+        mock_llm_client.generate_content.return_value = ("SELECT COUNT(*) FROM employees", "groq")
+        
+        assert sql_generator.generate("How many employees?") == "SELECT COUNT(*) FROM employees"
+        assert sql_generator.generate("how many employees?") == "SELECT COUNT(*) FROM employees"
+        
+        mock_llm_client.generate_content.assert_called_once()
+    
+    def test_forget_sql_regenerates_failed_sql(self, sql_generator, mock_llm_client):
+        """Test SQL forgotten after a failed execution is not served from cache"""
+        mock_llm_client.generate_content.side_effect = [
+            ("SELECT COUNT(*) FROM employes", "groq"),
+            ("SELECT COUNT(*) FROM employees", "groq"),
+        ]
+        
+        assert sql_generator.generate("How many employees?") == "SELECT COUNT(*) FROM employes"
+        sql_generator.forget_sql("how many  employees?")
+        assert sql_generator.generate("How many employees?") == "SELECT COUNT(*) FROM employees"
+        
+        assert mock_llm_client.generate_content.call_count == 2
+    
+    def test_clear_cache_regenerates_sql(self, sql_generator, mock_llm_client):
+        """Test clear_cache sends the next repeat question to the LLM"""
+        mock_llm_client.generate_content.return_value = ("SELECT COUNT(*) FROM employees", "groq")
+        
+        sql_generator.generate("How many employees?")
+        sql_generator.clear_cache()
+        sql_generator.generate("How many employees?")
+        
+        assert mock_llm_client.generate_content.call_count == 2
+    
     def test_generate_plan_empty_question(self, sql_generator):
         """Test that empty question raises error"""
         with pytest.raises(QueryError, match="cannot be empty"):
@@ -355,3 +406,9 @@ class TestCreatePlanPrompt:
         
         assert "depends_on" in prompt
         assert "FROM q1" in prompt or "FROM q2" in prompt
+    
+    def test_prompt_prefers_group_by_for_group_comparisons(self, sql_generator):
+        """Test that prompt asks for one GROUP BY step instead of one step per group"""
+        prompt = sql_generator._create_plan_prompt("Compare IT vs Sales departments")
+        
+        assert "GROUP BY" in prompt